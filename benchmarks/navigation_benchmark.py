@@ -0,0 +1,102 @@
+"""
+Navigation benchmark: latency of switching between screens in MainWindow.
+
+Logs a throwaway user in (offscreen Qt platform, temporary data dir), then
+cycles dashboard -> quiz -> dashboard -> level test -> dashboard and times each
+navigation including the event processing (restyle, layout, paint) it causes.
+The LLM calls started by navigation are disabled, so only UI cost is measured.
+
+"cached" is the current StyleManager; "legacy" re-applies the palette and the
+whole QSS on every navigation, as apply_theme used to. "switch" times a real
+light <-> dark change, which restyles every widget in both modes.
+
+    python benchmarks/navigation_benchmark.py [--cycles 50]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent / "language_learning_mentor"
+
+
+def _legacy_apply_theme(style_manager):
+    from PySide6.QtWidgets import QApplication
+
+    def apply_theme(theme_preference):
+        app = QApplication.instance()
+        app.setPalette(style_manager.get_palette(theme_preference))
+        app.setStyleSheet(style_manager._common_qss)
+    return apply_theme
+
+
+def measure(app, window, cycles):
+    steps = [window.show_dashboard_screen, window._show_quiz_screen,
+             window.show_dashboard_screen, window._show_level_detection_screen]
+    timings = []
+    for _ in range(cycles):
+        for step in steps:
+            start = time.perf_counter()
+            step()
+            app.processEvents()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def measure_switch(app, window, cycles):
+    timings = []
+    for i in range(cycles):
+        start = time.perf_counter()
+        window.style_manager.apply_theme("dark" if i % 2 == 0 else "light")
+        app.processEvents()
+        timings.append(time.perf_counter() - start)
+    window.style_manager.apply_theme("light")
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ["MENTOR_DATA_DIR"] = tempfile.mkdtemp(prefix="nav-bench-")
+    sys.path.insert(0, str(APP_DIR))
+
+    from PySide6.QtWidgets import QApplication
+    app = QApplication([])
+    from gui.main_window import MainWindow
+
+    window = MainWindow()
+    window.show()
+    controller = window.controller
+    # Only the UI is measured: no quiz / tip / level test generation
+    controller.start_quiz = lambda: None
+    controller.start_level_detection = lambda: None
+    controller.request_daily_tip = lambda: None
+    controller.status_message.disconnect(window._display_status_message)
+    controller.register_user("bench-user", "bench@example.com")
+    controller.process_language_selection("Italian")
+    app.processEvents()
+
+    results = {}
+    for mode in ("cached", "legacy"):
+        if mode == "legacy":
+            window.style_manager.apply_theme = _legacy_apply_theme(window.style_manager)
+        measure(app, window, 2)  # warm-up: every screen built and polished
+        results[mode] = measure(app, window, args.cycles)
+        if mode == "cached":
+            results["switch"] = measure_switch(app, window, args.cycles)
+
+    for mode, timings in results.items():
+        ms = sorted(t * 1e3 for t in timings)
+        print(f"{mode:>7}: median {statistics.median(ms):7.2f} ms   "
+              f"p95 {ms[int(len(ms) * 0.95) - 1]:7.2f} ms   "
+              f"max {ms[-1]:7.2f} ms   ({len(ms)} {'theme switches' if mode == 'switch' else 'navigations'})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Time-to-quiz benchmark: from the dashboard's quiz request to the first question
+on screen, then through a whole quiz, in MainWindow (offscreen Qt platform,
+temporary data dir).
+
+Quiz generation is replaced by a fixed quiz returned after --llm-latency
+seconds, so only the UI path around it is measured. "toast" is the current
+NotificationCenter; "modal" shows every status message in a modal QMessageBox,
+as _display_status_message used to, and per-answer result dialogs as QuizScreen
+used to. Each dialog is accepted after --click-delay ms (the user's click).
+
+    python benchmarks/quiz_benchmark.py [--runs 20] [--llm-latency 0.2] [--click-delay 300]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent / "language_learning_mentor"
+
+QUIZ = [{"question": f"Frase numero {i} con una ____ mancante.", "answer": "parola",
+         "options": ["parola", "casa", "mare", "sole"]} for i in range(5)]
+
+
+def _modal(click_delay_ms):
+    """QMessageBox.information that the 'user' accepts after click_delay_ms."""
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QMessageBox
+
+    def show(parent, title, text):
+        box = QMessageBox(QMessageBox.Information, title, text, QMessageBox.Ok, parent)
+        QTimer.singleShot(click_delay_ms, box.accept)
+        box.exec()
+    return show
+
+
+def _use_modal_dialogs(window, click_delay_ms):
+    show = _modal(click_delay_ms)
+    window.controller.status_message.disconnect(window._display_status_message)
+    window.controller.status_message.connect(lambda message: show(window, "Status", message))
+    screen = window.quiz_screen
+    view = screen.question_view
+    original = view.show_feedback
+
+    def feedback(text, ok=True):
+        original(text, ok)
+        show(screen, "Risultato", text)  # one dialog per answer
+    view.show_feedback = feedback
+
+
+def _stub_generation(latency):
+    def prepare_quiz_data(*args, **kwargs):
+        time.sleep(latency)
+        return [dict(q) for q in QUIZ]
+    return prepare_quiz_data
+
+
+def wait_until(app, condition, timeout=30.0):
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            raise RuntimeError("timed out waiting for the quiz")
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def run(app, window, runs):
+    """[(seconds to the first question, seconds to answer the whole quiz)]."""
+    view = window.quiz_screen.question_view
+    results = []
+    for _ in range(runs):
+        window.show_dashboard_screen()
+        app.processEvents()
+        start = time.perf_counter()
+        window._show_quiz_screen()
+        wait_until(app, lambda: view.number_label.isVisible())
+        shown = time.perf_counter()
+        for _ in QUIZ:
+            view.option_buttons[0].setChecked(True)
+            view.next_clicked.emit()
+            app.processEvents()
+        results.append((shown - start, time.perf_counter() - shown))
+        wait_until(app, lambda: not window.controller.is_preparing("quiz"))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--llm-latency", type=float, default=0.2,
+                        help="Seconds the stubbed quiz generation takes.")
+    parser.add_argument("--click-delay", type=int, default=300,
+                        help="Milliseconds before each modal dialog is dismissed.")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ["MENTOR_DATA_DIR"] = tempfile.mkdtemp(prefix="quiz-bench-")
+    sys.path.insert(0, str(APP_DIR))
+
+    from PySide6.QtWidgets import QApplication
+    app = QApplication([])
+    from gui.main_window import MainWindow
+
+    results = {}
+    for mode in ("toast", "modal"):
+        window = MainWindow()
+        window.show()
+        controller = window.controller
+        controller.request_daily_tip = lambda: None
+        controller.lang_processor.prepare_quiz_data = _stub_generation(args.llm_latency)
+        controller.register_user(f"bench-{mode}", "bench@example.com")
+        controller.process_language_selection("Italian")
+        app.processEvents()
+        if mode == "modal":
+            _use_modal_dialogs(window, args.click_delay)
+        results[mode] = run(app, window, args.runs)
+        window.close()
+
+    for mode, timings in results.items():
+        to_quiz = sorted(t * 1e3 for t, _ in timings)
+        answering = sorted(a * 1e3 for _, a in timings)
+        print(f"{mode:>5}: time to quiz median {statistics.median(to_quiz):7.1f} ms   "
+              f"p95 {to_quiz[int(len(to_quiz) * 0.95) - 1]:7.1f} ms   "
+              f"answering {len(QUIZ)} questions median {statistics.median(answering):7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Startup benchmark: time from interpreter start to the login window being painted.
+
+Each run is a fresh subprocess (offscreen Qt platform, so it also works in CI).
+"lazy" is the normal startup; "screens" additionally builds every screen before
+showing the window, as MainWindow did before screens were built on first
+navigation; "eager" warms the LLM stack instead, which is what startup used to
+cost when crewai/langchain were imported at module load. Each mode also reports
+the child's resident memory once the window is painted (Linux only).
+
+    python benchmarks/startup_benchmark.py [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent / "language_learning_mentor"
+
+CHILD = r"""
+import os, sys, time
+t0 = time.perf_counter()
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QTimer
+app = QApplication(sys.argv)
+from gui.main_window import MainWindow
+window = MainWindow()
+if {screens}:
+    for name in window._screen_builders:
+        window._screen(name)
+if {eager}:
+    window.controller.lang_processor.warm_up()
+window.show()
+
+def painted():
+    print(f"STARTUP_SECONDS={{time.perf_counter() - t0:.4f}}", flush=True)
+    try:
+        with open("/proc/self/statm") as f:
+            print(f"RSS_BYTES={{int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')}}", flush=True)
+    except OSError:
+        pass
+    app.quit()
+
+QTimer.singleShot(0, painted)
+app.exec()
+"""
+
+
+MODES = {"lazy": dict(screens=False, eager=False),
+         "screens": dict(screens=True, eager=False),
+         "eager": dict(screens=False, eager=True)}
+
+
+def run_once(screens, eager):
+    """(seconds to the painted login window, resident MiB or None)."""
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    # Measured inside the child from its first statement, so interpreter start-up
+    # (identical in every mode) is excluded
+    out = subprocess.run([sys.executable, "-c", CHILD.format(screens=screens, eager=eager)],
+                         cwd=APP_DIR, env=env, capture_output=True, text=True, check=True).stdout
+    values = dict(line.split("=", 1) for line in out.splitlines() if "=" in line)
+    if "STARTUP_SECONDS" not in values:
+        raise RuntimeError(f"Child did not report a startup time:\n{out}")
+    rss = values.get("RSS_BYTES")
+    return float(values["STARTUP_SECONDS"]), int(rss) / 2 ** 20 if rss else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    results, memory = {}, {}
+    for mode, flags in MODES.items():
+        times, rss = zip(*(run_once(**flags) for _ in range(args.runs)))
+        results[mode] = statistics.median(times)
+        memory[mode] = statistics.median(rss) if None not in rss else None
+        mib = f"  rss {memory[mode]:.1f} MiB" if memory[mode] is not None else ""
+        print(f"{mode:>7}: median {results[mode]:.3f}s  min {min(times):.3f}s  max {max(times):.3f}s{mib}")
+    print(f"time to login window: {results['lazy'] / results['eager']:.0%} of eager startup, "
+          f"{(results['screens'] - results['lazy']) * 1e3:+.0f} ms saved by building screens on demand")
+    if memory["lazy"] is not None:
+        print(f"memory saved by building screens on demand: {memory['screens'] - memory['lazy']:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Headless command line entry point: tip / quiz / level test generation and load runs.
+
+Uses the same LanguageProcessor stack as the app (through a ProcessorPool) but
+never imports PySide6, so it runs in CI and on servers. Results and timing stats
+are printed as JSON on stdout; the agents' console output goes to stderr.
+Generated questions are kept in a temporary quiz queue, not the app's one.
+
+Run from the repository root (or from language_learning_mentor with -m cli):
+    python -m language_learning_mentor.cli tip  --language Italian --level Beginner
+    python -m language_learning_mentor.cli quiz --language Italian --level Beginner -n 5 \\
+        --repeat 100 --concurrency 8 --output quizzes.json
+    python -m language_learning_mentor.cli quiz --language Italian --quizzes 3   # batch mode
+    python -m language_learning_mentor.cli level --language Spanish --level Intermediate
+"""
+import argparse
+import contextlib
+import json
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# The app's modules import each other as top-level packages (logic.*, crew, tools.*)
+APP_DIR = Path(__file__).resolve().parent
+if str(APP_DIR) not in sys.path:
+    sys.path.insert(0, str(APP_DIR))
+
+from logic.logging_setup import setup_logging
+from logic.metrics import REGISTRY
+from logic.processor_pool import ProcessorPool
+from logic.quiz_queue import QuizQueue
+from logic.user_session import SUPPORTED_LANGUAGES
+from logic.progress_analytics import LEVELS
+
+COMMANDS = ("tip", "quiz", "level")
+
+
+def _generate(proc, command, language, level, num_questions, num_quizzes=1):
+    if command == "tip":
+        return proc.generate_daily_tip(level, language)
+    if command == "quiz" and num_quizzes > 1:
+        return proc.prepare_quiz_batch(level, language, num_quizzes, num_questions)
+    if command == "quiz":
+        return proc.prepare_quiz_data(level, language, num_questions)
+    return proc.prepare_detect_quiz(level, language)
+
+
+def _run_once(pool, index, args):
+    start = time.perf_counter()
+    try:
+        with pool.processor(timeout=None) as proc:
+            result = _generate(proc, args.command, args.language, args.level, args.num_questions,
+                               args.quizzes)
+        # The processor swallows agent failures and returns an empty list / string
+        error = None if result else "empty result"
+    except Exception as e:
+        result, error = None, f"{type(e).__name__}: {e}"
+    run = {"run": index, "seconds": round(time.perf_counter() - start, 4), "ok": error is None}
+    if error:
+        run["error"] = error
+    elif not args.no_results:
+        run["result"] = result
+    return run
+
+
+def latency_stats(seconds):
+    """Summary of a list of latencies (seconds)."""
+    if not seconds:
+        return {}
+    ordered = sorted(seconds)
+
+    def pct(q):
+        return round(ordered[min(len(ordered) - 1, int(q / 100.0 * len(ordered)))], 4)
+
+    return {
+        "min": round(ordered[0], 4),
+        "mean": round(statistics.fmean(ordered), 4),
+        "p50": pct(50),
+        "p90": pct(90),
+        "p95": pct(95),
+        "p99": pct(99),
+        "max": round(ordered[-1], 4),
+    }
+
+
+@contextlib.contextmanager
+def _scratch_queue():
+    """
+    Throwaway quiz queue for a run: CLI generations have no user, and their
+    questions must not become the fallback served to the app's users.
+    """
+    with tempfile.TemporaryDirectory(prefix="mentor-cli-", ignore_cleanup_errors=True) as tmp:
+        yield QuizQueue(Path(tmp) / "quiz_queue.sqlite3")
+
+
+def run(args):
+    with _scratch_queue() as quiz_queue:
+        return _run_pool(ProcessorPool(size=args.concurrency, quiz_queue=quiz_queue), args)
+
+
+def _run_pool(pool, args):
+    warm_up_s = None
+    if not args.no_warm_up:
+        # Import the LLM stack once up front so it doesn't skew the first runs
+        start = time.perf_counter()
+        with pool.processor() as proc:
+            proc.warm_up()
+        warm_up_s = round(time.perf_counter() - start, 4)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        runs = list(executor.map(lambda i: _run_once(pool, i, args), range(args.repeat)))
+    wall = time.perf_counter() - start
+
+    ok = [r["seconds"] for r in runs if r["ok"]]
+    return {
+        "command": args.command,
+        "language": args.language,
+        "level": args.level,
+        "num_questions": args.num_questions if args.command == "quiz" else None,
+        "quizzes_per_call": args.quizzes if args.command == "quiz" else None,
+        "repeat": args.repeat,
+        "concurrency": args.concurrency,
+        "runs": runs,
+        "stats": {
+            "ok": len(ok),
+            "errors": len(runs) - len(ok),
+            "warm_up_seconds": warm_up_s,
+            "wall_seconds": round(wall, 4),
+            "throughput_per_second": round(len(runs) / wall, 4) if wall > 0 else None,
+            "latency_seconds": latency_stats(ok),
+        },
+        # Per agent/task latency histograms, tokens, retries and validation failures
+        "metrics": REGISTRY.snapshot()["metrics"],
+    }
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m language_learning_mentor.cli",
+        description="Generate tips, quizzes and level tests without the GUI.")
+    parser.add_argument("command", choices=COMMANDS)
+    parser.add_argument("--language", required=True, choices=SUPPORTED_LANGUAGES)
+    parser.add_argument("--level", default="Beginner", choices=LEVELS)
+    parser.add_argument("-n", "--num-questions", type=int, default=5,
+                        help="Questions per quiz (quiz only).")
+    parser.add_argument("--quizzes", type=int, default=1,
+                        help="Quizzes generated per LLM call, as the app's batch mode (quiz only).")
+    parser.add_argument("--repeat", type=int, default=1, help="Number of generations.")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Concurrent generations (size of the processor pool).")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+    parser.add_argument("--no-results", action="store_true",
+                        help="Only report timings, not the generated content.")
+    parser.add_argument("--no-warm-up", action="store_true",
+                        help="Include the LLM stack import in the first run's latency.")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.repeat < 1 or args.concurrency < 1 or args.num_questions < 1 or args.quizzes < 1:
+        build_parser().error("--repeat, --concurrency, --num-questions and --quizzes must be >= 1")
+    setup_logging()  # log records go to stderr, next to the agents' console output
+
+    # Crew/agent logging is printed to stdout: keep stdout for the JSON report only
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run(args)
+
+    data = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(data + "\n", encoding="utf-8")
+        print(json.dumps(report["stats"], indent=2), file=sys.stderr)
+    else:
+        print(data)
+    return 0 if report["stats"]["errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
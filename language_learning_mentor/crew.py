@@ -1,16 +1,21 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from tools.email_sender import EmailSender
-from tools.calculator import QuizCalculator
 from pathlib import Path
 from langchain_groq import ChatGroq
 import yaml
 from dotenv import load_dotenv
 import os
+import threading
+from logic.startup_profiler import PROFILER, profiled
+from logic.logging_setup import agents_verbose
+import logging
+
+logger = logging.getLogger(__name__)
 
 @CrewBase
 class LanguageMentor():
     """Language Learning Mentor Crew"""
+    @profiled()
     def __init__(self):
         load_dotenv()
         
@@ -22,9 +27,12 @@ class LanguageMentor():
         tasks_config_path = script_dir.parent / "language_learning_mentor" / "config" / "tasks.yaml"
         
         # Load YAML files
-        self.agents_config = yaml.safe_load(agents_config_path.read_text())
-        self.tasks_config = yaml.safe_load(tasks_config_path.read_text())
+        with PROFILER.section("LanguageMentor YAML loading"):
+            self.agents_config = yaml.safe_load(agents_config_path.read_text())
+            self.tasks_config = yaml.safe_load(tasks_config_path.read_text())
         self.task_templates = {}
+        self._fallback_agents = {}
+        self._fallback_lock = threading.Lock()
 
     def _make_groq_llm(
                 self,
@@ -104,8 +112,8 @@ class LanguageMentor():
             goal=cfg['goal'],
             backstory=cfg['backstory'],
             llm=llm,
-            tools=[],  # ⬅️  niente QuizCalculator: non serve
-            verbose=True
+            tools=[],  # ⬅️  nessun tool: non serve
+            verbose=agents_verbose()
         )
 
     @agent
@@ -154,7 +162,7 @@ class LanguageMentor():
                 backstory=cfg["backstory"],
                 llm=llm,
                 tools=[],  # nessun tool: basta il testo
-                verbose=True
+                verbose=agents_verbose()
     )
 
 
@@ -162,14 +170,21 @@ class LanguageMentor():
     @agent
     def quiz_agent(self) -> Agent:
         cfg = self.agents_config['quiz_agent']
-        llm = self._make_groq_llm(cfg)  # <- adesso va bene
+
+        # Una sola risposta strutturata: niente tool, niente ciclo Thought/Action.
+        # Punteggio ed email li calcola/invia il codice Python dopo il quiz.
+        # Lingua, livello e formato stanno nell'input_template di quiz_task
+        # (tasks.yaml): crewai ignora il system_message di ChatGroq.
+        llm = self._make_groq_llm(cfg, with_action_structure=False)
+
         return Agent(
             role=cfg['role'],
             goal=cfg['goal'],
             backstory=cfg['backstory'],
             llm=llm,
-            tools=[QuizCalculator(), EmailSender()],
-            verbose=True
+            tools=[],
+            max_iter=1,  # un solo giro: se l'output non è valido crewai forza subito la risposta finale
+            verbose=agents_verbose()
         )
 
     @task
@@ -208,18 +223,33 @@ class LanguageMentor():
         self.task_templates[t.description] = task_cfg.get('input_template')
         return t
 
+    def fallback_agent(self, name: str) -> Agent | None:
+        """
+        Copia dell'agente `name` sul fallback_model_name di agents.yaml
+        (None se non configurato). Usata quando l'utente ha finito il budget giornaliero.
+        """
+        model_name = self.agents_config[name].get("fallback_model_name")
+        if not model_name:
+            return None
+        with self._fallback_lock:
+            if name not in self._fallback_agents:
+                fallback = getattr(self, name)().copy()  # copy() gives it its own LLM object
+                fallback.llm.model = f"groq/{model_name}"
+                self._fallback_agents[name] = fallback
+            return self._fallback_agents[name]
+
     @crew
     def crew(self) -> Crew:
         return Crew(
             agents=self.agents,
             tasks=self.tasks,
             process=Process.sequential,
-            verbose=True
+            verbose=agents_verbose()
         )
 
     def get_crew_methods(self):
         """Debug method to check available methods on the Crew object"""
         crew = self.language_crew.crew()
         methods = [method for method in dir(crew) if not method.startswith('_')]
-        print(f"Available Crew methods: {methods}")
+        logger.debug("Available Crew methods: %s", methods)
         return methods
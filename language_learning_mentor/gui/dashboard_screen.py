@@ -1,3 +1,4 @@
+import logging
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QGroupBox, QSizePolicy, QSpacerItem, QTextEdit,
@@ -5,6 +6,9 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QFont
 # QObject import is not strictly necessary here as QWidget inherits it
 from PySide6.QtCore import Qt, Signal # , QObject
+from logic.startup_profiler import profiled
+
+logger = logging.getLogger(__name__)
 
 
 class DashboardScreen(QWidget):
@@ -21,6 +25,7 @@ class DashboardScreen(QWidget):
     daily_tip_requested = Signal()
     quiz_results_updated = Signal(int) 
 
+    @profiled()
     def __init__(self, parent=None):
         super().__init__(parent)
         self._setup_ui() # Build the UI elements
@@ -72,6 +77,22 @@ class DashboardScreen(QWidget):
 
         layout.addLayout(info_bar_layout)
 
+        # --- Progress Stats Bar ---
+        stats_bar_layout = QHBoxLayout()
+
+        self.streak_label = QLabel("Streak: 0 days")
+        stats_bar_layout.addWidget(self.streak_label)
+
+        self.accuracy_label = QLabel("Accuracy: -")
+        stats_bar_layout.addWidget(self.accuracy_label)
+
+        self.next_level_label = QLabel("")
+        stats_bar_layout.addWidget(self.next_level_label)
+
+        stats_bar_layout.addStretch()
+
+        layout.addLayout(stats_bar_layout)
+
         # --- Daily Tip Area ---
         tip_groupbox = QGroupBox("Daily Tip")
         tip_layout = QVBoxLayout(tip_groupbox)
@@ -109,7 +130,7 @@ class DashboardScreen(QWidget):
         Updates the labels on the dashboard using data from the state dictionary.
         This method is a slot connected to AppController.user_state_updated.
         """
-        print(f"DashboardScreen: Received state_dict to update UI: {state_dict}")
+        logger.debug("DashboardScreen: Received state_dict to update UI: %s", state_dict)
         # Extract data from the dictionary, providing defaults for safety
         username = state_dict.get('username', 'User')
         language = state_dict.get('language', 'N/A')
@@ -127,6 +148,26 @@ class DashboardScreen(QWidget):
         # self.quiz_button.setEnabled(is_language_set)
 
 
+    def update_progress_stats(self, stats):
+        """
+        Updates the progress stats row.
+        This method is a slot connected to AppController.progress_stats_updated.
+        """
+        current, longest = stats.get('current_streak', 0), stats.get('longest_streak', 0)
+        self.streak_label.setText(f"Streak: {current} days (best {longest})")
+
+        accuracy = stats.get('accuracy')
+        self.accuracy_label.setText(
+            f"Accuracy: {accuracy:.0%}" if accuracy is not None else "Accuracy: -")
+
+        next_level, days = stats.get('next_level'), stats.get('days_to_next_level')
+        if next_level and days is not None:
+            self.next_level_label.setText(f"{next_level} in ~{days:g} days")
+        elif next_level:
+            self.next_level_label.setText(f"Next: {next_level}")
+        else:
+            self.next_level_label.setText("")
+
     def display_tip(self, tip_text):
         """Sets the text of the daily tip textbox."""
         # This method's signature remains unchanged as it's connected to Signal(str)
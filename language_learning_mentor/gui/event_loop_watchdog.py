@@ -0,0 +1,158 @@
+# gui/event_loop_watchdog.py
+"""
+Opt-in watchdog for the GUI event loop (`main.py --watchdog`).
+
+A QTimer heartbeat on the main thread measures how late each tick fires
+(event-loop lag) into a fixed-bucket histogram. A monitor thread notices when
+the heartbeat stops for longer than the threshold and captures the main
+thread's Python stack right then (sys._current_frames), so a freeze is logged
+together with the code that caused it (a modal dialog, a blocking call...).
+The histogram and the stalls can be exported as JSON and compared between runs.
+"""
+import json
+import logging
+import sys
+import threading
+import time
+import traceback
+
+from PySide6.QtCore import QObject, QTimer, Qt
+
+# Upper bounds (ms) of the lag histogram buckets; the last bucket is open-ended
+LAG_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+MAX_STALLS_KEPT = 200
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of millisecond values."""
+
+    def __init__(self, bounds=LAG_BUCKETS_MS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value_ms):
+        i = 0
+        while i < len(self.bounds) and value_ms > self.bounds[i]:
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.total += value_ms
+        self.max = max(self.max, value_ms)
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th percentile (max for the open bucket)."""
+        if not self.count:
+            return 0.0
+        rank, seen = q / 100.0 * self.count, 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return float(self.bounds[i]) if i < len(self.bounds) else self.max
+        return self.max
+
+    def as_dict(self):
+        labels = [f"<={b}" for b in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            "buckets_ms": dict(zip(labels, self.counts)),
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max, 3),
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+        }
+
+
+class EventLoopWatchdog(QObject):
+    def __init__(self, threshold_ms=200, interval_ms=50, parent=None):
+        super().__init__(parent)
+        self.threshold_ms = threshold_ms
+        self.interval_ms = interval_ms
+        self.histogram = LatencyHistogram()
+        self.stalls = []            # {"at", "duration_ms", "stack"}
+        self._lock = threading.Lock()
+        self._main_ident = threading.get_ident()
+        self._last_beat = None
+        self._pending_stack = None  # captured by the monitor during the current stall
+        self._started_at = None
+        self._stop = threading.Event()
+        self._monitor = None
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._beat)
+
+    # ------------------------------------------------------------------ CONTROL
+    def start(self):
+        """Must be called from the GUI thread."""
+        self._main_ident = threading.get_ident()
+        self._started_at = time.time()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._timer.start()
+        self._monitor = threading.Thread(target=self._watch, name="event-loop-watchdog",
+                                         daemon=True)
+        self._monitor.start()
+        logger.info("Event-loop watchdog on (stall threshold %s ms)", self.threshold_ms)
+
+    def stop(self):
+        self._timer.stop()
+        self._stop.set()
+        if self._monitor is not None:
+            self._monitor.join(1.0)
+            self._monitor = None
+
+    # ------------------------------------------------------------------ MAIN THREAD
+    def _beat(self):
+        now = time.monotonic()
+        lag_ms = max(0.0, (now - self._last_beat) * 1000.0 - self.interval_ms)
+        self._last_beat = now
+        self.histogram.add(lag_ms)
+        with self._lock:
+            stack, self._pending_stack = self._pending_stack, None
+        if lag_ms >= self.threshold_ms:
+            self._record_stall(lag_ms, stack)
+
+    def _record_stall(self, lag_ms, stack):
+        stall = {"at": time.time() - lag_ms / 1000.0, "duration_ms": round(lag_ms, 1),
+                 "stack": stack}
+        if len(self.stalls) < MAX_STALLS_KEPT:
+            self.stalls.append(stall)
+        if stack:
+            logger.warning("UI stall: event loop blocked for %.0f ms. Main thread stack:\n%s",
+                           lag_ms, "".join(stack))
+        else:
+            logger.warning("UI stall: event loop blocked for %.0f ms", lag_ms)
+
+    # ------------------------------------------------------------------ MONITOR THREAD
+    def _watch(self):
+        poll = max(0.005, self.threshold_ms / 4000.0)
+        while not self._stop.wait(poll):
+            blocked_ms = (time.monotonic() - self._last_beat) * 1000.0 - self.interval_ms
+            if blocked_ms < self.threshold_ms:
+                continue
+            with self._lock:
+                if self._pending_stack is not None:
+                    continue  # already captured for this stall
+                frame = sys._current_frames().get(self._main_ident)
+                self._pending_stack = traceback.format_stack(frame) if frame else []
+
+    # ------------------------------------------------------------------ EXPORT
+    def as_dict(self):
+        return {
+            "started_at": self._started_at,
+            "interval_ms": self.interval_ms,
+            "threshold_ms": self.threshold_ms,
+            "lag": self.histogram.as_dict(),
+            "stalls": list(self.stalls),
+        }
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.as_dict(), f, indent=2)
@@ -1,22 +1,25 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QPushButton, QMessageBox, QButtonGroup,
+    QPushButton, QMessageBox,
     QSizePolicy, QSpacerItem, QProgressBar
 )
 from PySide6.QtCore import Signal
 from logic.app_controller import AppController
-import threading
+from logic.startup_profiler import profiled
+from gui.question_view import QuestionView
 
 class LevelDetectionScreen(QWidget):
     back_requested = Signal()     # Signal to return to dashboard
     level_test_completed = Signal(int)  # Signal emitted when test is completed, with score
     analyze_requested = Signal(str)  # Signal to request analysis of user's text
+    question_answered = Signal(str, str, bool)  # kind, question text, answered correctly
     
+    @profiled()
     def __init__(self, controller: AppController, parent=None):
         super().__init__(parent)
 
         self.controller = controller          # ← usa sempre questo
-        self.controller.level_test_data_ready.connect(self.start_test)
+        # level_test_data_ready -> start_test is wired by MainWindow (connecting it here too ran every question twice)
 
         self.questions        = []
         self.current          = 0
@@ -41,8 +44,13 @@ class LevelDetectionScreen(QWidget):
 
         self.main_layout.addLayout(header_layout)
 
-        self.question_layout = QVBoxLayout()
-        self.main_layout.addLayout(self.question_layout)
+        # Question widgets are reused for every question of the test
+        self.question_view = QuestionView(next_text="Next")
+        self.question_view.next_clicked.connect(self._on_next)
+        self.question_view.action_clicked.connect(self.back_requested.emit)
+        self.main_layout.addWidget(self.question_view)
+
+        self.results_widget = None  # built on the first analysis result
 
         # Barra livello
         self.level_label = QLabel("Current Level: Beginner")
@@ -74,53 +82,20 @@ class LevelDetectionScreen(QWidget):
 
         self.questions.clear()
         self.questions.append(question_data)
-        self._clear_question_area()
         self._show_current_question()
 
-    
-    def _clear_question_area(self):
-        """Clear the question area"""
-        while self.question_layout.count():
-            item = self.question_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-    
     def _show_current_question(self):
         """Show the current question"""
-        self._clear_question_area()
-        
-        # Add question number and text
-        question_number = QLabel(f"Question {self.current + 1} of {5}")
-        self.question_layout.addWidget(question_number)
-
-        question_text = QLabel(self.questions[0]["question"])
-        question_text.setStyleSheet("font-size: 16px; margin: 10px 0;")
-        question_text.setWordWrap(True)
-        self.question_layout.addWidget(question_text)
-        
-        self.option_group = QButtonGroup(self)
-        
-        for opt in self.questions[0]["options"]:
-            btn = QPushButton(opt)
-            btn.setCheckable(True)
-            self.option_group.addButton(btn)
-            self.question_layout.addWidget(btn)
-        
-        next_btn = QPushButton("Next")
-        next_btn.clicked.connect(self._on_next)
-        self.question_layout.addWidget(next_btn)
+        self._hide_results()
+        self.question_view.show_question(self.current + 1, 5, self.questions[0])
     
     def _on_next(self):
         """Handle the click on the 'Next' button"""
-        self.current += 1
-        selected = [b for b in self.option_group.buttons() if b.isChecked()]
-        if not selected:
+        user_answer = self.question_view.selected_text()
+        if user_answer is None:
             QMessageBox.warning(self, "Select", "Choose an answer!")
             return
-
-        correct_answer = self.questions[0]["answer"]
-        user_answer = selected[0].text()
+        self.current += 1
 
 
         ##if user_answer == correct_answer:
@@ -130,14 +105,17 @@ class LevelDetectionScreen(QWidget):
         correct_idx = self.questions[0]["answer"]  # int
         correct_text = self.questions[0]["options"][correct_idx]
 
+        self.question_answered.emit(
+            "level_test", self.questions[0]["question"], user_answer == correct_text)
+
         if user_answer == correct_text:
             self.correct_answers += 1
 
         self._update_level()
         
         if self.current < 5:  # Totale 5 domande
-            threading.Thread(target=self.controller._run_level_test_task, daemon=True).start()
-            self._clear_question_area()
+            self.controller.run_in_background("level_detection", self.controller._run_level_test_task)
+            self.question_view.show_message("Preparing next question...")
             self.questions = []
         else:
             score = self.correct_answers
@@ -173,39 +151,56 @@ class LevelDetectionScreen(QWidget):
         
         self.level_label.setText(f"Current Level: {level}")
     
-    def show_analysis_results(self, analysis_result):
-        """Show analysis results"""
-        self._clear_question_area()
+    def _build_results_widget(self):
+        self.results_widget = QWidget()
+        layout = QVBoxLayout(self.results_widget)
+        layout.setContentsMargins(0, 0, 0, 0)
 
         results_header = QLabel("Language Level Results")
         results_header.setStyleSheet("font-size: 16px; font-weight: bold; margin-top: 15px;")
-        self.question_layout.addWidget(results_header)
-        
-        level_label = QLabel(f"Estimated level: {analysis_result['estimated_level']}")
-        level_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
-        self.question_layout.addWidget(level_label)
-        
-        feedback_label = QLabel("Feedback:")
-        self.question_layout.addWidget(feedback_label)
-        
-        feedback_text = QLabel(analysis_result['feedback'])
-        feedback_text.setWordWrap(True)
-        feedback_text.setStyleSheet("margin: 5px 0 10px 0;")
-        self.question_layout.addWidget(feedback_text)
-        
+        layout.addWidget(results_header)
+
+        self.result_level_label = QLabel()
+        self.result_level_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        layout.addWidget(self.result_level_label)
+
+        layout.addWidget(QLabel("Feedback:"))
+
+        self.result_feedback_label = QLabel()
+        self.result_feedback_label.setWordWrap(True)
+        self.result_feedback_label.setStyleSheet("margin: 5px 0 10px 0;")
+        layout.addWidget(self.result_feedback_label)
+
         back_btn = QPushButton("Return to Dashboard")
         back_btn.clicked.connect(self.back_requested.emit)
-        self.question_layout.addWidget(back_btn)
+        layout.addWidget(back_btn)
+
+        # Right below the question area
+        self.main_layout.insertWidget(self.main_layout.indexOf(self.question_view) + 1,
+                                      self.results_widget)
+
+    def _hide_results(self):
+        if self.results_widget is not None:
+            self.results_widget.hide()
+        self.question_view.show()
+
+    def show_analysis_results(self, analysis_result):
+        """Show analysis results"""
+        if self.results_widget is None:
+            self._build_results_widget()
+        self.result_level_label.setText(f"Estimated level: {analysis_result['estimated_level']}")
+        self.result_feedback_label.setText(analysis_result['feedback'])
+        self.question_view.hide()
+        self.results_widget.show()
     
     def reset_screen(self):
         """Reset screen state"""
         self.questions = []
         self.current = 0
         self.correct_answers = 0
-        self._clear_question_area()
         
         self.level_progress_bar.setValue(0)
         self.level_label.setText("Current Level: Beginner")
         
-        self.loading_label = QLabel("Preparing level assessment test...")
-        self.question_layout.addWidget(self.loading_label)
\ No newline at end of file
+        self._hide_results()
+        self.question_view.show_message("Preparing level assessment test...")
\ No newline at end of file
@@ -10,6 +10,7 @@ from PySide6.QtWidgets import (
 # No longer need QPixmap for flag images, so remove QPixmap import
 from PySide6.QtGui import QFont
 from PySide6.QtCore import Qt, Signal, QSize # QObject is implicitly inherited by QWidget
+from logic.startup_profiler import profiled
 
 
 # --- Language and Emoji Definitions ---
@@ -37,6 +38,7 @@ class LoginScreen(QWidget):
     login_attempted = Signal(str)
     language_selected = Signal(str)
 
+    @profiled()
     def __init__(self, parent=None):
         super().__init__(parent)
         self._setup_ui() # Build the UI elements
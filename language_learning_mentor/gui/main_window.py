@@ -1,3 +1,4 @@
+import logging
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QStackedWidget, QMessageBox, QTextEdit, QGroupBox,
@@ -8,13 +9,22 @@ from PySide6.QtCore import Qt, QTimer, QMetaObject, Q_ARG, QSize, QObject # QObj
 
 # Import other parts of your application
 from logic.app_controller import AppController
+from logic.startup_profiler import profiled
+from logic.tracing import TRACER
 from gui.login_screen import LoginScreen
 from gui.dashboard_screen import DashboardScreen
 from gui.style_manager import StyleManager
 from gui.quiz_screen import QuizScreen
 from gui.level_detection_screen import LevelDetectionScreen
+from gui.notification_center import NotificationCenter
+
+logger = logging.getLogger(__name__)
+
+SCREEN_IDLE_RELEASE_MS = 2 * 60 * 1000        # idle quiz / level test screens are destroyed after this
+RELEASABLE_SCREENS = ("quiz", "level_detection")
 
 class MainWindow(QWidget): # Or QMainWindow if you need menus, toolbars, status bar
+    @profiled()
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Language Learning Mentor")
@@ -32,97 +42,178 @@ class MainWindow(QWidget): # Or QMainWindow if you need menus, toolbars, status
         self.stacked_widget = QStackedWidget()
         self.main_layout.addWidget(self.stacked_widget)
 
-        # Create UI screens and add them to the stacked widget
-        # --- Screens -----------------------------------------------------------
-        self.login_screen = LoginScreen()
-        self.dashboard_screen = DashboardScreen()
-        self.quiz_screen = QuizScreen()
-        self.level_detection_screen = LevelDetectionScreen(self.controller)
-
-        self.stacked_widget.addWidget(self.login_screen)         # Index 0
-        self.stacked_widget.addWidget(self.dashboard_screen)     # Index 1
-        self.stacked_widget.addWidget(self.quiz_screen)          # Index 2
-        self.stacked_widget.addWidget(self.level_detection_screen)  # Index 3
-
-        # --- Connect Signals and Slots ---
-
-        # Connect signals from LoginScreen to AppController
-        self.login_screen.login_attempted.connect(self.controller.attempt_login)
+        # Non-blocking status toasts (errors still get a dialog)
+        self.notifications = NotificationCenter(self)
+        self.main_layout.addWidget(self.notifications.toast)
 
-        self.login_screen.register_requested.connect(self.controller.register_user)
-
-        self.login_screen.language_selected.connect(self.controller.process_language_selection)
-
-        # Connect signals from DashboardScreen to AppController
-        self.dashboard_screen.logout_requested.connect(self.controller.logout)
-        self.dashboard_screen.theme_toggled.connect(self.controller.toggle_theme) # Dashboard requests toggle
-        self.dashboard_screen.quiz_requested.connect(self._show_quiz_screen)  # Modificato
-
-        self.dashboard_screen.level_detection_requested.connect(self._show_level_detection_screen)  # Modificato
-
-        # Connect signals dalle nuove schermate
-        self.quiz_screen.back_requested.connect(self.show_dashboard_screen)  # Torna alla dashboard
-        self.quiz_screen.quiz_completed.connect(self.controller.add_exp)  # Aggiungi esperienza al completamento
-        
-        self.level_detection_screen.back_requested.connect(self.show_dashboard_screen)  # Return to dashboard
-
-        # Connect signals from AppController back to UI (MainWindow or Screens)
+        # --- Screens -----------------------------------------------------------
+        # Screens are built on first navigation (see _screen) and wired up then;
+        # the quiz / level test screens are released again after being idle.
+        self._screen_builders = {
+            "login": self._build_login_screen,
+            "dashboard": self._build_dashboard_screen,
+            "quiz": self._build_quiz_screen,
+            "level_detection": self._build_level_detection_screen,
+        }
+        self._screens = {}
+        self._screen_connections = {}  # name -> [(signal, slot)] made on the controller
+        self._release_timers = {}
+        for name in RELEASABLE_SCREENS:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(SCREEN_IDLE_RELEASE_MS)
+            timer.timeout.connect(lambda n=name: self._release_screen(n))
+            self._release_timers[name] = timer
+
+        # Connect signals from AppController that don't target a specific screen
         self.controller.user_loggedIn.connect(self._handle_user_loggedIn) # MainWindow handles screen switch/reset
-        self.controller.user_state_updated.connect(self.dashboard_screen.update_user_info) # Dashboard updates info
-        self.controller.show_language_selection.connect(self.login_screen.show_language_selection_ui) # Login screen shows language options
         self.controller.show_dashboard.connect(self.show_dashboard_screen) # MainWindow switches to dashboard
         self.controller.status_message.connect(self._display_status_message) # Handle status (e.g., print or status bar)
-        self.controller.tip_generated.connect(self.dashboard_screen.display_tip) # Dashboard displays tip
         self.controller.theme_changed.connect(self._apply_theme) # MainWindow applies themes
 
-        self.controller.level_test_data_ready.connect(self.level_detection_screen.start_test)
-        self.controller.analysis_complete.connect(self.level_detection_screen.show_analysis_results)
-        self.controller.quiz_data_ready.connect(self.quiz_screen.start_quiz)
-        self.controller.analysis_complete.connect(self.level_detection_screen.show_analysis_results)
-
-        self.level_detection_screen.level_test_completed.connect(
-            self.controller.process_level_test_results)
-
         # --- Initial Setup ---
         # Show the login screen initially
         self.show_login_screen()
 
+    # --- Screen Registry ---
+    @property
+    def login_screen(self):
+        return self._screen("login")
+
+    @property
+    def dashboard_screen(self):
+        return self._screen("dashboard")
+
+    @property
+    def quiz_screen(self):
+        return self._screen("quiz")
+
+    @property
+    def level_detection_screen(self):
+        return self._screen("level_detection")
+
+    def _screen(self, name):
+        """Returns the screen, building it (and wiring its signals) on first use."""
+        screen = self._screens.get(name)
+        if screen is None:
+            screen = self._screens[name] = self._screen_builders[name]()
+            self.stacked_widget.addWidget(screen)
+        return screen
+
+    def _connect_controller(self, name, signal, slot):
+        """Connects a controller signal to a screen, remembered so it can be undone on release."""
+        signal.connect(slot)
+        self._screen_connections.setdefault(name, []).append((signal, slot))
+
+    def _set_current_screen(self, name):
+        screen = self._screen(name)
+        self.stacked_widget.setCurrentWidget(screen)
+        # Restart the idle countdown of every other releasable screen that is alive
+        for other, timer in self._release_timers.items():
+            if other == name:
+                timer.stop()
+            elif other in self._screens:
+                timer.start()
+        return screen
+
+    def _release_screen(self, name):
+        """Destroys an idle screen; it is rebuilt on the next navigation."""
+        screen = self._screens.get(name)
+        if screen is None or self.stacked_widget.currentWidget() is screen:
+            return
+        if self.controller.is_preparing(name):
+            # Its quiz / level test is still being generated: keep it for the result
+            self._release_timers[name].start()
+            return
+        logger.info("Releasing idle %s screen.", name)
+        for signal, slot in self._screen_connections.pop(name, []):
+            try:
+                signal.disconnect(slot)
+            except (RuntimeError, TypeError):
+                pass
+        del self._screens[name]
+        self.stacked_widget.removeWidget(screen)
+        screen.deleteLater()
+
+    def _build_login_screen(self):
+        screen = LoginScreen()
+        # Connect signals from LoginScreen to AppController
+        screen.login_attempted.connect(self.controller.attempt_login)
+        screen.register_requested.connect(self.controller.register_user)
+        screen.language_selected.connect(self.controller.process_language_selection)
+        self._connect_controller("login", self.controller.show_language_selection,
+                                 screen.show_language_selection_ui) # Login screen shows language options
+        return screen
+
+    def _build_dashboard_screen(self):
+        screen = DashboardScreen()
+        # Connect signals from DashboardScreen to AppController
+        screen.logout_requested.connect(self.controller.logout)
+        screen.theme_toggled.connect(self.controller.toggle_theme) # Dashboard requests toggle
+        screen.quiz_requested.connect(self._show_quiz_screen)  # Modificato
+        screen.level_detection_requested.connect(self._show_level_detection_screen)  # Modificato
+
+        self._connect_controller("dashboard", self.controller.user_state_updated,
+                                 screen.update_user_info) # Dashboard updates info
+        self._connect_controller("dashboard", self.controller.progress_stats_updated,
+                                 screen.update_progress_stats) # Dashboard analytics
+        self._connect_controller("dashboard", self.controller.tip_generated,
+                                 screen.display_tip) # Dashboard displays tip
+        # The login already happened before the dashboard existed: catch it up
+        self.controller.update_user_state_and_notify()
+        self.controller.notify_progress_stats()
+        return screen
+
+    def _build_quiz_screen(self):
+        screen = QuizScreen()
+        screen.back_requested.connect(self.show_dashboard_screen)  # Torna alla dashboard
+        screen.quiz_completed.connect(self.controller.add_exp)  # Aggiungi esperienza al completamento
+        # Every answered question is logged for the offline difficulty calibration
+        screen.question_answered.connect(self.controller.record_response)
+        self._connect_controller("quiz", self.controller.quiz_data_ready, screen.start_quiz)
+        return screen
+
+    def _build_level_detection_screen(self):
+        screen = LevelDetectionScreen(self.controller)
+        screen.back_requested.connect(self.show_dashboard_screen)  # Return to dashboard
+        screen.question_answered.connect(self.controller.record_response)
+        screen.level_test_completed.connect(self.controller.process_level_test_results)
+        self._connect_controller("level_detection", self.controller.level_test_data_ready,
+                                 screen.start_test)
+        self._connect_controller("level_detection", self.controller.analysis_complete,
+                                 screen.show_analysis_results)
+        return screen
 
     # --- Screen Management ---
     def show_login_screen(self):
         """Switches to the login screen and resets its state."""
-        print("MainWindow: Switching to login screen.")
+        logger.debug("Switching to login screen.")
         # Reset the login screen UI state
         self.login_screen.reset_ui()
         # Apply the theme based on the *controller's current theme* (might be default or loaded)
         self.style_manager.apply_theme(self.controller.theme)
-        self.stacked_widget.setCurrentWidget(self.login_screen) # Show the login widget
+        self._set_current_screen("login") # Show the login widget
 
     def show_dashboard_screen(self):
         """Switches to the main dashboard screen."""
-        print("MainWindow: Switching to dashboard screen.")
+        logger.debug("Switching to dashboard screen.")
         # Apply the theme based on the controller's current theme
         self.style_manager.apply_theme(self.controller.theme)
-        self.stacked_widget.setCurrentWidget(self.dashboard_screen) # Show the dashboard widget
+        self._set_current_screen("dashboard") # Show the dashboard widget
         # Request the first daily tip when showing the dashboard
         self.controller.request_daily_tip()
     
     def _show_quiz_screen(self):
         """Passa alla schermata del quiz e avvia la preparazione."""
-        print("MainWindow: Switching to quiz screen.")
-        self.style_manager.apply_theme(self.controller.theme)
-        self.stacked_widget.setCurrentWidget(self.quiz_screen)
-        # Avvia la preparazione del quiz
-        self.controller.start_quiz()
-    
-    def _show_level_detection_screen(self):
-        """Passa alla schermata di rilevamento del livello."""
-        print("MainWindow: Switching to level detection screen.")
-        self.style_manager.apply_theme(self.controller.theme)
-        self.stacked_widget.setCurrentWidget(self.level_detection_screen)
-        # Resetta eventuali risultati precedenti
-        self.level_detection_screen.reset_screen()
-
+        logger.debug("Switching to quiz screen.")
+        # Root span of the quiz trace, ended by QuizScreen.start_quiz
+        root = TRACER.start_flow("quiz", "ui.quiz_requested")
+        with TRACER.use_span(root):
+            with TRACER.span("MainWindow.show_quiz_screen"):
+                self.style_manager.apply_theme(self.controller.theme)
+                self._set_current_screen("quiz").reset_screen()
+            # Avvia la preparazione del quiz
+            self.controller.start_quiz()
 
     # --- Controller Signal Handlers ---
 
@@ -132,7 +223,7 @@ class MainWindow(QWidget): # Or QMainWindow if you need menus, toolbars, status
         Used here primarily for resetting the login screen on successful login
         before switching to dashboard or language select.
         """
-        print(f"MainWindow: Received user_loggedIn signal for user: {username}")
+        logger.debug("Received user_loggedIn signal for user: %s", username)
         if username:
              # Reset the login screen state after successful login attempt
              self.login_screen.hide_language_selection_ui() # Also clears input, enables login btn state doesn't matter as we switch
@@ -144,28 +235,21 @@ class MainWindow(QWidget): # Or QMainWindow if you need menus, toolbars, status
 
     def _display_status_message(self, message):
         """Visual feedback for every status message."""
-        print(f"STATUS: {message}")  # console for dev
-
-        # Most messages should also reach the user clearly in GUI
-        if "error" in message.lower() or "please" in message.lower() \
-                or "not found" in message.lower():
-            QMessageBox.warning(self, "Notice", message,
-                                QMessageBox.StandardButton.Ok)
-        else:
-            # Use “information” pop-up for neutral/positive messages
-            QMessageBox.information(self, "Info", message,
+        logger.info("STATUS: %s", message)
 
+        # Toast at the bottom of the window; bursts are coalesced and only
+        # errors open a (non-modal) dialog, so nothing blocks the user's flow
+        self.notifications.post(message)
 
-                                    QMessageBox.StandardButton.Ok)
     def _apply_theme(self, theme):
         """Applies the theme when it changes."""
-        print(f"MainWindow: Applying {theme} theme")
+        logger.debug("Applying %s theme", theme)
         self.style_manager.apply_theme(theme)
 
     def _show_level_detection_screen(self):
         """Switch to level detection screen and start preparation."""
-        print("MainWindow: Switching to level detection screen.")
+        logger.debug("Switching to level detection screen.")
         self.style_manager.apply_theme(self.controller.theme)
-        self.stacked_widget.setCurrentWidget(self.level_detection_screen)
+        self._set_current_screen("level_detection").reset_screen()
         # Start level test preparation
         self.controller.start_level_detection()
\ No newline at end of file
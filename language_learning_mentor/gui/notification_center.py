@@ -0,0 +1,125 @@
+# gui/notification_center.py
+"""
+Non-blocking status notifications for the main window.
+
+Status messages used to open a modal QMessageBox each, so background
+completions ("Quiz ready.", "Tip generated.") stacked up dialogs the user had
+to click through before reaching the content. Now they go to a toast bar at
+the bottom of the window:
+
+  * post() can be called from any thread; messages are queued and displayed
+    by the GUI thread;
+  * display is rate limited: a burst of messages within MIN_INTERVAL_MS is
+    coalesced (duplicates counted, the newest message shown with "+N more");
+  * only errors open a dialog, and it is non-modal and reused while open.
+"""
+import threading
+import time
+from collections import deque
+
+from PySide6.QtCore import QObject, QTimer, Signal, Qt
+from PySide6.QtWidgets import QLabel, QMessageBox
+
+MIN_INTERVAL_MS = 300     # at most one toast update per interval
+TOAST_DURATION_MS = 4000
+HISTORY_SIZE = 100
+
+INFO, WARNING, ERROR = "info", "warning", "error"
+
+TOAST_STYLES = {
+    INFO: "background: #2f6f9f; color: white; border-radius: 6px; padding: 6px 10px;",
+    WARNING: "background: #b7791f; color: white; border-radius: 6px; padding: 6px 10px;",
+}
+
+
+def classify(message):
+    """Severity of a controller status message (they are plain strings)."""
+    text = message.lower()
+    if "error" in text or "failed" in text:
+        return ERROR
+    if "please" in text or "not found" in text or "invalid" in text or "required" in text:
+        return WARNING
+    return INFO
+
+
+class NotificationCenter(QObject):
+    _wake = Signal()  # queued to the GUI thread when posting from a worker
+
+    def __init__(self, parent_widget):
+        super().__init__(parent_widget)
+        self._parent_widget = parent_widget
+        self._pending = deque()
+        self._lock = threading.Lock()
+        self._last_shown = 0.0
+        self.history = deque(maxlen=HISTORY_SIZE)   # (time, level, message)
+        self._error_box = None
+
+        self.toast = QLabel()
+        self.toast.setWordWrap(True)
+        self.toast.setAlignment(Qt.AlignCenter)
+        self.toast.hide()
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush)
+        self._hide_timer = QTimer(self)
+        self._hide_timer.setSingleShot(True)
+        self._hide_timer.setInterval(TOAST_DURATION_MS)
+        self._hide_timer.timeout.connect(self.toast.hide)
+        self._wake.connect(self._schedule_flush)
+
+    # ------------------------------------------------------------------ API
+    def post(self, message, level=None):
+        """Queues a notification. Safe to call from any thread."""
+        with self._lock:
+            self._pending.append((time.time(), level or classify(message), message))
+        self._wake.emit()
+
+    # ------------------------------------------------------------------ GUI THREAD
+    def _schedule_flush(self):
+        if self._flush_timer.isActive():
+            return  # this burst is already going to be shown together
+        since_last_ms = (time.monotonic() - self._last_shown) * 1000.0
+        self._flush_timer.start(max(0, int(MIN_INTERVAL_MS - since_last_ms)))
+
+    def _flush(self):
+        with self._lock:
+            batch, self._pending = list(self._pending), deque()
+        if not batch:
+            return
+        self.history.extend(batch)
+        self._last_shown = time.monotonic()
+
+        errors = [message for _, level, message in batch if level == ERROR]
+        if errors:
+            self._show_errors(errors)
+        toasts = [(level, message) for _, level, message in batch if level != ERROR]
+        if toasts:
+            self._show_toast(toasts)
+
+    def _show_toast(self, toasts):
+        counts = {}
+        for _, message in toasts:
+            counts[message] = counts.get(message, 0) + 1
+        level, newest = toasts[-1]
+        text = newest if counts[newest] == 1 else f"{newest} (x{counts[newest]})"
+        if len(counts) > 1:
+            text += f"  (+{len(counts) - 1} more)"
+        # A warning in the burst keeps the warning colour even if the newest is info
+        if any(l == WARNING for l, _ in toasts):
+            level = WARNING
+        self.toast.setStyleSheet(TOAST_STYLES[level])
+        self.toast.setText(text)
+        self.toast.show()
+        self._hide_timer.start()
+
+    def _show_errors(self, errors):
+        text = "\n".join(dict.fromkeys(errors))  # dedupe, keep order
+        box = self._error_box
+        if box is not None and box.isVisible():
+            box.setText(f"{box.text()}\n{text}")
+            return
+        box = self._error_box = QMessageBox(QMessageBox.Warning, "Error", text,
+                                            QMessageBox.StandardButton.Ok, self._parent_widget)
+        box.setModal(False)
+        box.show()
@@ -0,0 +1,159 @@
+# gui/question_view.py
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QLabel, QButtonGroup, QPushButton, QSizePolicy
+)
+from PySide6.QtCore import Signal
+
+OPTION_POOL_SIZE = 4  # quizzes use 4 options; the pool grows once if a question has more
+
+
+class QuestionView(QWidget):
+    """
+    Multiple-choice question area shared by QuizScreen and LevelDetectionScreen.
+
+    All widgets are created once and updated in place: a question transition only
+    changes texts and visibility and is painted once, so it allocates nothing and
+    does not flicker. prepare() formats the next question in advance, so
+    show_prepared() is just a batch of setText calls. The same area shows
+    loading / error messages with an optional action button, and inline feedback
+    on the last answer (instead of a modal dialog per answer).
+    """
+    next_clicked = Signal()
+    action_clicked = Signal()
+
+    def __init__(self, next_text="Next", header_format="Question {number} of {total}",
+                 parent=None):
+        super().__init__(parent)
+        self.header_format = header_format
+        self._prepared = None
+        self._visible_options = 0
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+
+        self.message_label = QLabel()
+        self.message_label.setWordWrap(True)
+        self._layout.addWidget(self.message_label)
+
+        self.number_label = QLabel()
+        self._layout.addWidget(self.number_label)
+
+        self.question_label = QLabel()
+        self.question_label.setStyleSheet("font-size: 16px; margin: 10px 0;")
+        self.question_label.setWordWrap(True)
+        self._layout.addWidget(self.question_label)
+
+        self.option_group = QButtonGroup(self)
+        self.option_buttons = []
+        for _ in range(OPTION_POOL_SIZE):
+            self._add_option_button()
+
+        self.next_button = QPushButton(next_text)
+        self.next_button.clicked.connect(self.next_clicked.emit)
+        self._layout.addWidget(self.next_button)
+
+        self.action_button = QPushButton()
+        self.action_button.clicked.connect(self.action_clicked.emit)
+        self._layout.addWidget(self.action_button)
+
+        self.feedback_label = QLabel()
+        self.feedback_label.setWordWrap(True)
+        self._layout.addWidget(self.feedback_label)
+
+        self._set_question_mode(False)
+        self.action_button.hide()
+        self.feedback_label.hide()
+
+    def _add_option_button(self):
+        btn = QPushButton()
+        btn.setCheckable(True)
+        btn.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        self.option_group.addButton(btn, len(self.option_buttons))
+        # Options sit right above the Next button
+        self._layout.insertWidget(3 + len(self.option_buttons), btn)
+        self.option_buttons.append(btn)
+        return btn
+
+    def _set_question_mode(self, on):
+        self.number_label.setVisible(on)
+        self.question_label.setVisible(on)
+        self.next_button.setVisible(on)
+        for i, btn in enumerate(self.option_buttons):
+            btn.setVisible(on and i < self._visible_options)
+        self.message_label.setVisible(not on)
+
+    # ---------------------------------------------------------------- QUESTIONS
+    def format_question(self, number, total, question):
+        """Display-ready (header, question text, option texts) for one question dict."""
+        return (self.header_format.format(number=number, total=total),
+                str(question.get("question", "")),
+                [str(opt) for opt in question.get("options", [])])
+
+    def prepare(self, number, total, question):
+        """Formats the next question ahead of time (and grows the pool if needed)."""
+        self._prepared = self.format_question(number, total, question)
+        while len(self.option_buttons) < len(self._prepared[2]):
+            self._add_option_button().hide()
+
+    def show_prepared(self):
+        header, text, options = self._prepared
+        self._prepared = None
+
+        self.setUpdatesEnabled(False)  # one repaint for the whole swap
+        try:
+            self.number_label.setText(header)
+            self.question_label.setText(text)
+            self._clear_selection()
+            self._visible_options = len(options)
+            for i, btn in enumerate(self.option_buttons):
+                if i < len(options):
+                    btn.setText(options[i])
+            self._set_question_mode(True)
+            self.action_button.hide()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def show_question(self, number, total, question):
+        self.prepare(number, total, question)
+        self.show_prepared()
+
+    def has_prepared(self):
+        return self._prepared is not None
+
+    def _clear_selection(self):
+        # An exclusive group refuses to uncheck its checked button
+        self.option_group.setExclusive(False)
+        for btn in self.option_buttons:
+            btn.setChecked(False)
+        self.option_group.setExclusive(True)
+
+    def selected_index(self):
+        """Index of the chosen option, or -1."""
+        return self.option_group.checkedId()
+
+    def selected_text(self):
+        btn = self.option_group.checkedButton()
+        return btn.text() if btn is not None else None
+
+    # ---------------------------------------------------------------- MESSAGES
+    def show_feedback(self, text, ok=True):
+        """Inline result of the last answer; stays visible under the next question."""
+        self.feedback_label.setText(text)
+        self.feedback_label.setStyleSheet("color: green;" if ok else "color: red;")
+        self.feedback_label.show()
+
+    def clear_feedback(self):
+        self.feedback_label.hide()
+
+    def show_message(self, text, action_text=None, error=False):
+        """Replaces the question with a message (loading, error) and an optional button."""
+        self.setUpdatesEnabled(False)
+        try:
+            self.message_label.setText(text)
+            self.message_label.setStyleSheet("color: red;" if error else "")
+            self._set_question_mode(False)
+            if action_text:
+                self.action_button.setText(action_text)
+            self.action_button.setVisible(bool(action_text))
+        finally:
+            self.setUpdatesEnabled(True)
@@ -1,15 +1,22 @@
 # gui/quiz_screen.py
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QButtonGroup, 
-    QPushButton, QMessageBox, QHBoxLayout, QSpacerItem,
+    QWidget, QVBoxLayout, QLabel,
+    QPushButton, QHBoxLayout, QSpacerItem,
     QSizePolicy
 )
 from PySide6.QtCore import Signal, Qt
+from logic.startup_profiler import profiled
+from logic.tracing import TRACER
+from gui.question_view import QuestionView
+
+LOADING_TEXT = "Preparazione quiz in corso..."
 
 class QuizScreen(QWidget):
     quiz_completed = Signal(int)  # Segnale emesso quando il quiz è completato, con punteggio
     back_requested = Signal()     # Segnale per tornare alla dashboard
+    question_answered = Signal(str, str, bool)  # tipo, testo domanda, risposta corretta
     
+    @profiled()
     def __init__(self, parent=None):
         super().__init__(parent)
         self.questions = []
@@ -34,19 +41,32 @@ class QuizScreen(QWidget):
         
         self.main_layout.addLayout(header_layout)
         
-        # Area per la domanda (inizialmente vuota)
-        self.question_layout = QVBoxLayout()
-        self.main_layout.addLayout(self.question_layout)
+        # Area per la domanda: widget riutilizzati da una domanda all'altra
+        self.question_view = QuestionView(next_text="Avanti",
+                                          header_format="Domanda {number} di {total}")
+        self.question_view.next_clicked.connect(self._on_next)
+        self.question_view.action_clicked.connect(self.back_requested.emit)
+        self.main_layout.addWidget(self.question_view)
         
         # Messaggio di caricamento iniziale
-        self.loading_label = QLabel("Preparazione quiz in corso...")
-        self.question_layout.addWidget(self.loading_label)
+        self.question_view.show_message(LOADING_TEXT)
         
         # Spaziatore finale
         self.main_layout.addItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
     
+    def reset_screen(self):
+        """Torna al messaggio di caricamento (riepilogo del quiz precedente incluso)."""
+        self.question_view.clear_feedback()
+        self.question_view.show_message(LOADING_TEXT)
+
     def start_quiz(self, quiz_data):
         """Inizializza e avvia il quiz con i dati forniti"""
+        TRACER.take_handoff("quiz_data_ready")
+        with TRACER.span("QuizScreen.start_quiz", parent=TRACER.flow("quiz")):
+            self._start_quiz(quiz_data)
+        TRACER.end_flow("quiz")
+
+    def _start_quiz(self, quiz_data):
         if not quiz_data or not isinstance(quiz_data, list) or len(quiz_data) == 0:
             self._show_error("Non è stato possibile caricare il quiz. Prova più tardi.")
             return
@@ -54,14 +74,13 @@ class QuizScreen(QWidget):
         self.questions = quiz_data
         self.current = 0
         self.correct_answers = 0
-        
-        # Pulisci eventuali widget dalla domanda precedente
-        self._clear_question_area()
+        self.question_view.clear_feedback()
         
         # Validazione di base del formato dei dati
         try:
             self._validate_quiz_data()
-            # Mostra la prima domanda
+            # Mostra la prima domanda (scartando quella preparata da un quiz abbandonato)
+            self.question_view.prepare(1, len(self.questions), self.questions[0])
             self._show_current_question()
         except ValueError as e:
             self._show_error(f"Errore nel formato del quiz: {str(e)}")
@@ -89,70 +108,40 @@ class QuizScreen(QWidget):
     
     def _show_error(self, message):
         """Mostra un messaggio di errore nell'area domanda"""
-        self._clear_question_area()
-        
-        error_label = QLabel(message)
-        error_label.setStyleSheet("color: red;")
-        error_label.setWordWrap(True)
-        self.question_layout.addWidget(error_label)
-        
-        retry_button = QPushButton("Riprova")
-        retry_button.clicked.connect(self.back_requested.emit)
-        self.question_layout.addWidget(retry_button)
-    
-    def _clear_question_area(self):
-        """Pulisce l'area della domanda"""
-        # Rimuovi tutti i widget dal layout della domanda
-        while self.question_layout.count():
-            item = self.question_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
+        self.question_view.show_message(message, action_text="Riprova", error=True)
     
     def _show_current_question(self):
-        """Mostra la domanda corrente"""
-        self._clear_question_area()
-        
-        # Aggiungi numero domanda e testo
-        question_number = QLabel(f"Domanda {self.current + 1} di {len(self.questions)}")
-        self.question_layout.addWidget(question_number)
-        
-        question_text = QLabel(self.questions[self.current]["question"])
-        question_text.setStyleSheet("font-size: 16px; margin: 10px 0;")
-        question_text.setWordWrap(True)
-        self.question_layout.addWidget(question_text)
-        
-        # Gruppo per i pulsanti delle opzioni
-        self.option_group = QButtonGroup(self)
-        
-        # Aggiungi le opzioni
-        for i, opt in enumerate(self.questions[self.current]["options"]):
-            btn = QPushButton(opt)
-            btn.setCheckable(True)
-            self.option_group.addButton(btn, i)
-            self.question_layout.addWidget(btn)
+        """Mostra la domanda corrente (già preparata, se possibile) e prepara la successiva"""
+        view = self.question_view
+        if view.has_prepared():
+            view.show_prepared()
+        else:
+            view.show_question(self.current + 1, len(self.questions), self.questions[self.current])
         
-        # Pulsante avanti
-        next_btn = QPushButton("Avanti")
-        next_btn.clicked.connect(self._on_next)
-        self.question_layout.addWidget(next_btn)
+        # Prepara la prossima domanda mentre l'utente risponde a questa
+        nxt = self.current + 1
+        if nxt < len(self.questions):
+            view.prepare(nxt + 1, len(self.questions), self.questions[nxt])
     
     def _on_next(self):
         """Gestisce il click sul pulsante 'Avanti'"""
-        selected = [b for b in self.option_group.buttons() if b.isChecked()]
-        if not selected:
-            QMessageBox.warning(self, "Seleziona", "Scegli una risposta!")
+        user_answer = self.question_view.selected_text()
+        if user_answer is None:
+            self.question_view.show_feedback("Scegli una risposta!", ok=False)
             return
         
         # Controlla se la risposta è corretta
         correct_answer = self.questions[self.current]["answer"]
-        user_answer = selected[0].text()
         
+        self.question_answered.emit(
+            "quiz", self.questions[self.current]["question"], user_answer == correct_answer)
+
+        # Esito mostrato in linea sotto la domanda successiva: nessun dialogo da chiudere
         if user_answer == correct_answer:
-            QMessageBox.information(self, "Corretto", "Risposta esatta!")
+            self.question_view.show_feedback("Risposta esatta!")
             self.correct_answers += 1
         else:
-            QMessageBox.information(self, "Sbagliato", f"Risposta giusta: {correct_answer}")
+            self.question_view.show_feedback(f"Sbagliato. Risposta giusta: {correct_answer}", ok=False)
         
         # Passa alla domanda successiva o termina il quiz
         self.current += 1
@@ -160,11 +149,10 @@ class QuizScreen(QWidget):
             self._show_current_question()
         else:
             score = self.correct_answers
-            QMessageBox.information(
-                self, "Fine Quiz", 
-                f"Hai completato il quiz!\nPunteggio: {score}/{len(self.questions)}"
-            )
+            total = len(self.questions)
             self.questions = []
             self.current = 0
-            self.quiz_completed.emit(score * 10)  # Emetti segnale con punteggio (10 EXP per risposta corretta)
-            self.back_requested.emit()  # Torna alla dashboard
\ No newline at end of file
+            # Il riepilogo resta nell'area domanda finché l'utente torna alla dashboard
+            self.question_view.show_message(f"Hai completato il quiz! Punteggio: {score}/{total}",
+                                            action_text="Torna alla Dashboard")
+            self.quiz_completed.emit(score * 10)  # Emetti segnale con punteggio (10 EXP per risposta corretta)
\ No newline at end of file
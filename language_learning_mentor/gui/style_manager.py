@@ -1,15 +1,30 @@
 # gui/style_manager.py
+import logging
 from PySide6.QtGui import QPalette, QColor
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
+from logic.startup_profiler import profiled
+
+logger = logging.getLogger(__name__)
 
 class StyleManager:
-    """Gestisce palette tema chiaro/scuro e un foglio di stile QSS globale."""
+    """
+    Gestisce palette tema chiaro/scuro e un foglio di stile QSS globale.
+
+    Palette e QSS sono costruiti una volta sola. apply_theme ricorda cosa è già
+    applicato: riapplicare il tema corrente (succede a ogni navigazione) non fa
+    nulla. Un cambio tema imposta la nuova palette e reimposta il QSS: i widget
+    già stilati dal QSS non ricevono la nuova palette con il solo setPalette,
+    setStyleSheet li ripolisce tutti.
+    """
 
+    @profiled()
     def __init__(self):
         self._light_palette = self._create_light_palette()
         self._dark_palette  = self._create_dark_palette()
         self._common_qss    = self._build_common_qss()
+        self._applied_theme = None   # 'light' / 'dark' attualmente sull'app
+        self._qss_app = None         # app su cui il QSS è già impostato
 
     # ------------------------------------------------------------------ PALETTE
     def _create_light_palette(self):
@@ -80,22 +95,29 @@ class StyleManager:
         """
 
     # ------------------------------------------------------------------ APPLY
+    @profiled()
     def apply_theme(self, theme_preference: str):
-        """Applica la palette e il foglio di stile."""
+        """Applica la palette e il foglio di stile (no-op se il tema è già applicato)."""
         app = QApplication.instance()
         if not app:
-            print("Warning: QApplication instance not found.")
+            logger.warning("QApplication instance not found.")
             return
 
-        if theme_preference == 'dark':
-            print("Applying dark theme.")
-            app.setPalette(self._dark_palette)
-        else:
-            print("Applying light theme.")
-            app.setPalette(self._light_palette)
+        theme = 'dark' if theme_preference == 'dark' else 'light'
+        if theme == self._applied_theme and self._qss_app is app:
+            return
 
-        # Il QSS è identico per entrambi i temi
+        logger.debug("Applying %s theme.", theme)
+        app.setPalette(self.get_palette(theme))
+        # Il QSS è identico per entrambi i temi, ma va reimpostato a ogni cambio:
+        # è setStyleSheet a ripolire i widget esistenti con la nuova palette
         app.setStyleSheet(self._common_qss)
+        self._applied_theme = theme
+        self._qss_app = app
+
+    @property
+    def applied_theme(self):
+        return self._applied_theme
 
     # ------------------------------------------------------------------ EXTRA
     def get_palette(self, theme_preference: str):
@@ -1,11 +1,24 @@
+from collections import Counter
 from datetime import date
 
 from PySide6.QtCore import QObject, Signal, QMetaObject, Q_ARG, Qt
+import logging
 import threading
 import time
 
-from logic.config_manager import load_user_config, save_user_config, get_config_path
+from logic.config_manager import (load_user_config, save_user_config, user_exists,
+                                  append_attempt_history, load_attempt_history)
 from logic.language_processor import LanguageProcessor
+from logic.response_log import append_response
+from logic.progress_analytics import ProgressAnalytics
+from logic.user_session import (calculate_level, level_from_test_score, notify_quiz_result,
+                                score_quiz)
+from logic.tip_cache import get_tip_cache
+from logic.usage_ledger import BudgetExceeded
+from logic.startup_profiler import profiled
+from logic.tracing import TRACER
+
+logger = logging.getLogger(__name__)
 
 
 class AppController(QObject):
@@ -23,7 +36,10 @@ class AppController(QObject):
     quiz_data_ready = Signal(object)
     analysis_complete = Signal(object)
     level_test_data_ready = Signal(object)  # Manca nel tuo codice ma serve per level test
+    progress_stats_updated = Signal(dict)
+    request_finished = Signal(str)  # "quiz" / "level_detection" worker done (queued after its data)
 
+    @profiled()
     def __init__(self, parent=None):
         super().__init__(parent)
         self._username = None
@@ -36,7 +52,18 @@ class AppController(QObject):
         self._last_tip_date = None  # ISO string “YYYY-MM-DD”
         self._last_tip_text = None
 
-        self.lang_processor = LanguageProcessor()
+        # Attempt history analytics, plus answers counted since the last attempt
+        self._analytics = ProgressAnalytics()
+        self._pending_correct = 0
+        self._pending_total = 0
+
+        # Background requests per screen, so MainWindow never releases a screen mid-request
+        self._in_flight = Counter()
+        self._in_flight_lock = threading.Lock()
+        self.request_finished.connect(self._request_finished)  # queued: runs after the data signal
+
+        self.lang_processor = LanguageProcessor()  # cheap: the LLM stack loads lazily
+        self.tip_cache = get_tip_cache()  # shared by every user (language, level, day)
 
     @property
     def username(self): return self._username
@@ -84,9 +111,13 @@ class AppController(QObject):
             self._level = config_data.get('level', 'Beginner')
             self._theme = config_data.get('theme', 'light')
 
+            self._analytics = ProgressAnalytics.from_records(
+                load_attempt_history(self._username))
+
             self.theme_changed.emit(self._theme)
             self.user_loggedIn.emit(self._username)
             self.update_user_state_and_notify()
+            self.notify_progress_stats()
 
             if self._language:
                 self.show_dashboard.emit()
@@ -108,8 +139,7 @@ class AppController(QObject):
             self.status_message.emit("Nickname and email are required.")
             return False
 
-        cfg_path = get_config_path(sanitized)
-        if cfg_path.exists():
+        if user_exists(sanitized):  # legacy configs waiting to be claimed included
             self.status_message.emit("User already exists. Please log in.")
             return False
 
@@ -122,10 +152,12 @@ class AppController(QObject):
         self._theme = 'light'
         self._last_tip_date = None
         self._last_tip_text = None
+        self._analytics = ProgressAnalytics()
 
         self.save_user_state()
         self.user_loggedIn.emit(self._username)
         self.update_user_state_and_notify()
+        self.notify_progress_stats()
         self.show_language_selection.emit()
         self.status_message.emit(f"Welcome, {self._username}! Please select a language.")
         return True
@@ -172,6 +204,25 @@ class AppController(QObject):
             'theme': self._theme,
         })
 
+    def notify_progress_stats(self):
+        """Emits the dashboard analytics, computed from the cached aggregates."""
+        self.progress_stats_updated.emit(self._analytics.summary(self._progress))
+
+    def _record_attempt(self, topic, exp):
+        """Appends a finished quiz / level test to the history and the analytics."""
+        record = {
+            'ts': time.time(),
+            'topic': topic,
+            'level': self._level,
+            'exp': exp,
+            'correct': self._pending_correct,
+            'total': self._pending_total,
+        }
+        self._pending_correct = 0
+        self._pending_total = 0
+        append_attempt_history(self._username, record)
+        self._analytics.add_attempt(record)
+
     def logout(self):
         """Logs out the current user and resets state."""
         self.save_user_state()
@@ -179,6 +230,7 @@ class AppController(QObject):
         self._language = None
         self._progress = 0
         self._level = "Beginner"
+        self._analytics = ProgressAnalytics()
 
         self.user_state_updated.emit({
             'username': None, 'language': None, 'progress': 0, 'level': "Beginner", 'theme': 'light'
@@ -202,6 +254,16 @@ class AppController(QObject):
             self.status_message.emit("Loaded today’s tip.")
             return
 
+        # another learner with the same language/level may already have generated it
+        shared_tip = self.tip_cache.lookup(self._username, self._language, self._level)
+        if shared_tip:
+            self._last_tip_date = today
+            self._last_tip_text = shared_tip
+            self.save_user_state()
+            self.tip_generated.emit(shared_tip)
+            self.status_message.emit("Loaded today’s tip.")
+            return
+
         # generate a fresh tip
         self.status_message.emit("Generating tip…")
         self.tip_generated.emit("🧠 Generating tip…")
@@ -211,7 +273,11 @@ class AppController(QObject):
     def _run_tip_generation_task(self):
         """Generate the tip in a background thread and cache it."""
         try:
-            tip = self.lang_processor.generate_daily_tip(self._level, self._language)
+            username = self._username
+            tip, _ = self.tip_cache.get_tip(
+                username, self._language, self._level,
+                lambda level, language: self.lang_processor.generate_daily_tip(
+                    level, language, username=username))
             today = date.today().isoformat()
             self._last_tip_date = today
             self._last_tip_text = tip
@@ -219,33 +285,71 @@ class AppController(QObject):
 
             self.tip_generated.emit(tip)
             self.status_message.emit("Tip generated.")
+        except BudgetExceeded as e:
+            # Out of budget: another learner's tip for the same language/level
+            tip = self.tip_cache.any_tip(self._language, self._level)
+            self.tip_generated.emit(tip or f"Error: {e}")
+            self.status_message.emit("Daily AI budget reached: showing a shared tip."
+                                     if tip else str(e))
         except Exception as e:
             self.tip_generated.emit(f"Error: {e}")
             self.status_message.emit("Error generating tip.")
 
+    def run_in_background(self, kind, target):
+        """
+        Runs a screen's data request in a worker thread. The screen `kind` counts
+        as busy until the worker's results have been delivered (see is_preparing).
+        """
+        with self._in_flight_lock:
+            self._in_flight[kind] += 1
+        threading.Thread(target=target, daemon=True).start()
+
+    def is_preparing(self, kind):
+        """True while a request for the `kind` screen is running or its result is undelivered."""
+        with self._in_flight_lock:
+            return self._in_flight[kind] > 0
+
+    def _request_finished(self, kind):
+        with self._in_flight_lock:
+            self._in_flight[kind] -= 1
+
     def start_quiz(self):
         """Initiates the process of starting a quiz."""
         if not self._language:
             self.status_message.emit("Please select a language before starting a quiz.")
             return
 
-        self.status_message.emit("Preparing quiz...")
-        threading.Thread(target=self._run_prepare_quiz_task, daemon=True).start()
+        with TRACER.span("AppController.start_quiz"):
+            self.status_message.emit("Preparing quiz...")
+            # wrap() keeps the trace parent in the worker thread
+            self.run_in_background("quiz", TRACER.wrap(self._run_prepare_quiz_task))
 
     def _run_prepare_quiz_task(self):
         """Helper method to prepare quiz data in a thread."""
         try:
-            quiz = self.lang_processor.prepare_quiz_data(self._level, self._language)
+            with TRACER.span("LanguageProcessor.prepare_quiz_data"):
+                quiz = self.lang_processor.prepare_quiz_data(self._level, self._language,
+                                                              username=self._username)
+            # Ended by QuizScreen.start_quiz: time spent in the queued signal delivery
+            TRACER.handoff("quiz_data_ready", "qt.signal quiz_data_ready")
             self.quiz_data_ready.emit(quiz)
             self.status_message.emit("Quiz ready.")
         except Exception as e:
             self.status_message.emit(f"Error preparing quiz: {e}")
+        finally:
+            self.request_finished.emit("quiz")
 
     def add_exp(self, amount):
-        """Adds experience points to the user's progress."""
+        """
+        Adds experience points for a finished quiz, then scores it and queues
+        the result email (answers counted by record_response).
+        """
         if not self._username or amount < 0:
             return
 
+        correct = self._pending_correct
+        wrong = self._pending_total - correct
+        self._record_attempt('quiz', amount)
         self._progress += amount
         old_level = self._level
         self._level = self._calculate_level(self._progress)
@@ -255,19 +359,37 @@ class AppController(QObject):
 
         self.save_user_state()
         self.update_user_state_and_notify()
+        self.notify_progress_stats()
+        if correct or wrong:
+            logger.info("Quiz finished: score %d (%d correct, %d wrong)",
+                        score_quiz(correct, wrong), correct, wrong)
+            notify_quiz_result(self._email, self._username, self._language, self._level,
+                               correct, wrong)
+
+    def record_response(self, kind, question_text, correct):
+        """Logs one answered question for the offline item calibration job."""
+        if not self._username:
+            return
+        append_response(self._username, kind, self._language, self._level,
+                        question_text, correct)
+        self._pending_total += 1
+        self._pending_correct += 1 if correct else 0
 
     def _calculate_level(self, exp):
         """Calculates the user's level based on EXP."""
-        if exp < 100:
-            return "Beginner"
-        elif exp < 500:
-            return "Intermediate"
-        elif exp < 1500:
-            return "Advanced"
-        elif exp < 3000:
-            return "Proficient"
-        else:
-            return "Master"
+        return calculate_level(exp)
+
+    def warm_up_in_background(self):
+        """Loads the LLM stack in a worker thread so the first quiz/tip doesn't pay for it."""
+        threading.Thread(target=self._run_warm_up, daemon=True).start()
+
+    def _run_warm_up(self):
+        from logic.mail_queue import resume_pending_delivery
+        resume_pending_delivery()  # mail left unsent by a previous run
+        try:
+            self.lang_processor.warm_up()
+        except Exception as e:
+            logger.warning("LLM stack warm-up failed (will retry on first use): %s", e)
 
     def setup_connections(self, main_window):
         """Configures the connections between controller and UI."""
@@ -292,12 +414,13 @@ class AppController(QObject):
             return
 
         self.status_message.emit("Preparing level test...")
-        threading.Thread(target=self._run_level_test_task, daemon=True).start()
+        self.run_in_background("level_detection", self._run_level_test_task)
 
     def _run_level_test_task(self):
         """Helper method to prepare level test data in a thread."""
         try:
-            test = self.lang_processor.prepare_detect_quiz(self._level, self._language)
+            test = self.lang_processor.prepare_detect_quiz(self._level, self._language,
+                                                           username=self._username)
             
             for i, question in enumerate(test):
                 if not all(key in question for key in ["question", "options", "answer"]):
@@ -310,10 +433,10 @@ class AppController(QObject):
             self.level_test_data_ready.emit(test)
             self.status_message.emit("Level test ready.")
         except Exception as e:
-            import traceback
-            print(f"[DEBUG] Error in level test task: {e}")
-            traceback.print_exc()
+            logger.exception("Error in level test task")
             self.status_message.emit(f"Error preparing level test: {e}")
+        finally:
+            self.request_finished.emit("level_detection")
 
     # -------------------------------------------------- NEW
     def process_level_test_results(self, score: int):
@@ -321,14 +444,11 @@ class AppController(QObject):
         Riceve lo score (0–5) dal LevelDetectionScreen e aggiorna la
         proprietà `self._level` di conseguenza.
         """
-        # mappa lineare 0‑5 → percentuale
-        percentage = (score / 5) * 100
-        if   percentage < 20: new_level = "Beginner"
-        elif percentage < 40: new_level = "Pre-Intermediate"
-        elif percentage < 60: new_level = "Intermediate"
-        elif percentage < 80: new_level = "Pre-Advanced"
-        elif percentage < 95: new_level = "Advanced"
-        else:                 new_level = "Master"
+        self._record_attempt('level_test', 0)
+        self.notify_progress_stats()
+
+        # mappa lineare 0‑5 → livello
+        new_level = level_from_test_score(score)
 
         if new_level != self._level:
             self._level = new_level
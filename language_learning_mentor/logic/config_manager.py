@@ -1,8 +1,13 @@
+import hashlib
 import json
-import re
+import logging
 import os
+import re
+import tempfile
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 # --- Configuration ---
 # Define CONFIG_DIR relative to this file's location
 # This assumes the 'logic' directory is a sibling of 'config' and 'main.py'
@@ -11,15 +16,130 @@ BASE_DIR = Path(__file__).resolve().parent.parent # Go up two levels from logic/
 CONFIG_DIR = BASE_DIR / "config"
 CONFIG_DIR.mkdir(exist_ok=True) # Create config directory if it doesn't exist
 
+# User data lives under its own root, away from the agent/task YAML.
+# Override with MENTOR_DATA_DIR (e.g. a mounted volume on servers).
+DATA_DIR = Path(os.getenv("MENTOR_DATA_DIR", BASE_DIR / "data")).expanduser()
+USERS_DIR = DATA_DIR / "users"  # created on first write, not at import
+
 
 # --- Helper Functions ---
+def user_key(username):
+    """
+    Collision-free file key for a username: SHA-256 of the normalized name.
+    Usernames are case-insensitive, everything else is significant
+    (so "a b" and "a_b" are different users).
+    """
+    normalized = username.strip().lower()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+def legacy_filename(username):
+    """
+    Stem of the user's file in the old flat config/ layout. Lossy: spaces and
+    unsafe characters became underscores ("Mario Rossi" -> "mario_rossi").
+    """
+    return re.sub(r'[\\/*?:"<>| ]', '_', username.strip().lower()) or "default_user"
+
 def get_config_path(username):
-    """Generates the path for a user's config file."""
-    # Sanitize username slightly for filename (replace spaces, common unsafe chars)
-    safe_filename = re.sub(r'[\\/*?:"<>| ]', '_', username.lower())
-    if not safe_filename:
-        safe_filename = "default_user" # Fallback for empty/unsafe names
-    return CONFIG_DIR / f"{safe_filename}.json"
+    """
+    Generates the path for a user's config file.
+    Files are sharded two levels deep on the key prefix (users/ab/cd/<key>.json),
+    so no directory grows beyond a few dozen entries even with millions of users.
+    """
+    key = user_key(username)
+    return USERS_DIR / key[:2] / key[2:4] / f"{key}.json"
+
+def iter_user_config_paths(users_dir=None):
+    """Yields every user config path, walking the shard directories with os.scandir."""
+    users_dir = users_dir or USERS_DIR
+    try:
+        level1 = sorted(e.path for e in os.scandir(users_dir) if e.is_dir())
+    except FileNotFoundError:
+        return
+    for shard1 in level1:
+        for shard2 in sorted(e.path for e in os.scandir(shard1) if e.is_dir()):
+            with os.scandir(shard2) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        yield Path(entry.path)
+
+def write_json_atomic(path, data, exclusive=False):
+    """
+    Writes JSON through a unique temp file + os.replace: concurrent writers never share a temp file.
+    exclusive=True raises FileExistsError instead of replacing an existing file
+    (the temp file is hard-linked into place, which fails atomically if the path exists).
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile('w', dir=path.parent, prefix=path.stem + ".",
+                                     suffix=".tmp", delete=False) as f:
+        tmp_path = f.name
+        try:
+            json.dump(data, f, indent=4)
+        except BaseException:
+            f.close()
+            os.unlink(tmp_path)
+            raise
+    if not exclusive:
+        os.replace(tmp_path, path) # Atomic: never leaves a half-written config
+        return
+    try:
+        os.link(tmp_path, path)
+    finally:
+        os.unlink(tmp_path)
+
+def _legacy_config(username):
+    """
+    (path, data) of a config migrated from the flat layout under its lossy file
+    stem (see logic.migrate_user_data) that `username` may claim, else None.
+    Only the name recorded for it at migration counts (case-insensitive, like
+    every username): "mario*rossi" maps to the same stem as "Mario Rossi" but
+    does not claim its data. Without a recorded name the file stays under its
+    stem, and the user logs in with that.
+    """
+    legacy = legacy_filename(username)
+    if legacy == username.strip().lower():
+        return None
+    legacy_path = get_config_path(legacy)
+    if not legacy_path.exists():
+        return None
+    with open(legacy_path, 'r') as f:
+        data = json.load(f)
+    if not data.get('legacy_key'):
+        return None # A real user called like the stem, not a migrated file
+    if (data.get('legacy_username') or "").strip().lower() != username.strip().lower():
+        return None
+    return legacy_path, data
+
+def user_exists(username):
+    """True if `username` has a config, or a migrated legacy config waiting to be claimed."""
+    if get_config_path(username).exists():
+        return True
+    try:
+        return _legacy_config(username) is not None
+    except (ValueError, IOError):
+        return False
+
+def _claim_legacy_config(username):
+    """
+    Adopts the user's migrated legacy config (see _legacy_config): it is
+    rewritten under the real name, history included.
+    Returns the config data, or None if there is nothing to claim.
+    """
+    claim = _legacy_config(username)
+    if claim is None:
+        return None
+    legacy_path, data = claim
+    legacy = legacy_filename(username)
+    data.pop('legacy_key')
+    data.pop('legacy_username', None)
+    data['username'] = username.strip()
+
+    write_json_atomic(get_config_path(username), data)
+    legacy_history = get_history_path(legacy)
+    if legacy_history.exists():
+        os.replace(legacy_history, get_history_path(username))
+    legacy_path.unlink(missing_ok=True)
+    logger.info("Claimed migrated config %s for %s", legacy_path, username)
+    return data
 
 def load_user_config(username):
     """Loads user configuration from JSON file."""
@@ -29,34 +149,75 @@ def load_user_config(username):
             with open(config_path, 'r') as f:
                 return json.load(f)
         else:
-            return None # User does not exist
+            return _claim_legacy_config(username) # None: user does not exist
     except json.JSONDecodeError:
-        print(f"Warning: Corrupted config file for {username} at {config_path}. Using defaults.")
+        logger.warning("Corrupted config file for %s at %s. Using defaults.", username, config_path)
         return None # Treat as new user if file is corrupt
     except IOError as e:
-         print(f"Error loading config for {username} from {config_path}: {e}")
+         logger.error("Error loading config for %s from %s: %s", username, config_path, e)
          return None
     except Exception as e:
-         print(f"An unexpected error occurred loading config for {username}: {e}")
+         logger.exception("An unexpected error occurred loading config for %s", username)
          return None
 
 
-def save_user_config(username, data):
-    """Saves user configuration to JSON file."""
+def save_user_config(username, data, exclusive=False):
+    """
+    Saves user configuration to JSON file.
+    With exclusive=True an existing user is never replaced: FileExistsError is raised.
+    """
     if not username:
-        print("Warning: Cannot save config, username is empty.")
+        logger.warning("Cannot save config, username is empty.")
         return False # Indicate failure
 
     config_path = get_config_path(username)
+    # Keep the real name in the file: the filename is only a hash of it
+    data = {'username': username.strip(), **data}
     try:
-        with open(config_path, 'w') as f:
-            json.dump(data, f, indent=4)
-        print(f"Saved config for {username} to {config_path}")
+        write_json_atomic(config_path, data, exclusive)
+        logger.debug("Saved config for %s to %s", username, config_path)
         return True # Indicate success
     except IOError as e:
-        print(f"Error saving config for {username} to {config_path}:\n{e}")
+        if exclusive and isinstance(e, FileExistsError):
+            raise # The user already exists: the caller decides
+        logger.error("Error saving config for %s to %s: %s", username, config_path, e)
         # In a real app, you might want to signal this error to the UI
         return False # Indicate failure
     except Exception as e:
-        print(f"An unexpected error occurred while saving config for {username}:\n{e}")
-        return False # Indicate failure
\ No newline at end of file
+        logger.exception("An unexpected error occurred while saving config for %s", username)
+        return False # Indicate failure
+
+def get_history_path(username):
+    """Path of the append-only attempt history that sits next to a user's config."""
+    return get_config_path(username).with_suffix(".history.jsonl")
+
+def append_attempt_history(username, record):
+    """Appends one attempt (quiz or level test) to the user's history file."""
+    if not username:
+        return False
+    history_path = get_history_path(username)
+    try:
+        history_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(history_path, 'a') as f:
+            f.write(json.dumps(record, separators=(',', ':')) + "\n")
+        return True
+    except IOError as e:
+        logger.error("Error appending history for %s to %s: %s", username, history_path, e)
+        return False
+
+def load_attempt_history(username):
+    """Loads the user's attempt history as a list of dicts (oldest first)."""
+    history_path = get_history_path(username)
+    if not history_path.exists():
+        return []
+    records = []
+    try:
+        with open(history_path, 'r') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue # Skip a truncated last line
+    except IOError as e:
+        logger.error("Error loading history for %s from %s: %s", username, history_path, e)
+    return records
@@ -0,0 +1,129 @@
+"""
+Local difficulty estimate for generated fill-in-the-blank questions.
+
+The prompt asks for a level, nothing checks the result. Here every question
+gets a score in [0, 1] from four features:
+
+    vocabulary   mean log frequency rank of the sentence's words
+    answer       log frequency rank of the missing word
+    length       number of words
+    morphology   mean word length (long, derived and inflected forms)
+
+Ranks come from the language's lexicon, kept as two parallel arrays (sorted
+64-bit word hashes and their ranks): a sentence is looked up with a single
+np.searchsorted. Words missing from the lexicon count as rare (OOV_RANK).
+The score maps to one of the six levels through LEVEL_CUTS.
+
+Usage (from the language_learning_mentor directory):
+    python -m logic.difficulty Italian "Io ____ una mela." mangio
+"""
+import hashlib
+import re
+import sys
+import threading
+
+import numpy as np
+
+from logic.item_calibration import LEVELS
+from logic.progress_analytics import LEVELS as LEVEL_SCALE
+from logic.lexicon import get_lexicon
+
+OOV_RANK = 10000
+# Score thresholds between consecutive levels (Beginner | Pre-Intermediate | ... | Master)
+LEVEL_CUTS = np.array([0.40, 0.48, 0.56, 0.63, 0.70])
+WEIGHTS = {"vocabulary": 0.35, "answer": 0.25, "length": 0.2, "morphology": 0.2}
+
+_WORD = re.compile(r"[^\W\d_]+")
+
+
+def _hash(word):
+    return int.from_bytes(hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def level_index(level):
+    """
+    Position of a level name on the app's full scale (progress_analytics.LEVELS:
+    the six assessment levels plus the EXP level "Proficient"), None if unknown.
+    """
+    return LEVEL_SCALE.index(level) if level in LEVEL_SCALE else None
+
+
+class DifficultyTable:
+    """Frequency ranks of one language's word forms, as sorted hash / rank arrays."""
+
+    def __init__(self, lexicon):
+        ranks = {}
+        for f in lexicon.forms:
+            word = f.form.lower()
+            ranks[word] = min(f.rank, ranks.get(word, OOV_RANK))
+        hashes = np.fromiter((_hash(w) for w in ranks), dtype=np.uint64, count=len(ranks))
+        order = np.argsort(hashes)
+        self._hashes = hashes[order]
+        self._ranks = np.fromiter(ranks.values(), dtype=np.uint32, count=len(ranks))[order]
+
+    def ranks(self, words):
+        """Frequency rank of every word (OOV_RANK if unknown), as an array."""
+        if not words or not len(self._hashes):
+            return np.full(len(words), OOV_RANK, dtype=np.uint32)
+        keys = np.fromiter((_hash(w.lower()) for w in words), dtype=np.uint64, count=len(words))
+        idx = np.minimum(np.searchsorted(self._hashes, keys), len(self._hashes) - 1)
+        return np.where(self._hashes[idx] == keys, self._ranks[idx], OOV_RANK)
+
+    def features(self, sentence, answer=""):
+        """The four features of a question, each scaled to [0, 1]."""
+        words = _WORD.findall(sentence)
+        answer_words = _WORD.findall(str(answer))
+        ranks = self.ranks(words + answer_words)
+        scaled = np.log(ranks.astype(np.float64)) / np.log(OOV_RANK)
+        all_words = words + answer_words
+        mean_len = float(np.mean([len(w) for w in all_words])) if all_words else 0.0
+        return {
+            "vocabulary": float(scaled[:len(words)].mean()) if words else 0.0,
+            "answer": float(scaled[len(words):].mean()) if answer_words else 0.0,
+            "length": min(1.0, max(0.0, (len(all_words) - 4) / 20)),
+            "morphology": min(1.0, max(0.0, (mean_len - 3) / 5)),
+        }
+
+    def score(self, sentence, answer=""):
+        features = self.features(sentence, answer)
+        return round(sum(WEIGHTS[name] * value for name, value in features.items()), 3)
+
+
+def estimate_level(score):
+    """Level name for a difficulty score."""
+    return LEVELS[int(np.searchsorted(LEVEL_CUTS, score, side="right"))]
+
+
+# --- Process-wide tables ---
+_tables = {}
+_tables_lock = threading.Lock()
+
+def get_difficulty_table(language):
+    """The language's DifficultyTable (built once from its lexicon), or None without a lexicon."""
+    key = (language or "").strip().lower()
+    with _tables_lock:
+        if key not in _tables:
+            lexicon = get_lexicon(language)
+            _tables[key] = DifficultyTable(lexicon) if lexicon is not None else None
+        return _tables[key]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) not in (2, 3):
+        print('usage: python -m logic.difficulty <language> "<sentence>" [answer]')
+        return 2
+    table = get_difficulty_table(argv[0])
+    if table is None:
+        print(f"No lexicon for {argv[0]}")
+        return 1
+    answer = argv[2] if len(argv) == 3 else ""
+    score = table.score(argv[1], answer)
+    for name, value in table.features(argv[1], answer).items():
+        print(f"{name:<11} {value:.3f}")
+    print(f"score       {score:.3f} ({estimate_level(score)})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
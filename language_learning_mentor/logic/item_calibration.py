@@ -0,0 +1,228 @@
+"""
+Offline item-difficulty calibration job.
+
+Reads every recorded quiz / level-test answer from the response log and fits a
+two-parameter logistic (2PL) IRT model:
+
+    P(correct | user i, item j) = sigmoid(a_j * (theta_i - b_j))
+
+where b_j is the item difficulty, a_j its discrimination and theta_i the user
+ability. The fit is a joint MAP estimate done with vectorized Newton steps: all
+per-user and per-item sums are computed with np.bincount, so one iteration is a
+handful of passes over flat arrays regardless of how many responses there are.
+
+Usage (from the language_learning_mentor directory):
+    python -m logic.item_calibration [--responses PATH] [--output PATH]
+"""
+import argparse
+import json
+import sys
+import time
+from array import array
+from pathlib import Path
+
+import numpy as np
+
+from logic.response_log import RESPONSES_PATH, ITEM_BANK_PATH
+
+LEVELS = ["Beginner", "Pre-Intermediate", "Intermediate",
+          "Pre-Advanced", "Advanced", "Master"]
+# Sextiles of N(0, 1): abilities are normalized, so these split the user
+# population into six equally sized level bands.
+LEVEL_CUTS = np.array([-0.967, -0.431, 0.0, 0.431, 0.967])
+
+
+# --- Loading ---
+def read_responses(path):
+    """
+    Streams the JSONL response log into flat integer arrays.
+    Returns (user_idx, item_idx, correct, item_ids, item_meta).
+    """
+    users, items = {}, {}
+    item_meta = []
+    user_idx, item_idx, correct = array("i"), array("i"), array("b")
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+                u, it, c = rec["user"], rec["item"], rec["correct"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue  # skip truncated / malformed lines
+
+            ui = users.setdefault(u, len(users))
+            ii = items.get(it)
+            if ii is None:
+                ii = items[it] = len(items)
+                item_meta.append({"language": rec.get("language"),
+                                  "requested_level": rec.get("level"),
+                                  "kind": rec.get("kind")})
+            user_idx.append(ui)
+            item_idx.append(ii)
+            correct.append(1 if c else 0)
+
+    return (np.frombuffer(user_idx, dtype=np.int32),
+            np.frombuffer(item_idx, dtype=np.int32),
+            np.frombuffer(correct, dtype=np.int8).astype(np.float64),
+            list(items), item_meta)
+
+
+# --- Estimation ---
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-np.clip(z, -30.0, 30.0)))
+
+
+def fit_2pl(user_idx, item_idx, y, n_users, n_items,
+            max_iter=100, tol=1e-4, prior_sd=2.0, max_step=1.0):
+    """
+    Joint MAP fit of the 2PL model.
+
+    Priors: theta ~ N(0, 1), b ~ N(0, prior_sd^2), a ~ N(1, 0.5^2) truncated
+    at a small positive value. Returns (theta, a, b, n_iterations, last_step):
+    the fit converged if last_step < tol, otherwise max_iter was hit first.
+    """
+    theta = np.zeros(n_users)
+    a = np.ones(n_items)
+    b = np.zeros(n_items)
+
+    # Warm start: difficulty from the smoothed log-odds of the error rate
+    n_resp = np.bincount(item_idx, minlength=n_items)
+    n_corr = np.bincount(item_idx, weights=y, minlength=n_items)
+    p_item = (n_corr + 0.5) / (n_resp + 1.0)
+    b = np.log((1.0 - p_item) / p_item)
+
+    it, delta = 0, np.inf
+    for it in range(1, max_iter + 1):
+        prev_theta, prev_a, prev_b = theta.copy(), a.copy(), b.copy()
+
+        # -- abilities
+        a_r = a[item_idx]
+        d = theta[user_idx] - b[item_idx]
+        p = _sigmoid(a_r * d)
+        r = y - p
+        w = p * (1.0 - p)
+        g = np.bincount(user_idx, weights=a_r * r, minlength=n_users) - theta
+        h = np.bincount(user_idx, weights=a_r * a_r * w, minlength=n_users) + 1.0
+        step_theta = np.clip(g / h, -max_step, max_step)
+        theta += step_theta
+
+        # -- difficulties
+        d = theta[user_idx] - b[item_idx]
+        p = _sigmoid(a_r * d)
+        r = y - p
+        w = p * (1.0 - p)
+        g = -np.bincount(item_idx, weights=a_r * r, minlength=n_items) - b / prior_sd ** 2
+        h = np.bincount(item_idx, weights=a_r * a_r * w, minlength=n_items) + 1.0 / prior_sd ** 2
+        step_b = np.clip(g / h, -max_step, max_step)
+        b += step_b
+
+        # -- discriminations
+        d = theta[user_idx] - b[item_idx]
+        p = _sigmoid(a_r * d)
+        r = y - p
+        w = p * (1.0 - p)
+        g = np.bincount(item_idx, weights=r * d, minlength=n_items) - (a - 1.0) / 0.25
+        h = np.bincount(item_idx, weights=w * d * d, minlength=n_items) + 1.0 / 0.25
+        step_a = np.clip(g / h, -max_step, max_step)
+        a = np.clip(a + step_a, 0.05, 5.0)
+
+        # -- identification: keep abilities standardized
+        mean, sd = theta.mean(), theta.std() or 1.0
+        theta = (theta - mean) / sd
+        b = (b - mean) / sd
+        a = a * sd
+
+        # Change over the whole iteration: the Newton steps alone never vanish,
+        # the standardization undoes part of them (the prior's shrinkage) every time
+        delta = max(np.abs(theta - prev_theta).max(initial=0.0),
+                    np.abs(b - prev_b).max(initial=0.0),
+                    np.abs(a - prev_a).max(initial=0.0))
+        if delta < tol:
+            break
+
+    return theta, a, b, it, delta
+
+
+def difficulty_to_level(b):
+    """Maps calibrated difficulties onto the app's six level names."""
+    return [LEVELS[i] for i in np.searchsorted(LEVEL_CUTS, b)]
+
+
+# --- Output ---
+def build_item_bank(item_ids, item_meta, item_idx, y, a, b, min_responses):
+    """Builds the JSON-serializable item bank, skipping under-sampled items."""
+    n_resp = np.bincount(item_idx, minlength=len(item_ids))
+    n_corr = np.bincount(item_idx, weights=y, minlength=len(item_ids))
+    levels = difficulty_to_level(b)
+
+    items = {}
+    for j in np.flatnonzero(n_resp >= min_responses):
+        items[item_ids[j]] = {
+            "difficulty": round(float(b[j]), 4),
+            "discrimination": round(float(a[j]), 4),
+            "responses": int(n_resp[j]),
+            "p_correct": round(float(n_corr[j] / n_resp[j]), 4),
+            "level": levels[j],
+            **item_meta[j],
+        }
+    return items
+
+
+def calibrate(responses_path=RESPONSES_PATH, output_path=ITEM_BANK_PATH,
+              min_responses=20, max_iter=100, tol=1e-4):
+    """Runs the whole pipeline and writes the item bank. Returns a summary dict."""
+    t0 = time.perf_counter()
+    user_idx, item_idx, y, item_ids, item_meta = read_responses(responses_path)
+    t_load = time.perf_counter() - t0
+
+    if y.size == 0:
+        print(f"No responses found in {responses_path}; nothing to calibrate.")
+        return {"responses": 0}
+
+    n_users = int(user_idx.max()) + 1
+    n_items = len(item_ids)
+    theta, a, b, n_iter, last_step = fit_2pl(user_idx, item_idx, y, n_users, n_items,
+                                             max_iter=max_iter, tol=tol)
+    converged = last_step < tol
+    if not converged:
+        print(f"Warning: no convergence after {n_iter} iterations (last step {last_step:.2g} "
+              f">= {tol:g}); the difficulties may be off, try a larger --max-iter.", file=sys.stderr)
+    items = build_item_bank(item_ids, item_meta, item_idx, y, a, b, min_responses)
+
+    summary = {
+        "generated_at": int(time.time()),
+        "responses": int(y.size),
+        "users": n_users,
+        "items_seen": n_items,
+        "items_calibrated": len(items),
+        "iterations": n_iter,
+        "converged": bool(converged),
+        "seconds": round(time.perf_counter() - t0, 2),
+        "load_seconds": round(t_load, 2),
+    }
+
+    output_path = Path(output_path)
+    tmp_path = output_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({**summary, "items": items}, f)
+    tmp_path.replace(output_path)  # atomic: the app never sees a half-written bank
+
+    print(f"Calibrated {len(items)}/{n_items} items from {y.size} responses "
+          f"({n_users} users) in {summary['seconds']}s -> {output_path}")
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit per-item difficulty/discrimination "
+                                                 "from recorded quiz and level-test answers.")
+    parser.add_argument("--responses", type=Path, default=RESPONSES_PATH)
+    parser.add_argument("--output", type=Path, default=ITEM_BANK_PATH)
+    parser.add_argument("--min-responses", type=int, default=20,
+                        help="Items with fewer answers are left out of the bank.")
+    parser.add_argument("--max-iter", type=int, default=100)
+    args = parser.parse_args(argv)
+    calibrate(args.responses, args.output, args.min_responses, args.max_iter)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Character trigram language identifier for generated content.
+
+The prompts ask for content "entirely in <language>", this checks it. Each
+language has a profile: log-probabilities of hashed character trigrams
+(NUM_BUCKETS buckets), estimated once from lexicon/samples/<language>.txt plus
+the forms of lexicon/<language>.txt. English has a sample but no lexicon: it is
+the language that leaks into generated quizzes most often.
+
+Scoring is vectorized over a whole batch: the texts are joined, encoded as
+code points and hashed into trigram buckets in one pass, then the profile
+log-probabilities of the trigrams are summed per text with np.bincount.
+
+Usage (from the language_learning_mentor directory):
+    python -m logic.language_id Italian "The cat is on the table." "Il gatto è sul tavolo."
+"""
+import re
+import sys
+import threading
+
+import numpy as np
+
+from logic.lexicon import LEXICON_DIR, Lexicon
+
+SAMPLES_DIR = LEXICON_DIR / "samples"
+NUM_BUCKETS = 1 << 14
+# A text violates the target language when another profile beats it by MARGIN
+# nats per trigram and MIN_EVIDENCE nats in total: single words (a few trigrams)
+# need a clear signal, a wrongly flagged item costs an LLM call
+MARGIN = 0.25
+MIN_EVIDENCE = 5.0
+
+_NON_LETTERS = re.compile(r"[^\w']+|[\d_]+")
+
+
+def _normalize(text):
+    """Lowercase words separated by single spaces, padded with a space on both sides."""
+    return " " + " ".join(_NON_LETTERS.sub(" ", str(text).lower()).split()) + " "
+
+
+def _buckets(texts):
+    """(row, bucket) of every character trigram of every text."""
+    joined = "\0".join(_normalize(t) for t in texts)
+    codes = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    if len(codes) < 3:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    a, b, c = codes[:-2], codes[1:-1], codes[2:]
+    valid = (a != 0) & (b != 0) & (c != 0)
+    rows = np.cumsum(codes == 0)[:-2]
+    hashes = (a * np.uint64(0x9E3779B1) + b) * np.uint64(0x85EBCA77) + c
+    return rows[valid].astype(np.int64), (hashes[valid] % np.uint64(NUM_BUCKETS)).astype(np.int64)
+
+
+class LanguageIdentifier:
+    """Hashed trigram profiles of a set of languages."""
+
+    def __init__(self, samples):
+        self.languages = sorted(samples)
+        counts = np.zeros((len(self.languages), NUM_BUCKETS))
+        for i, language in enumerate(self.languages):
+            _, buckets = _buckets([samples[language]])
+            counts[i] = np.bincount(buckets, minlength=NUM_BUCKETS)
+        counts += 0.5  # unseen trigrams are rare, not impossible
+        self._log_probs = np.log(counts / counts.sum(axis=1, keepdims=True)).T  # (buckets, languages)
+
+    @classmethod
+    def load(cls):
+        """Profiles of every language with a sample text (plus its lexicon forms, if any)."""
+        samples = {}
+        for path in sorted(SAMPLES_DIR.glob("*.txt")):
+            text = path.read_text(encoding="utf-8")
+            lexicon_path = LEXICON_DIR / path.name
+            if lexicon_path.exists():
+                text += " " + " ".join(f.form for f in Lexicon.load(path.stem, lexicon_path).forms)
+            samples[path.stem.capitalize()] = text
+        return cls(samples)
+
+    def scores(self, texts):
+        """(log-likelihoods (N, languages), trigram counts (N,)) of a batch of texts."""
+        rows, buckets = _buckets(texts)
+        log_probs = self._log_probs[buckets]  # (trigrams, languages)
+        scores = np.stack([np.bincount(rows, weights=log_probs[:, j], minlength=len(texts))
+                           for j in range(len(self.languages))], axis=1)
+        return scores, np.bincount(rows, minlength=len(texts))
+
+    def detect(self, text):
+        """Most likely language of a text."""
+        scores, _ = self.scores([text])
+        return self.languages[int(np.argmax(scores[0]))]
+
+    def violations(self, texts, language):
+        """
+        Boolean array: True for the texts clearly written in another language.
+        Languages without a profile are never flagged.
+        """
+        if not texts or language not in self.languages:
+            return np.zeros(len(texts), dtype=bool)
+        scores, n = self.scores(texts)
+        target = scores[:, self.languages.index(language)]
+        gap = scores.max(axis=1) - target
+        return (gap > MIN_EVIDENCE) & (gap > MARGIN * np.maximum(n, 1))
+
+
+# --- Process-wide instance ---
+_identifier = None
+_identifier_lock = threading.Lock()
+
+def get_language_identifier():
+    global _identifier
+    with _identifier_lock:
+        if _identifier is None:
+            _identifier = LanguageIdentifier.load()
+        return _identifier
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2:
+        print('usage: python -m logic.language_id <language> "<text>" ["<text>" ...]')
+        return 2
+    identifier = get_language_identifier()
+    flagged = identifier.violations(argv[1:], argv[0])
+    for text, bad in zip(argv[1:], flagged):
+        print(f"{identifier.detect(text):<8} {'VIOLATION' if bad else 'ok':<9} {text}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,52 +1,352 @@
 import threading
 import json
-from crewai import Crew, Process
-from crewai.project import CrewBase, agent, crew, task
-from tools.calculator import QuizCalculator
-from tools.email_sender import EmailSender
-from crew import LanguageMentor
+import logging
+import time
+from logic.response_log import item_id, load_item_bank
+from logic import metrics
+from logic.tracing import TRACER
+from logic.logging_setup import agents_verbose
+from logic.difficulty import estimate_level, get_difficulty_table, level_index
+from logic.language_id import get_language_identifier
+from logic.lexicon import get_lexicon
+from logic.quiz_queue import get_quiz_queue
+from logic.usage_ledger import (BudgetExceeded, CACHED_ONLY, FALLBACK,
+                                 get_usage_ledger)
 import os
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+# Quizzes generated per quiz_agent call for a user (the extra ones are queued)
+QUIZ_BATCH_SIZE = int(os.getenv("MENTOR_QUIZ_BATCH", "3"))
+
+# How many levels a quiz question's estimated level may be off before it is moved or dropped
+LEVEL_TOLERANCE = int(os.getenv("MENTOR_LEVEL_TOLERANCE", "1"))
+
+# Agent (key in agents.yaml) that runs each task
+TASK_AGENTS = {"level_task": "level_detector", "tip_task": "tip_agent", "quiz_task": "quiz_agent"}
 
 class LanguageProcessor:
     """
     Handles language-specific logic by delegating to CrewAI tasks and agents.
     Runs potentially blocking calls in background threads to keep the UI responsive.
+
+    The CrewAI / LangChain stack takes seconds to import, so it is only imported
+    and the LanguageMentor crew built on first use (or by warm_up() in the
+    background), never at construction time.
     """
-    def __init__(self):
-        self.language_crew = LanguageMentor()
+    def __init__(self, output_dir: str = "", quiz_queue=None):
+        self._language_crew = None
+        self._crew_lock = threading.Lock()
+        # Relative directory for the tasks' output files; pooled processors get
+        # one each so concurrent requests never read each other's quizzes.json
+        self.output_dir = output_dir
+        # Calibrated difficulties fitted offline by logic/item_calibration.py
+        self.item_bank = load_item_bank()
+        # Per user/day/agent token accounting and daily budgets
+        self.ledger = get_usage_ledger()
+        # Shared by the app's processors unless one is given (the CLI uses a throwaway one)
+        self.quiz_queue = quiz_queue if quiz_queue is not None else get_quiz_queue()
+
+    @property
+    def language_crew(self):
+        """The LanguageMentor crew, imported and built on first access."""
+        if self._language_crew is None:
+            with self._crew_lock:
+                if self._language_crew is None:
+                    from crew import LanguageMentor
+                    self._language_crew = LanguageMentor()
+        return self._language_crew
+
+    def warm_up(self):
+        """Imports the LLM stack and loads the agent/task YAML ahead of the first request."""
+        from crewai import Crew, Process  # noqa: F401  (import cost paid here)
+        return self.language_crew
+
+    def _annotate_with_calibration(self, question: dict) -> dict:
+        """Attaches the calibrated difficulty to a question, if it has been seen before."""
+        if not isinstance(question, dict) or "question" not in question:
+            return question
+        qid = item_id(question["question"])
+        question["item_id"] = qid
+        calibrated = self.item_bank.get(qid)
+        if calibrated:
+            question["difficulty"] = calibrated["difficulty"]
+            question["calibrated_level"] = calibrated["level"]
+        return question
 
-    def _run_single_task(self, task_obj, input_variables: dict) -> str:
+    @staticmethod
+    def _estimate_difficulty(question: dict, language: str) -> dict:
+        """Attaches the local difficulty estimate (score in [0, 1] and level) to a question."""
+        table = get_difficulty_table(language)
+        if table is not None and isinstance(question.get("question"), str):
+            score = table.score(question["question"], question.get("answer", ""))
+            question["estimated_difficulty"] = score
+            question["estimated_level"] = estimate_level(score)
+        return question
+
+    def _check_levels(self, quizzes: list, user_language: str, user_level: str,
+                      num_questions: int, username: str | None = None) -> list:
+        """
+        Keeps the questions whose level (calibrated if known, else estimated) is
+        within LEVEL_TOLERANCE of the requested one. The others are re-bucketed:
+        queued for the user as quizzes of their own level when they fill whole
+        quizzes, dropped otherwise. Returns the non-empty quizzes left.
+        """
+        wanted = level_index(user_level)
+        if wanted is None:
+            # A level name the scale doesn't know: no basis for moving anything
+            logger.warning("Unknown level %r: quiz level check skipped.", user_level)
+            return [quiz for quiz in quizzes if quiz]
+        kept, moved = [], {}
+        for quiz in quizzes:
+            fit = []
+            for q in quiz:
+                self._estimate_difficulty(q, user_language)
+                level = q.get("calibrated_level") or q.get("estimated_level")
+                index = level_index(level)
+                if index is None or abs(index - wanted) <= LEVEL_TOLERANCE:
+                    fit.append(q)
+                else:
+                    moved.setdefault(level, []).append(q)
+            metrics.LEVEL_CHECKS.inc(len(fit), task="quiz_task", result="fit")
+            if fit:
+                kept.append(fit)
+        for level, questions in moved.items():
+            whole = len(questions) - len(questions) % num_questions if username else 0
+            if whole:
+                self.quiz_queue.push(username, user_language, level, num_questions,
+                                     [questions[i:i + num_questions] for i in range(0, whole, num_questions)])
+                metrics.LEVEL_CHECKS.inc(whole, task="quiz_task", result="rebucketed")
+            if len(questions) > whole:
+                metrics.LEVEL_CHECKS.inc(len(questions) - whole, task="quiz_task", result="rejected")
+        return kept
+
+    def _select_agent(self, task_obj, username):
+        """
+        The agent that runs the task for this user today: the configured one,
+        its fallback model once the user's budget is spent, or BudgetExceeded.
+        """
+        agent_name = TASK_AGENTS[task_obj.name]
+        tier = self.ledger.budget_tier(username)
+        if tier == CACHED_ONLY:
+            metrics.BUDGET_DEGRADATIONS.inc(task=task_obj.name, tier=tier)
+            raise BudgetExceeded(f"Daily AI budget used up for {username}; try again tomorrow.")
+        primary = getattr(self.language_crew, agent_name)()
+        if tier == FALLBACK:
+            fallback = self.language_crew.fallback_agent(agent_name)
+            if fallback is not None:
+                metrics.BUDGET_DEGRADATIONS.inc(task=task_obj.name, tier=tier)
+                return agent_name, fallback
+        return agent_name, primary
+
+    def _run_single_task(self, task_obj, input_variables: dict, username: str | None = None) -> str:
         """
         Helper per creare una Crew temporanea e farla girare con input dinamico.
+        Token usage is charged to `username` (None for batch jobs, never throttled).
         """
-        template = self.language_crew.task_templates.get(task_obj.description)
+        from crewai import Crew, Process
+
+        agent_name, agent = self._select_agent(task_obj, username)
+        task_obj.agent = agent  # Task objects are memoized: set the agent on every call
 
-        if template:
-            input_text = template
-            for key, value in input_variables.items():
-                input_text = input_text.replace(f"{{{{ {key} }}}}", str(value))
-            input_variables["task"] = input_text
-            #print(f"[DEBUG] Generated input from template: {input_text}")
-            task_obj.description = input_text
+        with TRACER.span("crew.render_prompt"):
+            template = self.language_crew.task_templates.get(task_obj.description)
+
+            if template:
+                input_text = template
+                for key, value in input_variables.items():
+                    input_text = input_text.replace(f"{{{{ {key} }}}}", str(value))
+                input_variables["task"] = input_text
+                #print(f"[DEBUG] Generated input from template: {input_text}")
+                task_obj.description = input_text
+                # Task objects are memoized by CrewBase: keep the template reachable
+                # from the rendered description so the next call can render it again
+                self.language_crew.task_templates[input_text] = template
+
+            if task_obj.output_file:
+                task_obj.output_file = self._output_path(os.path.basename(task_obj.output_file))
 
         # Crea una Crew temporanea con l'agente e il task specificato
-        temp_crew = Crew(
-            agents=[task_obj.agent],
-            tasks=[task_obj],
-            process=Process.sequential,
-            verbose=True
-        )
+        with TRACER.span("crew.build"):
+            temp_crew = Crew(
+                agents=[task_obj.agent],
+                tasks=[task_obj],
+                process=Process.sequential,
+                verbose=agents_verbose()  # CrewAI traces only when MENTOR_VERBOSE_AGENTS=1
+            )
 
         #print(f"[DEBUG] Running task with input variables: {input_variables}")
-        result = temp_crew.kickoff(inputs=input_variables)
+        labels = {"agent": getattr(agent, "role", "unknown"), "task": task_obj.name or "unknown"}
+        executions_before = getattr(agent, "_times_executed", 0)
+        start = time.perf_counter()
+        try:
+            with TRACER.span("crew.kickoff", **labels) as span:
+                result = temp_crew.kickoff(inputs=input_variables)
+                usage = getattr(result, "token_usage", None)
+                if usage is not None:
+                    span.set_attribute("llm.prompt_tokens", usage.prompt_tokens)
+                    span.set_attribute("llm.completion_tokens", usage.completion_tokens)
+        except Exception:
+            metrics.LLM_CALLS.inc(outcome="error", **labels)
+            raise
+        finally:
+            metrics.LLM_CALL_SECONDS.observe(time.perf_counter() - start, **labels)
+            # The agent counts failed executions it retried (up to max_retry_limit)
+            retries = getattr(agent, "_times_executed", 0) - executions_before
+            if retries > 0:
+                metrics.LLM_RETRIES.inc(retries, **labels)
+        metrics.LLM_CALLS.inc(outcome="ok", **labels)
+        self._record_token_usage(result, labels)
+        self._charge_usage(result, username, agent_name, agent)
 
         #print(f"[DEBUG] Raw result from Crew: {result}")
 
         return result
 
-    def generate_daily_tip(self, user_level: str, user_language: str) -> str:
+    @staticmethod
+    def _record_token_usage(result, labels):
+        usage = getattr(result, "token_usage", None)
+        if usage is None:
+            return
+        metrics.LLM_PROMPT_TOKENS.inc(getattr(usage, "prompt_tokens", 0) or 0, **labels)
+        metrics.LLM_COMPLETION_TOKENS.inc(getattr(usage, "completion_tokens", 0) or 0, **labels)
+        metrics.LLM_REQUESTS.inc(getattr(usage, "successful_requests", 0) or 0, **labels)
+
+    def _charge_usage(self, result, username, agent_name, agent):
+        usage = getattr(result, "token_usage", None)
+        self.ledger.record(username, agent_name, getattr(agent.llm, "model", "unknown"),
+                           prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+                           completion_tokens=getattr(usage, "completion_tokens", 0) or 0,
+                           requests=getattr(usage, "successful_requests", 0) or 0)
+
+    def _remember_questions(self, task, user_language, user_level, questions):
+        """
+        Persists the last valid questions per (task, language, level) in the quiz
+        queue's SQLite file: served instead of calling the LLM to users who are
+        out of budget for the day, by any processor and after a restart.
+        """
+        if questions:
+            try:
+                self.quiz_queue.remember(task, user_language, user_level, questions)
+            except sqlite3.Error as e:
+                logger.warning("Could not store the last %s questions: %s", task, e)
+
+    def _recent(self, task, user_language, user_level, error):
+        """The last questions generated for the group, or re-raises `error`."""
+        try:
+            questions = self.quiz_queue.recent(task, user_language, user_level)
+        except sqlite3.Error as e:
+            logger.warning("Could not read the last %s questions: %s", task, e)
+            questions = None
+        if not questions:
+            raise error
+        return questions
+
+    def _read_output(self, filename: str, task: str) -> list:
+        """
+        Reads and parses a task's JSON output file into a list (items may be nested lists).
+        Every rejected output is counted in the validation-failure metric.
+        """
+        try:
+            with TRACER.span("output.read", file=filename):
+                with open(os.path.abspath(self._output_path(filename)), 'r', encoding='utf-8') as file:
+                    raw = file.read()
+        except FileNotFoundError:
+            metrics.VALIDATION_FAILURES.inc(task=task, reason="missing_output")
+            raise
+        try:
+            with TRACER.span("output.parse", bytes=len(raw)):
+                data = json.loads(raw)
+        except ValueError:
+            metrics.VALIDATION_FAILURES.inc(task=task, reason="invalid_json")
+            raise
+        if isinstance(data, dict):
+            data = [data]
+        if not isinstance(data, list):
+            metrics.VALIDATION_FAILURES.inc(task=task, reason="not_a_list")
+            return []
+        return data
+
+    def _load_questions(self, filename: str, task: str) -> list:
+        """Reads a task's JSON output file and keeps the well-formed questions."""
+        data = self._read_output(filename, task)
+        items = [q for entry in data for q in (entry if isinstance(entry, list) else [entry])]
+        questions = []
+        for q in items:
+            if isinstance(q, dict) and all(key in q for key in ("question", "options", "answer")):
+                questions.append(self._annotate_with_calibration(q))
+            else:
+                metrics.VALIDATION_FAILURES.inc(task=task, reason="missing_fields")
+        return questions
+
+    @staticmethod
+    def _check_quiz_question(q, lexicon=None):
+        """
+        Returns (question, None) with the answer normalized to the text of one of
+        the options (what QuizScreen compares against), or (None, reason).
+        Questions without options get them from the language's lexicon.
+        """
+        if isinstance(q, dict) and "question" not in q and "sentence" in q:
+            q = dict(q, question=q["sentence"])  # the prompt calls it a 'sentence'
+        if (lexicon is not None and isinstance(q, dict) and "options" not in q
+                and isinstance(q.get("question"), str) and isinstance(q.get("answer"), str)):
+            options = lexicon.make_options(q["answer"], seed=int(item_id(q["question"]), 16))
+            if options is None:
+                return None, "no_distractors"
+            q = dict(q, options=options)
+        if not isinstance(q, dict) or not all(key in q for key in ("question", "options", "answer")):
+            return None, "missing_fields"
+        options = q["options"]
+        if (not isinstance(options, list) or len(options) < 2
+                or not all(isinstance(o, str) and o.strip() for o in options)):
+            return None, "bad_options"
+        if len({o.strip().lower() for o in options}) != len(options):
+            return None, "duplicate_options"
+        answer = q["answer"]
+        if isinstance(answer, int) and not isinstance(answer, bool) and 0 <= answer < len(options):
+            answer = options[answer]  # zero-based index instead of the text
+        if answer not in options:
+            matches = [o for o in options if o.strip().lower() == str(answer).strip().lower()]
+            if not matches:
+                return None, "answer_not_in_options"
+            answer = matches[0]
+        return dict(q, answer=answer), None
+
+    def _load_quizzes(self, filename: str, num_questions: int, language: str | None = None) -> list:
+        """
+        Reads quiz_task's output as a list of quizzes (lists of validated questions).
+        Nested arrays are one quiz each; loose questions are split num_questions at a time.
+        """
+        data = self._read_output(filename, "quiz_task")
+        lexicon = get_lexicon(language) if language else None
+        groups = [entry for entry in data if isinstance(entry, list)]
+        loose = [entry for entry in data if not isinstance(entry, list)]
+        groups += [loose[i:i + num_questions] for i in range(0, len(loose), num_questions)]
+        quizzes = []
+        for group in groups:
+            quiz = []
+            for q in group:
+                question, reason = self._check_quiz_question(q, lexicon)
+                if question is None:
+                    metrics.VALIDATION_FAILURES.inc(task="quiz_task", reason=reason)
+                else:
+                    quiz.append(self._annotate_with_calibration(question))
+            if quiz:
+                quizzes.append(quiz)
+            else:
+                metrics.VALIDATION_FAILURES.inc(task="quiz_task", reason="empty_quiz")
+        return quizzes
+
+    def _output_path(self, filename: str) -> str:
+        """Path (relative to the working directory) of a task output file."""
+        return os.path.join(self.output_dir, filename) if self.output_dir else filename
+
+    def generate_daily_tip(self, user_level: str, user_language: str,
+                           username: str | None = None) -> str:
         """
         Generate a daily language learning tip using the tip_agent inside a Crew.
+        Raises BudgetExceeded if the user is out of budget (callers serve a cached tip).
         """
         tip_task = self.language_crew.tip_task()
 
@@ -56,40 +356,124 @@ class LanguageProcessor:
                 "user_level": user_level,
                 "language": user_language,
                 "task": "Generate a daily language learning tip"
-            }
+            },
+            username=username
         )
         return str(response).strip()
     
-    def prepare_quiz_data(self, user_level: str, user_language: str, num_questions: int = 5) -> list:
+    def prepare_quiz_batch(self, user_level: str, user_language: str, num_quizzes: int = QUIZ_BATCH_SIZE,
+                           num_questions: int = 5, username: str | None = None) -> list:
+        """
+        Generates `num_quizzes` quizzes in one quiz_agent call.
+        Returns a list of quizzes, each a list of validated questions: questions
+        not in the target language are regenerated (_replace_wrong_language),
+        questions off the requested level are re-bucketed or dropped (_check_levels).
+        """
+        quizzes = self._generate_quizzes(user_level, user_language, num_quizzes, num_questions, username)
+        quizzes = self._replace_wrong_language(quizzes, user_level, user_language, username)
+        return self._check_levels(quizzes, user_language, user_level, num_questions, username)
+
+    def _generate_quizzes(self, user_level, user_language, num_quizzes, num_questions, username=None):
+        """One quiz_task run: returns its validated quizzes."""
+        with TRACER.span("crew.load"):  # first call imports crewai and builds the crew
+            quiz_task = self.language_crew.quiz_task()
+
+        self._run_single_task(
+            quiz_task,
+            input_variables={
+                "user_level": user_level,
+                "language": user_language,
+                "num_quizzes": num_quizzes,
+                "num_questions": num_questions,
+                "task": f"Create {num_quizzes} language quizzes in the target language: {user_language}. Based on the user's level: {user_level}. Each quiz should contain {num_questions} questions. Use the target language in the questions and answers."
+            },
+            username=username
+        )
+        return self._load_quizzes("quizzes.json", num_questions, user_language)
+
+    def _wrong_language(self, questions: list, language: str, task: str) -> set:
+        """
+        Indices of the questions whose sentence or options are not in `language`
+        (options found in the language's lexicon are trusted without scoring).
+        """
+        lexicon = get_lexicon(language)
+        texts, owners = [], []
+        for i, q in enumerate(questions):
+            # Options are scored together: one word alone is too little evidence
+            unknown = [str(o) for o in q.get("options", [])
+                       if lexicon is None or not lexicon.lookup(str(o))]
+            texts += [str(q.get("question", "")), " ".join(unknown)]
+            owners += [i, i]
+        with TRACER.span("output.language_check", texts=len(texts)):
+            flagged = get_language_identifier().violations(texts, language)
+        wrong = {owners[j] for j, bad in enumerate(flagged) if bad}
+        if wrong:
+            metrics.VALIDATION_FAILURES.inc(len(wrong), task=task, reason="wrong_language")
+        return wrong
+
+    def _replace_wrong_language(self, quizzes, user_level, user_language, username=None):
+        """
+        Drops the questions not written in the target language and asks quiz_agent
+        once for just as many replacements, which are checked the same way.
+        """
+        positions = [(i, j) for i, quiz in enumerate(quizzes) for j in range(len(quiz))]
+        wrong = self._wrong_language([quizzes[i][j] for i, j in positions], user_language, "quiz_task")
+        if not wrong:
+            return quizzes
+        holes = [positions[k] for k in sorted(wrong)]
+        logger.info("%d question(s) not in %s: regenerating them", len(holes), user_language)
+        try:
+            fresh = [q for quiz in self._generate_quizzes(user_level, user_language, 1, len(holes), username)
+                     for q in quiz]
+        except Exception as e:
+            logger.warning("Could not regenerate the questions not in %s: %s", user_language, e)
+            fresh = []
+        bad = self._wrong_language(fresh, user_language, "quiz_task")
+        fresh = [q for k, q in enumerate(fresh) if k not in bad]
+        for (i, j), q in zip(holes, fresh):
+            quizzes[i][j] = q
+        dropped = set(holes[len(fresh):])
+        quizzes = [[q for j, q in enumerate(quiz) if (i, j) not in dropped] for i, quiz in enumerate(quizzes)]
+        return [quiz for quiz in quizzes if quiz]
+
+    def prepare_quiz_data(self, user_level: str, user_language: str, num_questions: int = 5,
+                          username: str | None = None) -> list:
         """
         Create a language quiz using the quiz_agent inside a Crew.
+        A user's quizzes are generated QUIZ_BATCH_SIZE at a time: the first is
+        returned, the others are queued and served by the next calls.
         If agent fails, return a basic fallback quiz.
+        Out of budget: the last quiz generated for the language/level, or BudgetExceeded.
         """
-        quiz_task = self.language_crew.quiz_task()
         questions = []
+        if username:
+            queued = self.quiz_queue.pop(username, user_language, user_level, num_questions)
+            metrics.CACHE_LOOKUPS.inc(cache="quiz_queue", result="hit" if queued else "miss")
+            if queued:
+                return queued
 
         try:
-            self._run_single_task(
-                quiz_task,
-                input_variables={
-                    "user_level": user_level,
-                    "language": user_language,
-                    "num_questions": num_questions,
-                    "task": f"Create a language quiz in the target language: {user_language}. Based on the user's level: {user_level}. The quiz should contain {num_questions} questions. Use the target language in the questions and answers."
-                }
-            )
-
-            filepath = os.path.abspath("quizzes.json")
-            with open(filepath, 'r', encoding='utf-8') as file:
-                raw_quizzes = json.load(file)
-            return raw_quizzes
+            # Without a user there is nobody to queue for: one quiz per call
+            quizzes = self.prepare_quiz_batch(user_level, user_language,
+                                              QUIZ_BATCH_SIZE if username else 1,
+                                              num_questions, username=username)
+            if not quizzes:
+                return questions
+            questions = quizzes[0]
+            self._remember_questions("quiz_task", user_language, user_level, questions)
+            if username and len(quizzes) > 1:
+                self.quiz_queue.push(username, user_language, user_level, num_questions, quizzes[1:])
+            return questions
 
+        except BudgetExceeded as e:
+            return self._recent("quiz_task", user_language, user_level, e)
         except Exception as e:
-            print(f"Error calling quiz agent: {e}")
+            logger.error("Error calling quiz agent: %s", e)
             return questions  
 
 
-    def prepare_detect_quiz(self, user_level: str, user_language: str) -> list:
+    def prepare_detect_quiz(self, user_level: str, user_language: str,
+                            username: str | None = None) -> list:
         """
         Analyze language proficiency using the level_detector agent inside a Crew.
         Returns a list of formatted quiz questions.
@@ -100,23 +484,34 @@ class LanguageProcessor:
         senteces = []
 
         try:
-            response = self._run_single_task(
-                level_task,
-                input_variables={
-                    "user_level": user_level,
-                    "language": user_language,
-                    "task": f"Create a language quiz to detect the user's level in the target language: {user_language}. You must use the target language in the questions and answers."
-                }
-            )
+            for attempt in range(2):  # one more try if the question is not in the target language
+                response = self._run_single_task(
+                    level_task,
+                    input_variables={
+                        "user_level": user_level,
+                        "language": user_language,
+                        "task": f"Create a language quiz to detect the user's level in the target language: {user_language}. You must use the target language in the questions and answers."
+                    },
+                    username=username
+                )
 
-            filepath = os.path.abspath("level_assessment.json")
-            with open(filepath, 'r', encoding='utf-8') as file:
-                sentences = json.load(file)
-                if isinstance(sentences, dict):
-                    sentences = [sentences]
-                return sentences
+                questions = self._load_questions("level_assessment.json", "level_task")
+                wrong = self._wrong_language(questions, user_language, "level_task")
+                questions = [q for k, q in enumerate(questions) if k not in wrong]
+                if not wrong:
+                    break
+            for q in questions:
+                # One question per level step: annotated and counted, never dropped
+                if "estimated_level" in self._estimate_difficulty(q, user_language) \
+                        and level_index(user_level) is not None:
+                    off = abs(level_index(q["estimated_level"]) - level_index(user_level)) > LEVEL_TOLERANCE
+                    metrics.LEVEL_CHECKS.inc(task="level_task", result="mismatch" if off else "fit")
+            self._remember_questions("level_task", user_language, user_level, questions)
+            return questions
+        except BudgetExceeded as e:
+            return self._recent("level_task", user_language, user_level, e)
         except Exception as e:
-            print(f"Error calling quiz agent: {e}")
+            logger.error("Error calling quiz agent: %s", e)
             return senteces
         
              
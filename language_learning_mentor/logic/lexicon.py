@@ -0,0 +1,174 @@
+"""
+Local lexicon per supported language (lexicon/<language>.txt).
+
+Every lemma carries its part of speech, an approximate frequency rank and its
+inflected forms with their features (gender/number, person, ...). quiz_task
+only asks the LLM for the sentence and the missing word; the other options
+are picked here: forms with the same part of speech and the same features
+(so they fit the blank grammatically) and the closest frequency rank (so they
+are about as well known as the answer). Words missing from the lexicon fall
+back to forms with the same ending.
+
+Usage (from the language_learning_mentor directory):
+    python -m logic.lexicon Italian mangia
+"""
+import logging
+import random
+import sys
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+from logic.config_manager import BASE_DIR
+
+logger = logging.getLogger(__name__)
+
+LEXICON_DIR = BASE_DIR / "lexicon"
+
+# Upper rank of frequency bands 1..3; rarer (or unknown) words are band 4
+FREQUENCY_BANDS = (250, 1000, 3000)
+NUM_DISTRACTORS = 3
+
+Form = namedtuple("Form", "form lemma pos features rank")
+
+
+def frequency_band(rank):
+    for band, limit in enumerate(FREQUENCY_BANDS, start=1):
+        if rank is not None and rank <= limit:
+            return band
+    return len(FREQUENCY_BANDS) + 1
+
+
+def _match_case(word, like):
+    if like.isupper() and len(like) > 1:
+        return word.upper()
+    return word[:1].upper() + word[1:] if like[:1].isupper() else word
+
+
+class Lexicon:
+    """Forms of one language, indexed by surface form and by (pos, features)."""
+
+    def __init__(self, language, forms):
+        self.language = language
+        self.forms = list(forms)
+        self._by_form = {}
+        grouped = {}
+        for f in self.forms:
+            self._by_form.setdefault(f.form.lower(), []).append(f)
+            grouped.setdefault((f.pos, f.features), []).append(f)
+            grouped.setdefault(f.pos, []).append(f)
+        # Per (pos, features) and per pos: the forms and their log-ranks, for nearest-rank lookups
+        self._groups = {key: (group, np.log(np.array([f.rank for f in group], dtype=np.float64)))
+                        for key, group in grouped.items()}
+        # Ambiguous forms (e.g. 'sono', 'parte'): lookup() returns the most frequent reading first
+        for entries in self._by_form.values():
+            entries.sort(key=lambda f: f.rank)
+
+    @classmethod
+    def load(cls, language, path=None):
+        """Parses lexicon/<language>.txt ('lemma POS rank form:features ...' per line)."""
+        path = path or LEXICON_DIR / f"{language.lower()}.txt"
+        forms = []
+        with open(path, encoding="utf-8") as f:
+            for lineno, line in enumerate(f, start=1):
+                line = line.split("#", 1)[0].strip()
+                if not line:
+                    continue
+                try:
+                    lemma, pos, rank, *entries = line.split()
+                    for entry in entries:
+                        form, features = entry.rsplit(":", 1)
+                        forms.append(Form(form, lemma, pos, features, int(rank)))
+                except ValueError:
+                    logger.warning("%s:%d: malformed lexicon line skipped", path, lineno)
+        return cls(language, forms)
+
+    def lookup(self, word):
+        """Readings of a surface form (case-insensitive), most frequent first."""
+        return self._by_form.get(word.strip().lower(), [])
+
+    def rank(self, word):
+        readings = self.lookup(word)
+        return readings[0].rank if readings else None
+
+    def band(self, word):
+        return frequency_band(self.rank(word))
+
+    def distractors(self, answer, k=NUM_DISTRACTORS, seed=0):
+        """
+        k wrong options for `answer`, or None if the lexicon can't provide them.
+        Candidates share part of speech and features with the answer; among the
+        2k closest in frequency, k are drawn with `seed` (same question, same options).
+        """
+        answer = answer.strip()
+        if not answer or " " in answer:
+            return None
+        rng = random.Random(seed)
+        for reading in self.lookup(answer):
+            picks, seen = [], {answer.lower()}
+            # Same features first; small closed classes (e.g. 'du'/'au') borrow from the same POS
+            for key in ((reading.pos, reading.features), reading.pos):
+                group, log_ranks = self._groups[key]
+                distance = np.abs(log_ranks - np.log(reading.rank))
+                for i in np.argsort(distance, kind="stable"):
+                    f = group[i]
+                    if len(picks) < 2 * k and f.lemma != reading.lemma and f.form.lower() not in seen:
+                        seen.add(f.form.lower())
+                        picks.append(f.form)
+                if len(picks) >= k:
+                    return [_match_case(w, answer) for w in rng.sample(picks, k)]
+        return self._by_ending(answer, k, rng)
+
+    def _by_ending(self, answer, k, rng):
+        """Unknown word: forms with the same last two letters, preferring similar lengths."""
+        ending, lowered = answer[-2:].lower(), answer.lower()
+        candidates = sorted({f.form for f in self.forms
+                             if f.form.lower().endswith(ending) and f.form.lower() != lowered
+                             and f.pos in ("NOUN", "VERB", "ADJ", "ADV")},
+                            key=lambda w: (abs(len(w) - len(answer)), w))[:2 * k]
+        if len(candidates) < k:
+            return None
+        return [_match_case(w, answer) for w in rng.sample(candidates, k)]
+
+    def make_options(self, answer, k=NUM_DISTRACTORS, seed=0):
+        """Answer plus k distractors, the answer at a seed-dependent position; None if unavailable."""
+        wrong = self.distractors(answer, k, seed)
+        if wrong is None:
+            return None
+        options = list(wrong)
+        options.insert(seed % (k + 1), answer.strip())
+        return options
+
+
+# --- Process-wide instances ---
+_lexicons = {}
+_lexicons_lock = threading.Lock()
+
+def get_lexicon(language):
+    """The language's Lexicon (loaded once), or None if there is no lexicon file for it."""
+    key = (language or "").strip().lower()
+    with _lexicons_lock:
+        if key not in _lexicons:
+            path = LEXICON_DIR / f"{key}.txt"
+            _lexicons[key] = Lexicon.load(language, path) if key and path.exists() else None
+        return _lexicons[key]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print("usage: python -m logic.lexicon <language> <word>")
+        return 2
+    lexicon = get_lexicon(argv[0])
+    if lexicon is None:
+        print(f"No lexicon for {argv[0]}")
+        return 1
+    for f in lexicon.lookup(argv[1]):
+        print(f"{f.form}: {f.pos} {f.features} (lemma {f.lemma}, rank {f.rank}, band {frequency_band(f.rank)})")
+    print("options:", lexicon.make_options(argv[1]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
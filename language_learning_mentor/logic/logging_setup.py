@@ -0,0 +1,103 @@
+"""
+Logging configuration shared by the desktop app, the service and the CLIs.
+
+Modules log through `logging.getLogger(__name__)`; the entry points call
+setup_logging() once. Records are put on a queue by a QueueHandler and
+formatted/written by a QueueListener thread, so the GUI thread and request
+handlers never wait on console or file I/O.
+
+Environment variables:
+  MENTOR_LOG_LEVEL        root level (default INFO)
+  MENTOR_LOG_LEVELS       per-module levels, e.g. "gui=WARNING,logic.tip_cache=DEBUG"
+  MENTOR_LOG_FILE         also write to this file
+  MENTOR_LOG_FORMAT       "text" (default) or "json" (one JSON object per line)
+  MENTOR_VERBOSE_AGENTS   1 to turn on CrewAI's verbose agent/crew console traces
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+TEXT_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def agents_verbose():
+    """Whether CrewAI agents and crews print their reasoning traces (off by default)."""
+    return os.getenv("MENTOR_VERBOSE_AGENTS", "0").lower() in ("1", "true", "yes")
+
+
+def parse_module_levels(spec):
+    """'gui=WARNING, logic.tip_cache=debug' -> {'gui': 'WARNING', 'logic.tip_cache': 'DEBUG'}"""
+    levels = {}
+    for part in (spec or "").split(","):
+        name, sep, level = part.partition("=")
+        if sep and name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging(level=None, module_levels=None, log_file=None, fmt=None, stream=None):
+    """Configures the root logger with a queue handler. Safe to call more than once."""
+    global _listener
+    level = (level or os.getenv("MENTOR_LOG_LEVEL") or "INFO").upper()
+    if module_levels is None:
+        module_levels = parse_module_levels(os.getenv("MENTOR_LOG_LEVELS"))
+    log_file = log_file or os.getenv("MENTOR_LOG_FILE")
+    fmt = (fmt or os.getenv("MENTOR_LOG_FORMAT") or "text").lower()
+
+    formatter = JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT)
+    handlers = [logging.StreamHandler(stream or sys.stderr)]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    if _listener is not None:
+        _listener.stop()
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+    for name, module_level in module_levels.items():
+        logging.getLogger(name).setLevel(module_level)
+
+    # Chatty third-party loggers stay at WARNING unless asked for explicitly
+    for name in ("httpx", "httpcore", "urllib3", "LiteLLM", "opentelemetry"):
+        if name not in module_levels:
+            logging.getLogger(name).setLevel(logging.WARNING)
+    return _listener
+
+
+def shutdown_logging():
+    """Flushes the queue (called automatically at exit)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
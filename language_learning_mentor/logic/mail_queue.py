@@ -0,0 +1,401 @@
+"""
+Outbound email delivery: durable queue + pooled SMTP connections.
+
+Callers (quiz results, batch jobs) only enqueue; messages are
+persisted in a small SQLite outbox and sent by background workers that reuse
+authenticated SMTP connections instead of connecting, STARTTLS-ing and logging
+in for every message. Temporary failures are retried with exponential backoff.
+The outbox is shared by the app, the service and the digest job: a claimed
+message records when it was claimed, and only claims older than CLAIM_TIMEOUT
+(left "sending" by a crashed process) are taken over by another one.
+Processes start delivering at startup when the outbox has unsent mail
+(resume_pending_delivery), not only on their first enqueue.
+
+SMTP settings come from the same environment variables as before:
+SMTP_SERVER, SMTP_PORT, EMAIL_USER, EMAIL_PASSWORD, EMAIL_FROM
+(plus SMTP_STARTTLS=0 to disable STARTTLS, e.g. for a local relay).
+"""
+import logging
+import os
+import random
+import smtplib
+import sqlite3
+import threading
+import time
+from email.mime.text import MIMEText
+
+from dotenv import load_dotenv
+
+from logic.config_manager import DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_PATH = DATA_DIR / "outbox.sqlite3"
+
+MAX_ATTEMPTS = 6
+BACKOFF_BASE = 5.0       # seconds before the first retry, doubled on each attempt
+BACKOFF_MAX = 15 * 60.0
+# A message "sending" for longer than this belongs to a crashed process
+CLAIM_TIMEOUT = float(os.getenv("MENTOR_MAIL_CLAIM_TIMEOUT", 15 * 60))
+# Sent messages are deleted after this long. Their dedup_key goes with them, so
+# keep it longer than a job may be rerun (the tip digest reruns within its day).
+SENT_RETENTION = float(os.getenv("MENTOR_MAIL_SENT_RETENTION_DAYS", 7)) * 86400
+PURGE_INTERVAL = 3600.0  # seconds between purges by an idle delivery worker
+
+
+class Outbox:
+    """SQLite-backed durable queue of outbound messages."""
+
+    def __init__(self, path=OUTBOX_PATH, claim_timeout=CLAIM_TIMEOUT):
+        self.path = str(path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)  # data dir is created on first use
+        self.claim_timeout = claim_timeout
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                recipient TEXT NOT NULL,
+                subject TEXT NOT NULL,
+                body TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                claimed_at REAL,
+                dedup_key TEXT
+            )""")
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(messages)")}
+        for column in ('claimed_at REAL', 'dedup_key TEXT'):  # outboxes created before they existed
+            if column.split()[0] not in columns:
+                self._conn.execute(f"ALTER TABLE messages ADD COLUMN {column}")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_due ON messages (status, next_attempt_at)")
+        self._conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_dedup ON messages (dedup_key) "
+                           "WHERE dedup_key IS NOT NULL")
+
+    def enqueue_many(self, messages):
+        """
+        Adds (recipient, subject, body[, dedup_key]) tuples in one transaction.
+        A message whose dedup_key is already in the outbox is skipped, so a job
+        rerun after a crash does not mail twice. Returns the count added.
+        """
+        now = time.time()
+        rows = [(r, s, b, now, now, key[0] if key else None) for r, s, b, *key in messages]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO messages (recipient, subject, body, next_attempt_at, created_at, "
+                "dedup_key) VALUES (?, ?, ?, ?, ?, ?)", rows)
+            added = self._conn.total_changes - before
+            self._conn.execute("COMMIT")
+        return added
+
+    def claim(self, limit):
+        """
+        Marks up to `limit` due messages as sending and returns them. Messages
+        another process claimed more than claim_timeout ago (it crashed mid-send)
+        are due again; recent claims are left to their owner.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            rows = self._conn.execute(
+                "SELECT id, recipient, subject, body, attempts FROM messages "
+                "WHERE (status = 'pending' AND next_attempt_at <= ?) "
+                "OR (status = 'sending' AND (claimed_at IS NULL OR claimed_at < ?)) "
+                "ORDER BY next_attempt_at LIMIT ?",
+                (now, now - self.claim_timeout, limit)).fetchall()
+            self._conn.executemany("UPDATE messages SET status = 'sending', claimed_at = ? WHERE id = ?",
+                                   [(now, row[0]) for row in rows])
+            self._conn.execute("COMMIT")
+        return rows
+
+    def mark_sent(self, msg_id):
+        with self._lock:
+            self._conn.execute("UPDATE messages SET status = 'sent', attempts = attempts + 1, "
+                               "last_error = NULL WHERE id = ?", (msg_id,))
+
+    def mark_failed(self, msg_id, attempts, error, permanent=False,
+                    backoff_base=BACKOFF_BASE, max_attempts=MAX_ATTEMPTS):
+        """Schedules a retry with exponential backoff, or gives up."""
+        attempts += 1
+        if permanent or attempts >= max_attempts:
+            status, next_at = 'failed', time.time()
+        else:
+            delay = min(BACKOFF_MAX, backoff_base * 2 ** (attempts - 1))
+            status, next_at = 'pending', time.time() + delay * random.uniform(0.8, 1.2)
+        with self._lock:
+            self._conn.execute("UPDATE messages SET status = ?, attempts = ?, next_attempt_at = ?, "
+                               "last_error = ? WHERE id = ?",
+                               (status, attempts, next_at, str(error)[:500], msg_id))
+
+    def purge_sent(self, max_age=SENT_RETENTION):
+        """Deletes messages sent more than `max_age` seconds ago. Returns the count."""
+        with self._lock:
+            return self._conn.execute("DELETE FROM messages WHERE status = 'sent' AND claimed_at < ?",
+                                      (time.time() - max_age,)).rowcount
+
+    def counts(self):
+        with self._lock:
+            return dict(self._conn.execute(
+                "SELECT status, COUNT(*) FROM messages GROUP BY status").fetchall())
+
+    def has_unsent(self):
+        """True if there are messages pending or left sending."""
+        counts = self.counts()
+        return bool(counts.get('pending') or counts.get('sending'))
+
+    def next_due_in(self):
+        """Seconds until the next pending message is due (None if there is none)."""
+        with self._lock:
+            row = self._conn.execute("SELECT MIN(next_attempt_at) FROM messages "
+                                     "WHERE status = 'pending'").fetchone()
+        return None if row[0] is None else max(0.0, row[0] - time.time())
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class SMTPConnectionPool:
+    """Keeps authenticated SMTP connections open and hands them out to senders."""
+
+    def __init__(self, host=None, port=None, username=None, password=None,
+                 starttls=None, size=4, timeout=30, idle_check=30.0):
+        self.host = host or os.getenv("SMTP_SERVER")
+        self.port = int(port or os.getenv("SMTP_PORT") or 587)
+        self.username = username if username is not None else os.getenv("EMAIL_USER")
+        self.password = password if password is not None else os.getenv("EMAIL_PASSWORD")
+        if starttls is None:
+            starttls = os.getenv("SMTP_STARTTLS", "1").lower() not in ("0", "false", "no")
+        self.starttls = starttls
+        self.size = size
+        self.timeout = timeout
+        self.idle_check = idle_check
+        self._idle = []                 # (connection, last_used)
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def _connect(self):
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        server.ehlo()
+        if self.starttls:
+            server.starttls()
+            server.ehlo()
+        if self.username:
+            server.login(self.username, self.password)
+        with self._lock:
+            self.connections_opened += 1
+        return server
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                server, last_used = self._idle.pop()
+            # Connections idle for a while may have been dropped by the server
+            if time.monotonic() - last_used < self.idle_check:
+                return server
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except (smtplib.SMTPException, OSError):  # reset/timed-out sockets raise OSError
+                pass
+            self._close(server)
+        return self._connect()
+
+    def release(self, server, broken=False):
+        if broken:
+            self._close(server)
+            return
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append((server, time.monotonic()))
+                return
+        self._close(server)
+
+    def _close(self, server):
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for server, _ in idle:
+            self._close(server)
+
+
+class MailDelivery:
+    """Background workers draining the outbox through the connection pool."""
+
+    def __init__(self, outbox=None, pool=None, workers=4, batch_size=50,
+                 sender=None, backoff_base=BACKOFF_BASE):
+        self.outbox = outbox or Outbox()
+        self.pool = pool or SMTPConnectionPool(size=workers)
+        self.workers = workers
+        self.batch_size = batch_size
+        self.sender = sender or os.getenv("EMAIL_FROM")
+        self.backoff_base = backoff_base
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads = []
+        self._next_purge = 0.0
+
+    # ------------------------------------------------------------------ API
+    def enqueue(self, recipient, subject, body):
+        self.outbox.enqueue_many([(recipient, subject, body)])
+        self._wake.set()
+
+    def enqueue_many(self, messages):
+        count = self.outbox.enqueue_many(messages)
+        self._wake.set()
+        return count
+
+    def start(self):
+        if self._threads:
+            return self
+        self._stop.clear()
+        for i in range(self.workers):
+            t = threading.Thread(target=self._worker, name=f"mail-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        return self
+
+    def stop(self, timeout=10.0):
+        self._stop.set()
+        self._wake.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
+        self.pool.close_all()
+
+    def flush(self, timeout=60.0):
+        """Blocks until nothing is pending/sending (or timeout). Returns True if drained."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            counts = self.outbox.counts()
+            if not counts.get('pending') and not counts.get('sending'):
+                return True
+            self._wake.set()
+            time.sleep(0.05)
+        return False
+
+    # ------------------------------------------------------------------ WORKER
+    def _worker(self):
+        while not self._stop.is_set():
+            batch = self.outbox.claim(self.batch_size)
+            if not batch:
+                self._purge_if_due()
+                self._wake.clear()
+                due = self.outbox.next_due_in()
+                self._wake.wait(timeout=min(due, 5.0) if due is not None else 5.0)
+                continue
+            self._send_batch(batch)
+
+    def _purge_if_due(self):
+        now = time.monotonic()
+        if now < self._next_purge:
+            return
+        self._next_purge = now + PURGE_INTERVAL
+        try:
+            purged = self.outbox.purge_sent()
+        except sqlite3.Error as e:
+            logger.warning("Could not purge sent mail: %s", e)
+            return
+        if purged:
+            logger.info("Purged %d sent messages from the outbox", purged)
+
+    def _send_batch(self, batch):
+        server = None
+        try:
+            for msg_id, recipient, subject, body, attempts in batch:
+                if server is None:
+                    try:
+                        server = self.pool.acquire()
+                    except (smtplib.SMTPException, OSError) as e:
+                        self.outbox.mark_failed(msg_id, attempts, e,
+                                                backoff_base=self.backoff_base)
+                        continue
+                try:
+                    server.send_message(self._build(recipient, subject, body))
+                    self.outbox.mark_sent(msg_id)
+                except smtplib.SMTPResponseException as e:
+                    # 5xx is permanent (bad recipient, rejected content), 4xx is retried
+                    self.outbox.mark_failed(msg_id, attempts, e, permanent=e.smtp_code >= 500,
+                                            backoff_base=self.backoff_base)
+                    self._reset(server)
+                except smtplib.SMTPRecipientsRefused as e:
+                    # Permanent only if every recipient got a 5xx (e.g. 450 mailbox busy is retried)
+                    permanent = all(code >= 500 for code, _ in e.recipients.values())
+                    self.outbox.mark_failed(msg_id, attempts, e, permanent=permanent,
+                                            backoff_base=self.backoff_base)
+                    self._reset(server)
+                except (smtplib.SMTPException, OSError) as e:
+                    # Connection-level problem: drop this connection, retry the message later
+                    self.outbox.mark_failed(msg_id, attempts, e, backoff_base=self.backoff_base)
+                    self.pool.release(server, broken=True)
+                    server = None
+        finally:
+            if server is not None:
+                self.pool.release(server)
+
+    def _build(self, recipient, subject, body):
+        msg = MIMEText(body)
+        msg['Subject'] = subject
+        msg['From'] = self.sender
+        msg['To'] = recipient
+        return msg
+
+    @staticmethod
+    def _reset(server):
+        try:
+            server.rset()
+        except smtplib.SMTPException:
+            pass
+
+
+# --- Process-wide delivery service ---
+_delivery = None
+_delivery_lock = threading.Lock()
+
+def get_mail_delivery():
+    """Returns the shared, started MailDelivery (created on first use)."""
+    global _delivery
+    with _delivery_lock:
+        if _delivery is None:
+            load_dotenv()  # SMTP settings; the crew (which used to load .env) may not exist yet
+            _delivery = MailDelivery().start()
+        return _delivery
+
+def resume_pending_delivery(outbox_path=OUTBOX_PATH):
+    """
+    Starts the shared delivery at process startup if the outbox holds unsent
+    mail (queued before a restart, or claimed by a process that died), instead
+    of waiting for the next enqueue. Returns True if delivery was started.
+    """
+    try:
+        outbox = Outbox(outbox_path)
+        try:
+            unsent = outbox.has_unsent()
+        finally:
+            outbox.close()
+    except sqlite3.Error as e:
+        logger.warning("Cannot read the outbox at %s: %s", outbox_path, e)
+        return False
+    if unsent:
+        get_mail_delivery()
+    return unsent
+
+def enqueue_email(recipient, subject, body):
+    """Queues one email for background delivery; returns immediately."""
+    get_mail_delivery().enqueue(recipient, subject, body)
@@ -0,0 +1,208 @@
+"""
+In-process metrics registry for LLM calls and caches.
+
+Counters and histograms are keyed by label values (agent, task, cache...) and
+are cheap to update from any thread. The registry renders the Prometheus text
+exposition format (served on GET /metrics by service.py) and JSON snapshots,
+optionally written periodically to a file by SnapshotWriter.
+
+The metrics recorded by the app are defined at the bottom of this module:
+LLM call latency, outcomes, prompt/completion tokens, LLM round trips and
+retries per agent and task, schema-validation failures and cache hits/misses.
+"""
+import json
+import logging
+import os
+import threading
+import time
+
+# Default latency buckets (seconds): LLM calls take from ~0.5 s to tens of seconds
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 3, 5, 8, 13, 21, 34, 60)
+
+logger = logging.getLogger(__name__)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    pairs += [f'{n}="{v}"' for n, v in extra]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help_text, labels=()):
+        self.name, self.help, self.label_names = name, help_text, tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(str(labels.get(n, "")) for n in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(tuple(str(labels.get(n, "")) for n in self.label_names), 0)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        lines += [f"{self.name}{_format_labels(self.label_names, k)} {v}" for k, v in items]
+        return lines
+
+    def snapshot(self):
+        with self._lock:
+            return [{"labels": dict(zip(self.label_names, k)), "value": v}
+                    for k, v in sorted(self._values.items())]
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        self.name, self.help, self.label_names = name, help_text, tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series = {}   # labels -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels.get(n, "")) for n in self.label_names)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        for key, series in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets, series):
+                cumulative += n
+                labels = _format_labels(self.label_names, key, [("le", bound)])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, key, [("le", "+Inf")])
+            lines.append(f"{self.name}_bucket{labels} {series[-1]}")
+            plain = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{plain} {round(series[-2], 6)}")
+            lines.append(f"{self.name}_count{plain} {series[-1]}")
+        return lines
+
+    def snapshot(self):
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        return [{"labels": dict(zip(self.label_names, key)),
+                 "buckets": dict(zip([str(b) for b in self.buckets], series[:-2])),
+                 "sum": round(series[-2], 6), "count": series[-1],
+                 "mean": round(series[-2] / series[-1], 6) if series[-1] else None}
+                for key, series in items]
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name, help_text, labels=()):
+        return self._register(Counter(name, help_text, labels))
+
+    def histogram(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        return self._register(Histogram(name, help_text, labels, buckets))
+
+    def render_prometheus(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines += metric.render()
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {"timestamp": time.time(),
+                "metrics": {m.name: {"type": m.kind, "help": m.help, "series": m.snapshot()}
+                            for m in metrics}}
+
+    def write_snapshot(self, path):
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(tmp, path)
+
+
+class SnapshotWriter:
+    """Writes a JSON snapshot of the registry every `interval` seconds (and on stop)."""
+
+    def __init__(self, registry, path, interval=60.0):
+        self.registry, self.path, self.interval = registry, path, interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="metrics-snapshot", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._write()
+
+    def _write(self):
+        try:
+            self.registry.write_snapshot(self.path)
+        except OSError as e:
+            logger.warning("Could not write metrics snapshot to %s: %s", self.path, e)
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(2.0)
+        self._write()
+
+
+REGISTRY = MetricsRegistry()
+
+# --- Metrics recorded by the app ---
+LLM_CALL_SECONDS = REGISTRY.histogram(
+    "mentor_llm_call_seconds", "Duration of a crew kickoff for one task.", ("agent", "task"))
+LLM_CALLS = REGISTRY.counter(
+    "mentor_llm_calls_total", "Crew kickoffs by outcome (ok / error).", ("agent", "task", "outcome"))
+LLM_PROMPT_TOKENS = REGISTRY.counter(
+    "mentor_llm_prompt_tokens_total", "Prompt tokens reported by the crew.", ("agent", "task"))
+LLM_COMPLETION_TOKENS = REGISTRY.counter(
+    "mentor_llm_completion_tokens_total", "Completion tokens reported by the crew.", ("agent", "task"))
+LLM_REQUESTS = REGISTRY.counter(
+    "mentor_llm_requests_total", "LLM round trips (one task can take several).", ("agent", "task"))
+LLM_RETRIES = REGISTRY.counter(
+    "mentor_llm_retries_total", "Task executions retried by the agent after an error.", ("agent", "task"))
+VALIDATION_FAILURES = REGISTRY.counter(
+    "mentor_validation_failures_total", "Agent outputs rejected by the schema checks.", ("task", "reason"))
+CACHE_LOOKUPS = REGISTRY.counter(
+    "mentor_cache_lookups_total", "Cache lookups by result (hit / miss).", ("cache", "result"))
+LEVEL_CHECKS = REGISTRY.counter(
+    "mentor_level_checks_total",
+    "Generated questions by estimated-level check (fit / rebucketed / rejected).", ("task", "result"))
+BUDGET_DEGRADATIONS = REGISTRY.counter(
+    "mentor_budget_degradations_total",
+    "Calls served on the fallback model or from cache because of the token budget.", ("task", "tier"))
@@ -0,0 +1,125 @@
+"""
+One-shot migration from the flat config/<safe_name>.json layout to the sharded
+data directory (see config_manager.get_config_path).
+
+Usage (from the language_learning_mentor directory):
+    python -m logic.migrate_user_data [--dry-run] [--copy]
+
+Each legacy file is moved (or copied) to users/ab/cd/<sha256>.json together with
+its .history.jsonl, and the username is stored inside the file. The legacy
+filename was lossy ("a b" and "a_b" shared one file), so the migrated user keeps
+the name recorded in the file if any. Otherwise the file is keyed on its stem
+and marked "legacy_key", together with the real name found for that stem in the
+response log ("legacy_username"). A login with exactly that name ("Mario Rossi"
+for mario_rossi) claims it under the real name (see config_manager.load_user_config);
+without a name in the log, or if several names share the stem, the user keeps
+logging in with the stem.
+The response log and item bank are moved from config/ to the data root as well.
+Files that already exist at the destination are never overwritten.
+"""
+import argparse
+import json
+import shutil
+
+from logic.config_manager import (CONFIG_DIR, DATA_DIR, get_config_path, get_history_path,
+                                  legacy_filename, write_json_atomic)
+
+# Non-user files that lived in the config directory before the data root existed
+SHARED_FILES = ["responses.jsonl", "item_bank.json"]
+
+
+def _transfer(src, dst, copy):
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if copy:
+        shutil.copy2(src, dst)
+    else:
+        shutil.move(src, dst)  # plain rename when on the same filesystem
+
+
+def _names_by_stem(responses_path):
+    """
+    Real usernames found in a response log, by their legacy file stem. Stems
+    shared by several names are left out: none of them can claim the file.
+    """
+    names = {}
+    try:
+        with open(responses_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    user = json.loads(line).get("user")
+                except (ValueError, AttributeError):
+                    continue
+                if isinstance(user, str) and user.strip():
+                    names.setdefault(legacy_filename(user), {}).setdefault(user.strip().lower(), user.strip())
+    except FileNotFoundError:
+        return {}
+    return {stem: next(iter(users.values())) for stem, users in names.items() if len(users) == 1}
+
+
+def migrate(config_dir=CONFIG_DIR, dry_run=False, copy=False):
+    """Migrates every legacy user file. Returns a dict of counters."""
+    counts = {"migrated": 0, "skipped": 0, "failed": 0, "shared": 0}
+    log = config_dir / "responses.jsonl"
+    names = _names_by_stem(log if log.exists() else DATA_DIR / "responses.jsonl")
+
+    for name in SHARED_FILES:
+        src, dst = config_dir / name, DATA_DIR / name
+        if src.exists() and not dst.exists():
+            print(f"{'Would move' if dry_run else 'Moving'} {src} -> {dst}")
+            if not dry_run:
+                _transfer(src, dst, copy)
+            counts["shared"] += 1
+
+    for src in sorted(config_dir.glob("*.json")):
+        if src.name in SHARED_FILES:
+            continue
+        try:
+            with open(src, "r") as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("not a user config object")
+        except (ValueError, IOError) as e:
+            print(f"Skipping {src}: {e}")
+            counts["failed"] += 1
+            continue
+
+        username = data.get("username")
+        if not username:
+            username = src.stem  # lossy: the real name claims it at first login
+            data = {**data, "legacy_key": True}
+            if src.stem in names:
+                data["legacy_username"] = names[src.stem]
+        dst = get_config_path(username)
+        if dst.exists():
+            print(f"Skipping {src}: {username!r} already exists at {dst}")
+            counts["skipped"] += 1
+            continue
+
+        print(f"{'Would migrate' if dry_run else 'Migrating'} {username!r}: {src} -> {dst}")
+        if dry_run:
+            counts["migrated"] += 1
+            continue
+
+        write_json_atomic(dst, {**data, "username": username})
+
+        legacy_history = src.with_suffix(".history.jsonl")
+        if legacy_history.exists():
+            _transfer(legacy_history, get_history_path(username), copy)
+        if not copy:
+            src.unlink()
+        counts["migrated"] += 1
+
+    print(f"Done: {counts}")
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Migrate flat user configs to the sharded data directory.")
+    parser.add_argument("--dry-run", action="store_true", help="Only print what would be done.")
+    parser.add_argument("--copy", action="store_true", help="Copy instead of move (keep the legacy files).")
+    args = parser.parse_args(argv)
+    migrate(dry_run=args.dry_run, copy=args.copy)
+
+
+if __name__ == "__main__":
+    main()
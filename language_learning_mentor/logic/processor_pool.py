@@ -0,0 +1,62 @@
+import queue
+import threading
+from contextlib import contextmanager
+
+from logic.language_processor import LanguageProcessor
+
+
+class ProcessorPoolExhausted(Exception):
+    """No LanguageProcessor became free within the timeout."""
+
+
+class ProcessorPool:
+    """
+    Fixed-size pool of LanguageProcessor instances shared by all sessions.
+
+    A LanguageProcessor mutates its (memoized) CrewAI task objects and reads the
+    task output files back from disk, so one instance must only serve one request
+    at a time. The pool hands each request an exclusive processor, bounds the
+    number of concurrent LLM calls, and reuses the loaded agents/LLM clients
+    instead of rebuilding them per user.
+    """
+
+    def __init__(self, size: int = 4, output_root: str = ".llm_outputs", quiz_queue=None):
+        self.size = size
+        self._quiz_queue = quiz_queue  # None: the shared get_quiz_queue()
+        self._free = queue.Queue()
+        self._created = 0
+        self._create_lock = threading.Lock()
+        self._output_root = output_root
+
+    def _acquire(self, timeout: float | None) -> LanguageProcessor:
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            pass
+        # Processors are built lazily, up to `size`
+        with self._create_lock:
+            index = self._created if self._created < self.size else None
+            if index is not None:
+                self._created += 1
+        if index is not None:
+            try:
+                return LanguageProcessor(output_dir=f"{self._output_root}/worker-{index}",
+                                         quiz_queue=self._quiz_queue)
+            except Exception:
+                with self._create_lock:
+                    self._created -= 1
+                raise
+        try:
+            return self._free.get(timeout=timeout)
+        except queue.Empty:
+            raise ProcessorPoolExhausted(
+                f"All {self.size} language processors are busy, try again later.")
+
+    @contextmanager
+    def processor(self, timeout: float | None = 60):
+        """Borrow a processor for the duration of a `with` block."""
+        proc = self._acquire(timeout)
+        try:
+            yield proc
+        finally:
+            self._free.put(proc)
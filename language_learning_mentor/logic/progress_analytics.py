@@ -0,0 +1,280 @@
+"""
+Progress analytics over a learner's attempt history.
+
+The history is kept column-wise in growable NumPy arrays. Aggregates that the
+dashboard shows on every update (accuracy per topic/level, streaks, recent EXP
+rate) are maintained incrementally in add_attempt(), so refreshing the dashboard
+costs O(1) no matter how many years of history a user has. Heavier views
+(learning curve) are computed on demand with vectorized operations and cached
+until the next attempt.
+"""
+import time
+
+import numpy as np
+
+LEVELS = ["Beginner", "Pre-Intermediate", "Intermediate",
+          "Pre-Advanced", "Advanced", "Proficient", "Master"]
+TOPICS = ["quiz", "level_test"]
+# EXP needed to reach each level (see AppController._calculate_level)
+LEVEL_THRESHOLDS = [("Intermediate", 100), ("Advanced", 500),
+                    ("Proficient", 1500), ("Master", 3000)]
+
+DAY = 86400
+RATE_WINDOW_DAYS = 30
+_INITIAL_CAPACITY = 256
+
+
+def _utc_offset(t):
+    return time.localtime(t).tm_gmtoff
+
+
+def _offset_switch(start, end):
+    """First second in [start, end] using end's UTC offset (a DST transition)."""
+    target = _utc_offset(end)
+    while start < end:
+        mid = (start + end) // 2
+        if _utc_offset(mid) == target:
+            end = mid
+        else:
+            start = mid + 1
+    return end
+
+
+def _day_index(ts):
+    """
+    Local calendar day number for a UNIX timestamp (scalar or array). Each
+    timestamp uses the UTC offset in force at that instant, so attempts on both
+    sides of a DST change land on their own local day. Offsets are looked up at
+    the edges of each distinct UTC day, and bisected only inside the few days
+    that contain a transition.
+    """
+    ts = np.asarray(ts, dtype=np.float64)
+    shape, ts = ts.shape, ts.ravel()
+    days, inverse = np.unique(ts // DAY, return_inverse=True)
+    first = np.array([_utc_offset(int(d) * DAY) for d in days], dtype=np.float64)
+    last = np.array([_utc_offset(int(d + 1) * DAY - 1) for d in days], dtype=np.float64)
+    offsets = first[inverse]
+    for k in np.flatnonzero(first != last):
+        switch = _offset_switch(int(days[k]) * DAY, int(days[k] + 1) * DAY - 1)
+        offsets[(inverse == k) & (ts >= switch)] = last[k]
+    return ((ts + offsets) // DAY).reshape(shape)
+
+
+class ProgressAnalytics:
+    """Column store of attempts plus incrementally maintained aggregates."""
+
+    def __init__(self):
+        self._n = 0
+        self._ts = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._exp = np.empty(_INITIAL_CAPACITY, dtype=np.int32)
+        self._correct = np.empty(_INITIAL_CAPACITY, dtype=np.int32)
+        self._total = np.empty(_INITIAL_CAPACITY, dtype=np.int32)
+        self._topic = np.empty(_INITIAL_CAPACITY, dtype=np.int8)
+        self._level = np.empty(_INITIAL_CAPACITY, dtype=np.int8)
+
+        # Cached aggregates, kept current by add_attempt()
+        self._correct_by = np.zeros((len(TOPICS), len(LEVELS)), dtype=np.int64)
+        self._total_by = np.zeros((len(TOPICS), len(LEVELS)), dtype=np.int64)
+        # Attempts with a topic or level not in TOPICS/LEVELS: only in the overall figures
+        self._unlabelled = 0
+        self._unlabelled_correct = 0
+        self._unlabelled_total = 0
+        self._total_exp = 0
+        self._last_day = None
+        self._current_streak = 0
+        self._longest_streak = 0
+        self._curve_cache = {}
+
+    # ------------------------------------------------------------------ BUILD
+    @classmethod
+    def from_records(cls, records):
+        """Builds the analytics from a list of attempt dicts in one vectorized pass."""
+        self = cls()
+        if not records:
+            return self
+
+        n = len(records)
+        self._reserve(n)
+        self._ts[:n] = [r.get("ts", 0) for r in records]
+        self._exp[:n] = [r.get("exp", 0) for r in records]
+        self._correct[:n] = [r.get("correct") or 0 for r in records]
+        self._total[:n] = [r.get("total") or 0 for r in records]
+        self._topic[:n] = [_code(TOPICS, r.get("topic")) for r in records]
+        self._level[:n] = [_code(LEVELS, r.get("level")) for r in records]
+        self._n = n
+
+        # History files are append-only, but sort defensively for the curve
+        order = np.argsort(self._ts[:n], kind="stable")
+        for col in (self._ts, self._exp, self._correct, self._total, self._topic, self._level):
+            col[:n] = col[:n][order]
+
+        self._recompute_aggregates()
+        return self
+
+    def _reserve(self, needed):
+        capacity = self._ts.shape[0]
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        for name in ("_ts", "_exp", "_correct", "_total", "_topic", "_level"):
+            old = getattr(self, name)
+            new = np.empty(new_capacity, dtype=old.dtype)
+            new[:self._n] = old[:self._n]
+            setattr(self, name, new)
+
+    def _recompute_aggregates(self):
+        n = self._n
+        labelled = (self._topic[:n] >= 0) & (self._level[:n] >= 0)
+        cells = self._topic[:n][labelled].astype(np.int64) * len(LEVELS) + self._level[:n][labelled]
+        size = len(TOPICS) * len(LEVELS)
+        self._correct_by = np.bincount(cells, weights=self._correct[:n][labelled], minlength=size) \
+            .astype(np.int64).reshape(len(TOPICS), len(LEVELS))
+        self._total_by = np.bincount(cells, weights=self._total[:n][labelled], minlength=size) \
+            .astype(np.int64).reshape(len(TOPICS), len(LEVELS))
+        self._unlabelled = int(n - labelled.sum())
+        self._unlabelled_correct = int(self._correct[:n][~labelled].sum())
+        self._unlabelled_total = int(self._total[:n][~labelled].sum())
+        self._total_exp = int(self._exp[:n].sum())
+
+        days = np.unique(_day_index(self._ts[:n]))
+        if days.size:
+            # Runs of consecutive days: a new run starts wherever the gap is not 1
+            breaks = np.flatnonzero(np.diff(days) != 1) + 1
+            starts = np.concatenate(([0], breaks))
+            lengths = np.diff(np.concatenate((starts, [days.size])))
+            self._longest_streak = int(lengths.max())
+            self._current_streak = int(lengths[-1])
+            self._last_day = int(days[-1])
+        self._curve_cache.clear()
+
+    # ------------------------------------------------------------------ UPDATE
+    def add_attempt(self, record):
+        """Appends one attempt and updates every cached aggregate in O(1)."""
+        self._reserve(self._n + 1)
+        i = self._n
+        ts = record.get("ts", time.time())
+        topic = _code(TOPICS, record.get("topic"))
+        level = _code(LEVELS, record.get("level"))
+        self._ts[i] = ts
+        self._exp[i] = record.get("exp", 0)
+        self._correct[i] = record.get("correct") or 0
+        self._total[i] = record.get("total") or 0
+        self._topic[i] = topic
+        self._level[i] = level
+        self._n += 1
+
+        if topic >= 0 and level >= 0:
+            self._correct_by[topic, level] += self._correct[i]
+            self._total_by[topic, level] += self._total[i]
+        else:
+            self._unlabelled += 1
+            self._unlabelled_correct += int(self._correct[i])
+            self._unlabelled_total += int(self._total[i])
+        self._total_exp += int(self._exp[i])
+
+        day = int(_day_index(ts))
+        if self._last_day is None or day > self._last_day + 1:
+            self._current_streak = 1
+        elif day == self._last_day + 1:
+            self._current_streak += 1
+        if self._last_day is None or day > self._last_day:
+            self._last_day = day
+        self._longest_streak = max(self._longest_streak, self._current_streak)
+        self._curve_cache.clear()
+
+    # ------------------------------------------------------------------ QUERIES
+    def __len__(self):
+        return self._n
+
+    def accuracy(self):
+        """Accuracy per topic and level, e.g. {"quiz": {"Beginner": 0.8}}."""
+        result = {}
+        for t, topic in enumerate(TOPICS):
+            answered = np.flatnonzero(self._total_by[t])
+            if answered.size:
+                result[topic] = {
+                    LEVELS[lv]: round(float(self._correct_by[t, lv] / self._total_by[t, lv]), 3)
+                    for lv in answered
+                }
+        return result
+
+    def overall_accuracy(self):
+        total = int(self._total_by.sum()) + self._unlabelled_total
+        correct = int(self._correct_by.sum()) + self._unlabelled_correct
+        return round(correct / total, 3) if total else None
+
+    def streaks(self, now=None):
+        """Returns (current, longest) streak of consecutive active days."""
+        if self._last_day is None:
+            return 0, 0
+        today = int(_day_index(now if now is not None else time.time()))
+        # The streak is still alive if the last activity was today or yesterday
+        current = self._current_streak if today - self._last_day <= 1 else 0
+        return current, self._longest_streak
+
+    def exp_rate(self, now=None, window_days=RATE_WINDOW_DAYS):
+        """Average EXP per day over the trailing window."""
+        if not self._n:
+            return 0.0
+        now = now if now is not None else time.time()
+        start = np.searchsorted(self._ts[:self._n], now - window_days * DAY)
+        first_ts = self._ts[0]
+        # Young accounts: average over the days actually elapsed, at least one
+        span_days = max(1.0, min(window_days, float(now - first_ts) / DAY))
+        return float(self._exp[start:self._n].sum() / span_days)
+
+    def time_to_next_level(self, progress, now=None):
+        """
+        Predicted days until the next level at the recent EXP rate.
+        Returns (next_level, days) or (None, None) at the top level / no activity.
+        """
+        for level_name, threshold in LEVEL_THRESHOLDS:
+            if progress < threshold:
+                rate = self.exp_rate(now)
+                if rate <= 0:
+                    return level_name, None
+                return level_name, round((threshold - progress) / rate, 1)
+        return None, None
+
+    def learning_curve(self, points=50):
+        """
+        Cumulative EXP sampled at `points` evenly spaced instants between the first
+        and last attempt, as a list of (timestamp, cumulative_exp).
+        """
+        if not self._n:
+            return []
+        cached = self._curve_cache.get(points)
+        if cached is not None:
+            return cached
+
+        ts = self._ts[:self._n]
+        cumulative = np.cumsum(self._exp[:self._n], dtype=np.int64)
+        grid = np.linspace(ts[0], ts[-1], num=points)
+        idx = np.searchsorted(ts, grid, side="right") - 1
+        curve = list(zip(grid.tolist(), cumulative[idx].tolist()))
+        self._curve_cache[points] = curve
+        return curve
+
+    def summary(self, progress, now=None):
+        """Dict consumed by DashboardScreen.update_progress_stats."""
+        current, longest = self.streaks(now)
+        next_level, days = self.time_to_next_level(progress, now)
+        return {
+            "attempts": self._n,
+            "accuracy": self.overall_accuracy(),
+            "accuracy_by_topic": self.accuracy(),
+            "unlabelled_attempts": self._unlabelled,
+            "current_streak": current,
+            "longest_streak": longest,
+            "exp_per_day": round(self.exp_rate(now), 1),
+            "next_level": next_level,
+            "days_to_next_level": days,
+        }
+
+
+def _code(values, value):
+    """Index of value in values, -1 for unknown labels (kept out of accuracy())."""
+    try:
+        return values.index(value)
+    except ValueError:
+        return -1
@@ -0,0 +1,133 @@
+"""
+Per-user queue of pre-generated quizzes.
+
+quiz_task generates a batch of K quizzes in one LLM call (the long prompt is
+paid once instead of K times); the first quiz is served right away and the
+others are queued here, so the user's next "Quiz" clicks are answered
+instantly without calling the LLM. Quizzes are queued per (user, language,
+level, questions per quiz): a level-up or a language change simply stops
+serving the old ones, and entries older than MAX_AGE_DAYS are dropped.
+
+The same file keeps the last valid questions generated per task and
+language/level (remember / recent): they are served to users who are out of
+AI budget for the day, and survive restarts.
+
+The queue lives in a small SQLite file, shared by the app and the service.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from logic.config_manager import DATA_DIR
+
+QUEUE_PATH = DATA_DIR / "quiz_queue.sqlite3"
+
+MAX_AGE_DAYS = 14
+MAX_QUEUED = 10  # per user and group: no point in keeping more than this
+
+
+class QuizQueue:
+    """SQLite-backed FIFO of quizzes (lists of questions) per user and group."""
+
+    def __init__(self, path=QUEUE_PATH, max_age_days=MAX_AGE_DAYS, max_queued=MAX_QUEUED):
+        self.path = str(path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)  # data dir is created on first use
+        self.max_age = max_age_days * 86400
+        self.max_queued = max_queued
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS quizzes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user TEXT NOT NULL,
+                grp TEXT NOT NULL,
+                questions TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )""")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_user_grp ON quizzes (user, grp, id)")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS recent (
+                task TEXT NOT NULL,
+                grp TEXT NOT NULL,
+                questions TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (task, grp)
+            )""")
+
+    @staticmethod
+    def group(language, level, num_questions):
+        return f"{language}|{level}|{num_questions}"
+
+    @staticmethod
+    def _user(username):
+        return username.strip().lower()
+
+    def push(self, username, language, level, num_questions, quizzes):
+        """Queues quizzes (oldest first out). Returns how many are queued for the group."""
+        user, grp, now = self._user(username), self.group(language, level, num_questions), time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.executemany(
+                "INSERT INTO quizzes (user, grp, questions, created_at) VALUES (?, ?, ?, ?)",
+                [(user, grp, json.dumps(quiz, ensure_ascii=False), now) for quiz in quizzes])
+            # Keep only the newest max_queued of the group
+            self._conn.execute(
+                "DELETE FROM quizzes WHERE user = ? AND grp = ? AND id NOT IN "
+                "(SELECT id FROM quizzes WHERE user = ? AND grp = ? ORDER BY id DESC LIMIT ?)",
+                (user, grp, user, grp, self.max_queued))
+            count = self._conn.execute("SELECT COUNT(*) FROM quizzes WHERE user = ? AND grp = ?",
+                                       (user, grp)).fetchone()[0]
+            self._conn.execute("COMMIT")
+        return count
+
+    def pop(self, username, language, level, num_questions):
+        """Removes and returns the user's oldest queued quiz for the group, or None."""
+        user, grp = self._user(username), self.group(language, level, num_questions)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("DELETE FROM quizzes WHERE created_at < ?",
+                               (time.time() - self.max_age,))
+            row = self._conn.execute(
+                "SELECT id, questions FROM quizzes WHERE user = ? AND grp = ? ORDER BY id LIMIT 1",
+                (user, grp)).fetchone()
+            if row is not None:
+                self._conn.execute("DELETE FROM quizzes WHERE id = ?", (row[0],))
+            self._conn.execute("COMMIT")
+        return json.loads(row[1]) if row is not None else None
+
+    def remember(self, task, language, level, questions):
+        """Stores the last valid questions generated by `task` for a language/level."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO recent (task, grp, questions, created_at) VALUES (?, ?, ?, ?)",
+                (task, f"{language}|{level}", json.dumps(questions, ensure_ascii=False), time.time()))
+
+    def recent(self, task, language, level):
+        """The last questions remembered for the task and language/level, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT questions FROM recent WHERE task = ? AND grp = ?",
+                                     (task, f"{language}|{level}")).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def pending(self, username, language, level, num_questions):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM quizzes WHERE user = ? AND grp = ? AND created_at >= ?",
+                (self._user(username), self.group(language, level, num_questions),
+                 time.time() - self.max_age)).fetchone()[0]
+
+
+# --- Process-wide instance ---
+_queue = None
+_queue_lock = threading.Lock()
+
+def get_quiz_queue():
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = QuizQueue()
+        return _queue
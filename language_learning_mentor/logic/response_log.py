@@ -0,0 +1,63 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from logic.config_manager import DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+# --- Configuration ---
+# Every answered quiz / level-test question is appended here as one JSON line.
+# The offline calibration job (logic/item_calibration.py) reads this file and
+# writes the calibrated item bank that the app loads at startup.
+RESPONSES_PATH = DATA_DIR / "responses.jsonl"
+ITEM_BANK_PATH = DATA_DIR / "item_bank.json"
+
+_write_lock = threading.Lock()
+
+
+# --- Helper Functions ---
+def item_id(question_text):
+    """Stable identifier for a generated question (hash of its normalized text)."""
+    normalized = " ".join(str(question_text).split()).lower()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def append_response(username, kind, language, level, question, correct, path=None):
+    """Appends one answered question to the response log."""
+    record = {
+        "ts": int(time.time()),
+        "user": username,
+        "kind": kind,              # "quiz" or "level_test"
+        "language": language,
+        "level": level,            # level requested from the agent
+        "item": item_id(question),
+        "correct": 1 if correct else 0,
+    }
+    path = path or RESPONSES_PATH
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with _write_lock, open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        return True
+    except IOError as e:
+        logger.error("Error appending response to %s: %s", path, e)
+        return False
+
+
+def load_item_bank(path=None):
+    """
+    Loads the calibrated item bank written by the calibration job.
+    Returns a dict item_id -> parameters, or an empty dict if not calibrated yet.
+    """
+    path = path or ITEM_BANK_PATH
+    try:
+        if not path.exists():
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("items", {})
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning("Could not load item bank from %s: %s", path, e)
+        return {}
@@ -0,0 +1,153 @@
+"""
+Process-wide and on-disk cache of daily tips, shared by all users.
+
+A tip only depends on (language, level, day), so users with the same language
+and level share a small set of N variants per day instead of each triggering a
+Groq call. Every user is assigned one variant slot per day by a deterministic
+rotation (hash of the username + day number), so a user sees the same tip all
+day, different users get some variety, and the slot changes day to day.
+
+The number of variants comes from TIP_VARIANTS (default 3). Variants are
+persisted in <data>/tips/<date>.json, so the desktop app, the service and the
+digest job all reuse each other's tips.
+"""
+import hashlib
+import json
+import os
+import threading
+from datetime import date, timedelta
+
+from logic.config_manager import DATA_DIR
+from logic.metrics import CACHE_LOOKUPS
+
+TIPS_DIR = DATA_DIR / "tips"
+DEFAULT_VARIANTS = int(os.getenv("TIP_VARIANTS", "3"))
+FALLBACK_DAYS = 7  # how far back any_tip() looks for a tip of the same group
+
+
+def variant_slot(username, day, variants):
+    """Deterministic per-user rotation over the day's variant slots."""
+    digest = hashlib.sha256((username or "").strip().lower().encode("utf-8")).digest()
+    return (int.from_bytes(digest[:4], "big") + date.fromisoformat(day).toordinal()) % variants
+
+
+class TipCache:
+    def __init__(self, variants=DEFAULT_VARIANTS, tips_dir=TIPS_DIR):
+        self.variants = max(1, variants)
+        self.tips_dir = tips_dir
+        self.tips_dir.mkdir(parents=True, exist_ok=True)
+        self._day = None
+        self._tips = {}          # "language|level" -> {slot (str): tip}
+        self._lock = threading.Lock()
+        self._inflight = {}      # (group, slot) -> Event, so a slot is generated only once
+
+    # ------------------------------------------------------------------ STORAGE
+    def _path(self, day):
+        return self.tips_dir / f"{day}.json"
+
+    def _load_day(self, day):
+        """Switches the in-memory cache to `day`, merging what other processes stored."""
+        if self._day != day:
+            self._day, self._tips = day, {}
+        try:
+            with open(self._path(day), 'r') as f:
+                on_disk = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        for group, slots in on_disk.items():
+            self._tips.setdefault(group, {}).update(
+                {k: v for k, v in slots.items() if k not in self._tips.get(group, {})})
+
+    def _save_day(self):
+        tmp = self._path(self._day).with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, 'w') as f:
+            json.dump(self._tips, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, self._path(self._day))
+
+    # ------------------------------------------------------------------ API
+    def lookup(self, username, language, level, day=None):
+        """Returns the user's cached tip for the day, or None (never calls the LLM)."""
+        day = day or date.today().isoformat()
+        slot = str(variant_slot(username, day, self.variants))
+        group = f"{language}|{level}"
+        with self._lock:
+            if self._day != day or slot not in self._tips.get(group, {}):
+                self._load_day(day)
+            tip = self._tips.get(group, {}).get(slot)
+        if tip is not None:
+            CACHE_LOOKUPS.inc(cache="tip", result="hit")  # misses are counted by get_slot
+        return tip
+
+    def any_tip(self, language, level, day=None):
+        """
+        Any cached tip of the (language, level) group, today's first, then from the
+        previous FALLBACK_DAYS days. Served to users who are out of token budget.
+        """
+        day = day or date.today().isoformat()
+        group = f"{language}|{level}"
+        with self._lock:
+            self._load_day(day)
+            tips = list(self._tips.get(group, {}).values())
+        if tips:
+            return tips[0]
+        for back in range(1, FALLBACK_DAYS + 1):
+            past = (date.fromisoformat(day) - timedelta(days=back)).isoformat()
+            try:
+                with open(self._path(past), 'r') as f:
+                    tips = list(json.load(f).get(group, {}).values())
+            except (FileNotFoundError, ValueError):
+                continue
+            if tips:
+                return tips[0]
+        return None
+
+    def get_tip(self, username, language, level, generate, day=None):
+        """
+        Returns (tip, cache_hit). On a miss `generate(level, language)` is called
+        once per (group, slot) even if many users ask concurrently.
+        """
+        day = day or date.today().isoformat()
+        return self.get_slot(variant_slot(username, day, self.variants),
+                             language, level, generate, day)
+
+    def get_slot(self, slot, language, level, generate, day=None):
+        day = day or date.today().isoformat()
+        slot, group = str(slot), f"{language}|{level}"
+        while True:
+            with self._lock:
+                if self._day != day or slot not in self._tips.get(group, {}):
+                    self._load_day(day)
+                tip = self._tips.get(group, {}).get(slot)
+                if tip is not None:
+                    CACHE_LOOKUPS.inc(cache="tip", result="hit")
+                    return tip, True
+                waiter = self._inflight.get((group, slot))
+                if waiter is None:
+                    owner_event = self._inflight[(group, slot)] = threading.Event()
+                    break
+            waiter.wait()  # someone else is generating this slot; re-check afterwards
+
+        CACHE_LOOKUPS.inc(cache="tip", result="miss")
+        try:
+            tip = generate(level, language)
+            with self._lock:
+                self._load_day(day)
+                self._tips.setdefault(group, {})[slot] = tip
+                self._save_day()
+            return tip, False
+        finally:
+            with self._lock:
+                self._inflight.pop((group, slot), None)
+            owner_event.set()
+
+
+# --- Process-wide instance ---
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_tip_cache():
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TipCache()
+        return _cache
@@ -0,0 +1,160 @@
+"""
+Daily tip digest mailer.
+
+Groups all users with an email address by (language, level), generates ONE tip
+per group through tip_agent, and fans it out to every member through the
+outbound mail queue. LLM calls per run therefore scale with the number of
+language x level groups (3 languages x 6 levels), not with the user count.
+
+Runs are idempotent per day: groups already mailed today are recorded in
+<data>/digests/<date>.json and skipped if the job is started again, and every
+email is queued with the key (day, user), so a group that was queued but not
+recorded (crash in between) is not mailed twice when it is rerun.
+
+Usage (from the language_learning_mentor directory):
+    python -m logic.tip_digest [--dry-run] [--workers 3]
+"""
+import argparse
+import json
+import logging
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+
+from logic.config_manager import DATA_DIR, iter_user_config_paths
+from logic.tip_cache import get_tip_cache
+from logic.logging_setup import setup_logging
+
+DIGEST_DIR = DATA_DIR / "digests"
+FANOUT_BATCH = 1000
+
+logger = logging.getLogger(__name__)
+
+
+def group_recipients():
+    """
+    Returns {(language, level): [(user_key, email), ...]} for every user with an
+    email and a language (user_key is the config file's stem).
+    """
+    groups = defaultdict(list)
+    for path in iter_user_config_paths():
+        try:
+            with open(path, 'r') as f:
+                profile = json.load(f)
+        except (ValueError, IOError):
+            continue
+        email, language = profile.get('email'), profile.get('language')
+        if email and language:
+            groups[(language, profile.get('level') or 'Beginner')].append((path.stem, email))
+    return groups
+
+
+def format_digest(language, level, tip):
+    subject = f"Your daily {language} tip"
+    body = (f"Today's {language} tip for {level} learners:\n\n"
+            f"{tip}\n\n"
+            f"— Language Learning Mentor")
+    return subject, body
+
+
+class DigestLog:
+    """Per-day record of the groups already mailed (and the tip they got)."""
+
+    def __init__(self, day):
+        DIGEST_DIR.mkdir(parents=True, exist_ok=True)
+        self.day = day
+        self.path = DIGEST_DIR / f"{day}.json"
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, 'r') as f:
+                self.groups = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.groups = {}
+
+    @staticmethod
+    def key(language, level):
+        return f"{language}|{level}"
+
+    def done(self, language, level):
+        return self.key(language, level) in self.groups
+
+    def record(self, language, level, tip, recipients):
+        with self._lock:
+            self.groups[self.key(language, level)] = {"tip": tip, "recipients": recipients}
+            tmp = self.path.with_suffix(".tmp")
+            with open(tmp, 'w') as f:
+                json.dump(self.groups, f, indent=2, ensure_ascii=False)
+            os.replace(tmp, self.path)
+
+
+def _send_group(pool, delivery, log, language, level, recipients, dry_run):
+    def generate(level, language):
+        with pool.processor() as proc:
+            return proc.generate_daily_tip(level, language)
+
+    # Slot 0 of the shared tip cache: app users rotating onto it get the same tip for free
+    tip, _ = get_tip_cache().get_slot(0, language, level, generate)
+    subject, body = format_digest(language, level, tip)
+    if dry_run:
+        print(f"[dry run] {language}/{level}: {len(recipients)} recipients\n  {tip}")
+        return len(recipients)
+    queued = 0
+    for start in range(0, len(recipients), FANOUT_BATCH):
+        # (day, user) key: recipients already queued by an interrupted run are skipped
+        queued += delivery.enqueue_many([(email, subject, body, f"tip-digest|{log.day}|{user}")
+                                         for user, email in recipients[start:start + FANOUT_BATCH]])
+    log.record(language, level, tip, len(recipients))
+    print(f"{language}/{level}: queued {queued} emails")
+    return queued
+
+
+def run_digest(workers=3, dry_run=False, wait=True):
+    """Generates one tip per (language, level) group and queues it to the group's users."""
+    # Imported here so --help and grouping don't pay for the LLM / SMTP stack
+    from logic.processor_pool import ProcessorPool
+    from logic.mail_queue import get_mail_delivery
+
+    log = DigestLog(date.today().isoformat())
+    groups = {k: v for k, v in group_recipients().items() if not log.done(*k)}
+    if not groups:
+        print("No pending digest groups for today.")
+        return 0
+    print(f"{sum(len(v) for v in groups.values())} recipients in {len(groups)} groups "
+          f"-> {len(groups)} tip generations")
+
+    pool = ProcessorPool(size=workers)
+    delivery = None if dry_run else get_mail_delivery()
+    total = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_send_group, pool, delivery, log, language, level,
+                                   recipients, dry_run): (language, level)
+                   for (language, level), recipients in groups.items()}
+        for future in as_completed(futures):
+            language, level = futures[future]
+            try:
+                total += future.result()
+            except Exception as e:
+                # The group stays unrecorded, so the next run retries it
+                logger.error("Error sending digest for %s/%s: %s", language, level, e)
+
+    if delivery is not None and wait:
+        print("Waiting for the mail queue to drain...")
+        delivery.flush(timeout=3600)
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Send the daily tip digest, one tip per language/level group.")
+    parser.add_argument("--workers", type=int, default=3, help="Concurrent tip generations.")
+    parser.add_argument("--dry-run", action="store_true", help="Generate tips but send nothing.")
+    parser.add_argument("--no-wait", action="store_true",
+                        help="Exit once queued; the durable outbox is delivered by the next sender.")
+    args = parser.parse_args(argv)
+    setup_logging()
+    run_digest(args.workers, args.dry_run, wait=not args.no_wait)
+
+
+if __name__ == "__main__":
+    main()
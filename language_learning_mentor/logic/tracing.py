@@ -0,0 +1,270 @@
+"""
+Lightweight tracing with OpenTelemetry-compatible export.
+
+Spans follow a quiz from the click on the dashboard to the rendered first
+question: ui.quiz_requested -> AppController.start_quiz -> worker thread ->
+LanguageProcessor.prepare_quiz_data -> prompt rendering / Crew construction /
+kickoff -> output read and parse -> Qt signal delivery -> QuizScreen.start_quiz.
+
+The current span lives in a contextvar; work handed to a thread keeps its
+parent through wrap(), and hops through queued Qt signals are bridged with
+handoff()/take_handoff(). A "flow" is a root span that stays open across
+several callbacks (e.g. until the quiz is shown).
+
+Ended spans are exported in OTLP/JSON, the format of the OTLP HTTP receiver:
+  MENTOR_TRACE_FILE=traces.jsonl        one ExportTraceServiceRequest per line
+  MENTOR_TRACE_ENDPOINT=http://localhost:4318   POSTed to <endpoint>/v1/traces
+Tracing is off (spans are no-ops) unless one of them is set.
+"""
+import atexit
+import contextvars
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+
+SERVICE_NAME = "language-learning-mentor"
+FLUSH_INTERVAL = 2.0   # seconds between background exports
+MAX_QUEUE = 10000      # ended spans kept while waiting for export
+
+logger = logging.getLogger(__name__)
+
+_current = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns",
+                 "attributes", "status", "_tracer")
+
+    def __init__(self, tracer, name, parent=None, attributes=None):
+        self._tracer = tracer
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.parent_id = parent.span_id if parent else None
+        self.span_id = secrets.token_hex(8)
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.attributes = dict(attributes or {})
+        self.status = None   # None (unset) or (code, message); code 2 = error
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_error(self, error):
+        self.status = (2, f"{type(error).__name__}: {error}")
+
+    def end(self):
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self._tracer._export(self)
+
+    def to_otlp(self):
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        if self.status:
+            span["status"] = {"code": self.status[0], "message": self.status[1]}
+        return span
+
+
+class _NoopSpan:
+    """Returned while tracing is disabled, so instrumented code costs almost nothing."""
+    name = trace_id = span_id = parent_id = None
+
+    def set_attribute(self, key, value):
+        pass
+
+    def record_error(self, error):
+        pass
+
+    def end(self):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+def _otlp_attribute(key, value):
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+# --- Exporters ---
+class OTLPFileExporter:
+    """Appends one OTLP/JSON ExportTraceServiceRequest per batch to a file."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def export(self, payload):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(payload) + "\n")
+
+
+class OTLPHttpExporter:
+    """POSTs OTLP/JSON batches to a collector (e.g. the OpenTelemetry Collector, Jaeger)."""
+
+    def __init__(self, endpoint, timeout=5.0):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.timeout = timeout
+
+    def export(self, payload):
+        request = urllib.request.Request(self.url, data=json.dumps(payload).encode("utf-8"),
+                                         headers={"Content-Type": "application/json"})
+        urllib.request.urlopen(request, timeout=self.timeout).close()
+
+
+class Tracer:
+    def __init__(self, exporters=()):
+        self.exporters = list(exporters)
+        self.enabled = bool(self.exporters)
+        self._queue = []
+        self._lock = threading.Lock()
+        self._flows = {}      # key -> open root span
+        self._handoffs = {}   # key -> span waiting for the receiving side
+        self._flusher = None
+        if self.enabled:
+            self._flusher = threading.Thread(target=self._flush_loop, name="trace-export",
+                                             daemon=True)
+            self._flusher.start()
+            atexit.register(self.flush)
+
+    # ------------------------------------------------------------------ SPANS
+    def current_span(self):
+        return _current.get()
+
+    def start_span(self, name, parent=None, attributes=None):
+        """Starts a span (child of `parent`, or of the current span). Call .end() on it."""
+        if not self.enabled:
+            return NOOP_SPAN
+        return Span(self, name, parent or _current.get(), attributes)
+
+    @contextmanager
+    def use_span(self, span):
+        """Makes `span` the current span inside the block (without ending it)."""
+        token = _current.set(span if span is not NOOP_SPAN else _current.get())
+        try:
+            yield span
+        finally:
+            _current.reset(token)
+
+    @contextmanager
+    def span(self, name, parent=None, **attributes):
+        """Starts a span, makes it current for the block and ends it afterwards."""
+        if not self.enabled:
+            yield NOOP_SPAN
+            return
+        span = self.start_span(name, parent, attributes)
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current.reset(token)
+            span.end()
+
+    def wrap(self, func):
+        """Binds `func` to the current context, so a thread running it keeps the parent span."""
+        if not self.enabled:
+            return func
+        context = contextvars.copy_context()
+        return lambda *args, **kwargs: context.run(func, *args, **kwargs)
+
+    # ------------------------------------------------------------------ FLOWS
+    def start_flow(self, key, name, **attributes):
+        """Opens a root span that stays open across callbacks until end_flow(key)."""
+        if not self.enabled:
+            return NOOP_SPAN
+        span = Span(self, name, None, attributes)
+        with self._lock:
+            previous, self._flows[key] = self._flows.get(key), span
+        if previous is not None:
+            previous.status = (2, "superseded before completion")
+            previous.end()
+        return span
+
+    def flow(self, key):
+        with self._lock:
+            return self._flows.get(key)
+
+    def end_flow(self, key):
+        with self._lock:
+            span = self._flows.pop(key, None)
+        if span is not None:
+            span.end()
+
+    def handoff(self, key, name):
+        """Starts a span for an asynchronous hop (e.g. a queued Qt signal) ended by take_handoff."""
+        if not self.enabled:
+            return
+        span = self.start_span(name)
+        with self._lock:
+            self._handoffs[key] = span
+
+    def take_handoff(self, key):
+        """Ends the hop started by handoff(key) and returns it (or None)."""
+        with self._lock:
+            span = self._handoffs.pop(key, None)
+        if span is not None:
+            span.end()
+        return span
+
+    # ------------------------------------------------------------------ EXPORT
+    def _export(self, span):
+        with self._lock:
+            if len(self._queue) < MAX_QUEUE:
+                self._queue.append(span)
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(FLUSH_INTERVAL)
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            spans, self._queue = self._queue, []
+        if not spans:
+            return
+        payload = {"resourceSpans": [{
+            "resource": {"attributes": [_otlp_attribute("service.name", SERVICE_NAME)]},
+            "scopeSpans": [{"scope": {"name": "language_learning_mentor"},
+                            "spans": [s.to_otlp() for s in spans]}],
+        }]}
+        for exporter in self.exporters:
+            try:
+                exporter.export(payload)
+            except Exception as e:
+                logger.warning("Trace export to %s failed: %s", type(exporter).__name__, e)
+
+
+def _tracer_from_env():
+    exporters = []
+    if os.getenv("MENTOR_TRACE_FILE"):
+        exporters.append(OTLPFileExporter(os.environ["MENTOR_TRACE_FILE"]))
+    if os.getenv("MENTOR_TRACE_ENDPOINT"):
+        exporters.append(OTLPHttpExporter(os.environ["MENTOR_TRACE_ENDPOINT"]))
+    return Tracer(exporters)
+
+
+TRACER = _tracer_from_env()
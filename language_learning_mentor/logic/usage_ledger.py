@@ -0,0 +1,213 @@
+"""
+Token and cost accounting with per-user daily budgets.
+
+Every crew kickoff is recorded in a small SQLite ledger, one row per
+(day, user, agent, model) with the prompt/completion tokens, LLM round trips,
+calls and estimated cost. Before a call, budget_tier() decides how the user is
+served today:
+
+  full         the agent's model from agents.yaml
+  fallback     the agent's fallback_model_name (a smaller, cheaper model)
+  cached_only  no LLM call: cached tips / the last generated quiz are reused
+
+A user over their own daily budget is moved to the fallback model, and to
+cached content past the hard budget. When a global daily budget is set, the
+last RESERVE_FRACTION of it is kept for light users: everyone drops to the
+fallback model and users already over their own budget get cached content
+only, so a few heavy users cannot use up the quota of everyone else.
+
+Budgets (tokens per day, prompt + completion), from the environment:
+  MENTOR_USER_DAILY_TOKENS       per-user budget (default 60000, 0 = unlimited)
+  MENTOR_USER_DAILY_TOKENS_HARD  per-user hard budget (default 2x the budget)
+  MENTOR_DAILY_TOKENS            global budget for all users (default 0 = unlimited)
+
+Usage (from the language_learning_mentor directory):
+    python -m logic.usage_ledger [--days 7] [--by user|agent|model|day]
+"""
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+
+from logic.config_manager import DATA_DIR
+
+LEDGER_PATH = DATA_DIR / "usage.sqlite3"
+
+FULL, FALLBACK, CACHED_ONLY = "full", "fallback", "cached_only"
+RESERVE_FRACTION = 0.2
+SYSTEM_USER = ""  # batch jobs (tip digest, CLI): recorded, never throttled
+
+# USD per million tokens (input, output), Groq on-demand pricing.
+# Models missing here are recorded with a cost of 0 and listed as unpriced.
+MODEL_PRICES = {
+    "llama-3.3-70b-versatile": (0.59, 0.79),
+    "llama-3.1-8b-instant": (0.05, 0.08),
+    "llama3-70b-8192": (0.59, 0.79),
+    "llama3-8b-8192": (0.05, 0.08),
+    "gemma2-9b-it": (0.20, 0.20),
+}
+
+REPORT_GROUPS = ("user", "agent", "model", "day")
+
+
+class BudgetExceeded(Exception):
+    """The user has no LLM budget left today and there is no cached content to serve."""
+
+
+def _env_int(name, default):
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def model_key(model):
+    """'groq/llama-3.3-70b-versatile' -> 'llama-3.3-70b-versatile'"""
+    return str(model or "").split("/", 1)[-1]
+
+
+def cost_usd(model, prompt_tokens, completion_tokens):
+    price_in, price_out = MODEL_PRICES.get(model_key(model), (0.0, 0.0))
+    return (prompt_tokens * price_in + completion_tokens * price_out) / 1_000_000
+
+
+class UsageLedger:
+    def __init__(self, path=LEDGER_PATH, user_daily_tokens=None, user_hard_tokens=None,
+                 daily_tokens=None):
+        self.path = str(path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)  # data dir is created on first use
+        self.user_daily_tokens = (_env_int("MENTOR_USER_DAILY_TOKENS", 60000)
+                                  if user_daily_tokens is None else user_daily_tokens)
+        self.user_hard_tokens = (_env_int("MENTOR_USER_DAILY_TOKENS_HARD", 2 * self.user_daily_tokens)
+                                 if user_hard_tokens is None else user_hard_tokens)
+        self.daily_tokens = (_env_int("MENTOR_DAILY_TOKENS", 0)
+                             if daily_tokens is None else daily_tokens)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS usage (
+                day TEXT NOT NULL,
+                user TEXT NOT NULL,
+                agent TEXT NOT NULL,
+                model TEXT NOT NULL,
+                calls INTEGER NOT NULL DEFAULT 0,
+                requests INTEGER NOT NULL DEFAULT 0,
+                prompt_tokens INTEGER NOT NULL DEFAULT 0,
+                completion_tokens INTEGER NOT NULL DEFAULT 0,
+                cost_usd REAL NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (day, user, agent, model)
+            )""")
+
+    # ------------------------------------------------------------------ RECORDING
+    def record(self, username, agent, model, prompt_tokens=0, completion_tokens=0,
+               requests=0, day=None):
+        """Adds one call's token usage to the user's row for the day."""
+        day = day or date.today().isoformat()
+        model = model_key(model)
+        cost = cost_usd(model, prompt_tokens, completion_tokens)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO usage (day, user, agent, model, calls, requests, prompt_tokens, "
+                "completion_tokens, cost_usd, updated_at) VALUES (?, ?, ?, ?, 1, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (day, user, agent, model) DO UPDATE SET "
+                "calls = calls + 1, requests = requests + excluded.requests, "
+                "prompt_tokens = prompt_tokens + excluded.prompt_tokens, "
+                "completion_tokens = completion_tokens + excluded.completion_tokens, "
+                "cost_usd = cost_usd + excluded.cost_usd, updated_at = excluded.updated_at",
+                (day, username or SYSTEM_USER, agent, model, requests, prompt_tokens,
+                 completion_tokens, cost, time.time()))
+        return cost
+
+    # ------------------------------------------------------------------ BUDGETS
+    def tokens_used(self, username=None, day=None):
+        """Tokens used on `day` by one user, or by everyone when username is None."""
+        day = day or date.today().isoformat()
+        query = "SELECT COALESCE(SUM(prompt_tokens + completion_tokens), 0) FROM usage WHERE day = ?"
+        params = [day]
+        if username is not None:
+            query += " AND user = ?"
+            params.append(username)
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+    def budget_tier(self, username, day=None):
+        """FULL, FALLBACK or CACHED_ONLY for the user's next call today."""
+        if not username:
+            return FULL
+        used = self.tokens_used(username, day)
+        if self.user_hard_tokens and used >= self.user_hard_tokens:
+            return CACHED_ONLY
+        over_own = bool(self.user_daily_tokens) and used >= self.user_daily_tokens
+        if self.daily_tokens:
+            total = self.tokens_used(None, day)
+            if total >= self.daily_tokens:
+                return CACHED_ONLY
+            if total >= (1 - RESERVE_FRACTION) * self.daily_tokens:
+                return CACHED_ONLY if over_own else FALLBACK
+        return FALLBACK if over_own else FULL
+
+    # ------------------------------------------------------------------ REPORT
+    def report(self, since=None, until=None, by="user"):
+        """Totals per user / agent / model / day between two ISO days (inclusive)."""
+        if by not in REPORT_GROUPS:
+            raise ValueError(f"Cannot group the report by {by!r}")
+        until = until or date.today().isoformat()
+        since = since or until
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {by}, SUM(calls), SUM(requests), SUM(prompt_tokens), "
+                f"SUM(completion_tokens), SUM(cost_usd) FROM usage "
+                f"WHERE day BETWEEN ? AND ? GROUP BY {by} ORDER BY SUM(cost_usd) DESC, {by}",
+                (since, until)).fetchall()
+            unpriced = [m for (m,) in self._conn.execute(
+                "SELECT DISTINCT model FROM usage WHERE day BETWEEN ? AND ?", (since, until))
+                if m not in MODEL_PRICES]
+        groups = [{by: key, "calls": calls, "requests": requests, "prompt_tokens": prompt,
+                   "completion_tokens": completion, "cost_usd": round(cost, 6)}
+                  for key, calls, requests, prompt, completion, cost in rows]
+        return {
+            "since": since,
+            "until": until,
+            "by": by,
+            "groups": groups,
+            "total": {
+                "calls": sum(g["calls"] for g in groups),
+                "prompt_tokens": sum(g["prompt_tokens"] for g in groups),
+                "completion_tokens": sum(g["completion_tokens"] for g in groups),
+                "cost_usd": round(sum(g["cost_usd"] for g in groups), 6),
+            },
+            "unpriced_models": unpriced,
+        }
+
+
+# --- Process-wide instance ---
+_ledger = None
+_ledger_lock = threading.Lock()
+
+def get_usage_ledger():
+    global _ledger
+    with _ledger_lock:
+        if _ledger is None:
+            _ledger = UsageLedger()
+        return _ledger
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Token usage and estimated LLM cost report.")
+    parser.add_argument("--days", type=int, default=1, help="Days to include, ending today.")
+    parser.add_argument("--by", choices=REPORT_GROUPS, default="user")
+    args = parser.parse_args(argv)
+    until = date.today()
+    since = until - timedelta(days=max(1, args.days) - 1)
+    report = get_usage_ledger().report(since.isoformat(), until.isoformat(), args.by)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""
+Streaming bulk export / import of user profiles and attempt histories.
+
+One user per line of newline-delimited JSON:
+    {"username": "...", "profile": {...save_user_config data...}, "history": [...]}
+
+Files ending in .gz are gzip-compressed on the fly; "-" means stdin/stdout.
+Both directions keep at most --window records in flight, so memory stays
+constant regardless of the number of users, while --workers threads read /
+parse / write user files in parallel. Every record is validated before it is
+written on import. Without --overwrite a profile is created exclusively, so a
+username repeated in the input is imported once and reported as existing after;
+if its history then cannot be written the new profile is removed again.
+Unreadable history lines are skipped on export (as load_attempt_history does)
+and counted in the final progress line.
+
+Usage (from the language_learning_mentor directory):
+    python -m logic.user_export export users.jsonl.gz
+    python -m logic.user_export import users.jsonl.gz [--overwrite] [--dry-run]
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from logic.config_manager import (iter_user_config_paths, get_config_path, get_history_path,
+                                  save_user_config)
+from logic.user_session import SUPPORTED_LANGUAGES
+
+PROFILE_FIELDS = {
+    'email': str,
+    'language': str,
+    'progress': int,
+    'level': str,
+    'theme': str,
+    'last_tip_date': str,
+    'last_tip_text': str,
+}
+
+
+# --- Validation ---
+def validate_record(record):
+    """Returns a list of problems with an import record (empty if valid)."""
+    if not isinstance(record, dict):
+        return ["record is not a JSON object"]
+    errors = []
+    username = record.get('username')
+    if not isinstance(username, str) or not username.strip():
+        errors.append("missing username")
+
+    profile = record.get('profile')
+    if not isinstance(profile, dict):
+        return errors + ["missing profile object"]
+    for field, expected in PROFILE_FIELDS.items():
+        value = profile.get(field)
+        if value is not None and not isinstance(value, expected):
+            errors.append(f"{field} must be {expected.__name__}")
+    if isinstance(profile.get('progress'), int) and profile['progress'] < 0:
+        errors.append("progress must be >= 0")
+    if profile.get('language') not in (None, *SUPPORTED_LANGUAGES):
+        errors.append(f"unsupported language {profile['language']!r}")
+    if profile.get('theme') not in (None, 'light', 'dark'):
+        errors.append(f"unknown theme {profile['theme']!r}")
+    if isinstance(profile.get('last_tip_date'), str):
+        try:
+            date.fromisoformat(profile['last_tip_date'])
+        except ValueError:
+            errors.append("last_tip_date is not an ISO date")
+
+    history = record.get('history', [])
+    if not isinstance(history, list) or \
+            not all(isinstance(h, dict) and isinstance(h.get('ts'), (int, float)) for h in history):
+        errors.append("history must be a list of attempts with a numeric ts")
+    return errors
+
+
+# --- Streaming helpers ---
+def _open(path, mode):
+    """Opens a text stream; .gz is (de)compressed on the fly, '-' is stdin/stdout."""
+    if path == '-':
+        return sys.stdin if 'r' in mode else sys.stdout
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8', compresslevel=6)
+    return open(path, mode, encoding='utf-8')
+
+
+def _bounded_map(executor, fn, iterable, window):
+    """Like executor.map, but never has more than `window` tasks pending (constant memory)."""
+    pending = deque()
+    for item in iterable:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class Progress:
+    """Throttled progress line on stderr."""
+
+    def __init__(self, label, every=1.0):
+        self.label = label
+        self.every = every
+        self.count = 0
+        self.errors = 0
+        self.skipped_lines = 0
+        self.start = self._last = time.monotonic()
+
+    def tick(self, ok=True):
+        self.count += 1
+        if not ok:
+            self.errors += 1
+        now = time.monotonic()
+        if now - self._last >= self.every:
+            self._last = now
+            self._print(now)
+
+    def done(self):
+        self._print(time.monotonic(), end="\n")
+
+    def _print(self, now, end="\r"):
+        rate = self.count / max(now - self.start, 1e-9)
+        skipped = f", {self.skipped_lines} bad history lines skipped" if self.skipped_lines else ""
+        print(f"{self.label}: {self.count} users, {self.errors} errors{skipped}, {rate:,.0f}/s",
+              end=end, file=sys.stderr, flush=True)
+
+
+# --- Export ---
+def _read_user(config_path):
+    """(NDJSON line or None if the profile is unreadable, number of bad history lines skipped)."""
+    try:
+        with open(config_path, 'r') as f:
+            profile = json.load(f)
+        history, bad = [], 0
+        history_path = config_path.with_suffix(".history.jsonl")
+        if history_path.exists():
+            with open(history_path, 'r') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        history.append(json.loads(line))
+                    except ValueError:
+                        bad += 1
+        if bad:
+            print(f"\n{history_path}: skipped {bad} unreadable history line(s)", file=sys.stderr)
+        username = profile.pop('username', None) or config_path.stem
+        return json.dumps({'username': username, 'profile': profile, 'history': history},
+                          ensure_ascii=False, separators=(',', ':')), bad
+    except (ValueError, IOError) as e:
+        print(f"\nSkipping {config_path}: {e}", file=sys.stderr)
+        return None, 0
+
+
+def export_users(output, workers=8, window=1024):
+    progress = Progress("export")
+    out = _open(output, 'w')
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for line, bad in _bounded_map(executor, _read_user, iter_user_config_paths(), window):
+                if line is not None:
+                    out.write(line + "\n")
+                progress.skipped_lines += bad
+                progress.tick(line is not None)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    progress.done()
+    return progress.count - progress.errors
+
+
+# --- Import ---
+def _write_user(item, overwrite, dry_run):
+    line_no, line = item
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        return line_no, [f"invalid JSON: {e}"]
+    errors = validate_record(record)
+    if errors or dry_run:
+        return line_no, errors
+
+    username = record['username'].strip()
+    try:
+        # Exclusive create: no window between an existence check and the write
+        if not save_user_config(username, record['profile'], exclusive=not overwrite):
+            return line_no, ["could not write profile"]
+    except FileExistsError:
+        return line_no, ["user already exists (use --overwrite)"]
+
+    history_path = get_history_path(username)
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile('w', dir=history_path.parent, prefix=history_path.stem + ".",
+                                         suffix=".tmp", delete=False) as f:
+            tmp_path = f.name
+            for attempt in record.get('history', []):
+                f.write(json.dumps(attempt, separators=(',', ':')) + "\n")
+        os.replace(tmp_path, history_path)
+    except OSError as e:
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        if not overwrite:
+            # Don't leave a profile we just created without its history
+            get_config_path(username).unlink(missing_ok=True)
+        return line_no, [f"could not write history: {e}"]
+    return line_no, []
+
+
+def import_users(source, workers=8, window=1024, overwrite=False, dry_run=False, max_errors=20):
+    progress = Progress("import (dry run)" if dry_run else "import")
+    src = _open(source, 'r')
+    lines = ((n, line) for n, line in enumerate(src, 1) if line.strip())
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for line_no, errors in _bounded_map(
+                    executor, lambda item: _write_user(item, overwrite, dry_run), lines, window):
+                if errors and progress.errors < max_errors:
+                    print(f"\nline {line_no}: {'; '.join(errors)}", file=sys.stderr)
+                progress.tick(not errors)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+    progress.done()
+    return progress.count - progress.errors, progress.errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk export/import of user profiles and histories.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    exp = sub.add_parser("export", help="Write all users as NDJSON (.gz to compress, - for stdout).")
+    exp.add_argument("output")
+    imp = sub.add_parser("import", help="Load users from NDJSON (.gz supported, - for stdin).")
+    imp.add_argument("source")
+    imp.add_argument("--overwrite", action="store_true", help="Replace users that already exist.")
+    imp.add_argument("--dry-run", action="store_true", help="Only validate the records.")
+    for p in (exp, imp):
+        p.add_argument("--workers", type=int, default=min(32, (os.cpu_count() or 1) * 4))
+        p.add_argument("--window", type=int, default=1024, help="Max records in flight.")
+
+    args = parser.parse_args(argv)
+    if args.command == "export":
+        export_users(args.output, args.workers, args.window)
+    else:
+        _, failed = import_users(args.source, args.workers, args.window,
+                                 args.overwrite, args.dry_run)
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
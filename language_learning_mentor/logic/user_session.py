@@ -0,0 +1,253 @@
+"""
+Qt-free per-user state for headless entry points.
+
+AppController keeps the desktop app's single logged-in user and talks to the UI
+through signals. UserSession holds the same state for one user without any Qt
+dependency, so a server process can keep one instance per connected learner.
+Errors are raised as SessionError instead of being emitted as status messages.
+"""
+import logging
+import os
+import threading
+import time
+from datetime import date
+
+from logic.config_manager import (load_user_config, save_user_config, user_exists,
+                                  append_attempt_history, load_attempt_history)
+from logic.progress_analytics import ProgressAnalytics
+from logic.response_log import append_response
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_LANGUAGES = ['Italian', 'French', 'Spanish']
+
+# Result email after every finished quiz (MENTOR_QUIZ_EMAILS=0 turns it off)
+QUIZ_RESULT_EMAILS = os.getenv("MENTOR_QUIZ_EMAILS", "1") != "0"
+
+
+class SessionError(Exception):
+    """A user-facing error (unknown user, missing language, ...)."""
+
+
+# --- Level rules shared with AppController ---
+def calculate_level(exp):
+    """Calculates the user's level based on EXP."""
+    if exp < 100:
+        return "Beginner"
+    elif exp < 500:
+        return "Intermediate"
+    elif exp < 1500:
+        return "Advanced"
+    elif exp < 3000:
+        return "Proficient"
+    else:
+        return "Master"
+
+def level_from_test_score(score, total=5):
+    """Maps a level-test score (0–total) onto the six assessment levels."""
+    percentage = (score / total) * 100
+    if   percentage < 20: return "Beginner"
+    elif percentage < 40: return "Pre-Intermediate"
+    elif percentage < 60: return "Intermediate"
+    elif percentage < 80: return "Pre-Advanced"
+    elif percentage < 95: return "Advanced"
+    else:                 return "Master"
+
+
+# --- Quiz results shared with AppController ---
+def score_quiz(correct, wrong):
+    """Final quiz score: one point per correct answer, minus one per wrong answer."""
+    return correct - wrong
+
+def format_quiz_result(username, language, level, correct, wrong):
+    """Subject and body of the email sent after a quiz."""
+    score = score_quiz(correct, wrong)
+    subject = f"Your {language} quiz: {score} points"
+    body = (f"Hi {username},\n\n"
+            f"you finished a {language} quiz ({level}): {correct} correct, "
+            f"{wrong} wrong, final score {score}.\n\n"
+            f"— Language Learning Mentor")
+    return subject, body
+
+def notify_quiz_result(email, username, language, level, correct, wrong):
+    """Queues the quiz-result email. Returns False if nothing was queued."""
+    if not email or not QUIZ_RESULT_EMAILS:
+        return False
+    from logic.mail_queue import enqueue_email  # SMTP stack loaded only when mailing
+    try:
+        enqueue_email(email, *format_quiz_result(username, language, level, correct, wrong))
+        return True
+    except Exception as e:
+        logger.warning("Could not queue the quiz result email for %s: %s", username, e)
+        return False
+
+
+class UserSession:
+    """State and operations for one logged-in learner."""
+
+    def __init__(self):
+        self.lock = threading.RLock()  # serializes requests of the same session
+        self.username = None
+        self.email = None
+        self.language = None
+        self.progress = 0
+        self.level = "Beginner"
+        self.theme = 'light'
+        self.last_tip_date = None
+        self.last_tip_text = None
+        self.analytics = ProgressAnalytics()
+        self._pending_correct = 0
+        self._pending_total = 0
+        self.quiz_served = 0  # questions of the last quiz served, not yet scored
+        self.last_seen = time.monotonic()
+
+    # ------------------------------------------------------------------ ACCOUNT
+    def login(self, username):
+        """Loads an existing user. Raises SessionError if unknown."""
+        username = (username or "").strip()
+        if not username:
+            raise SessionError("Please enter a nickname.")
+        config_data = load_user_config(username)
+        if not config_data:
+            raise SessionError("User not found. Please register.")
+
+        self.username = username
+        self.email = config_data.get('email')
+        self.language = config_data.get('language')
+        self.progress = config_data.get('progress', 0)
+        self.level = config_data.get('level', 'Beginner')
+        self.theme = config_data.get('theme', 'light')
+        self.last_tip_date = config_data.get('last_tip_date')
+        self.last_tip_text = config_data.get('last_tip_text')
+        self.analytics = ProgressAnalytics.from_records(load_attempt_history(username))
+        return self.state()
+
+    def register(self, username, email):
+        """Creates a new user. Raises SessionError if it already exists."""
+        username, email = (username or "").strip(), (email or "").strip()
+        if not username or not email:
+            raise SessionError("Nickname and email are required.")
+        if user_exists(username):
+            raise SessionError("User already exists. Please log in.")
+
+        self.username = username
+        self.email = email
+        self.save()
+        return self.state()
+
+    def select_language(self, language):
+        self.require_login()
+        if language not in SUPPORTED_LANGUAGES:
+            raise SessionError(f"Invalid language selected: {language}")
+        self.language = language
+        self.save()
+        return self.state()
+
+    def require_login(self):
+        if not self.username:
+            raise SessionError("No user logged in.")
+
+    def require_language(self):
+        self.require_login()
+        if not self.language:
+            raise SessionError("Please select a language first.")
+
+    # ------------------------------------------------------------------ STATE
+    def save(self):
+        if not self.username:
+            return
+        save_user_config(self.username, {
+            'email': self.email,
+            'language': self.language,
+            'progress': self.progress,
+            'level': self.level,
+            'theme': self.theme,
+            'last_tip_date': self.last_tip_date,
+            'last_tip_text': self.last_tip_text,
+        })
+
+    def state(self):
+        return {
+            'username': self.username,
+            'language': self.language,
+            'progress': self.progress,
+            'level': self.level,
+            'theme': self.theme,
+            'stats': self.analytics.summary(self.progress),
+        }
+
+    # ------------------------------------------------------------------ TIPS
+    def cached_tip(self):
+        """Today's tip if it was already generated for this user."""
+        if self.last_tip_date == date.today().isoformat() and self.last_tip_text:
+            return self.last_tip_text
+        return None
+
+    def store_tip(self, tip):
+        self.last_tip_date = date.today().isoformat()
+        self.last_tip_text = tip
+        self.save()
+
+    # ------------------------------------------------------------------ RESULTS
+    def record_response(self, kind, question_text, correct):
+        self.require_login()
+        append_response(self.username, kind, self.language, self.level,
+                        question_text, correct)
+        self._pending_total += 1
+        self._pending_correct += 1 if correct else 0
+
+    def serve_quiz(self, questions):
+        """A new quiz was handed out: answers are counted from here."""
+        self.quiz_served = len(questions)
+        self._pending_correct = 0
+        self._pending_total = 0
+
+    def quiz_counts(self, correct=0, wrong=0):
+        """
+        (correct, wrong) of the quiz served last: from the answers recorded with
+        record_response, else the client's counts. Raises SessionError if either
+        is more than the questions served.
+        """
+        self.require_login()
+        if self._pending_total:
+            correct, wrong = self._pending_correct, self._pending_total - self._pending_correct
+        if not self.quiz_served or correct + wrong > self.quiz_served:
+            raise SessionError(f"{correct + wrong} answers for a quiz of {self.quiz_served} questions.")
+        self.quiz_served = 0
+        return correct, wrong
+
+    def _record_attempt(self, topic, exp):
+        record = {
+            'ts': time.time(),
+            'topic': topic,
+            'level': self.level,
+            'exp': exp,
+            'correct': self._pending_correct,
+            'total': self._pending_total,
+        }
+        self._pending_correct = 0
+        self._pending_total = 0
+        append_attempt_history(self.username, record)
+        self.analytics.add_attempt(record)
+
+    def add_exp(self, amount):
+        """Adds EXP for a finished quiz. Returns True if the user levelled up."""
+        self.require_login()
+        if amount < 0:
+            raise SessionError("EXP amount must be positive.")
+        self._record_attempt('quiz', amount)
+        self.progress += amount
+        old_level = self.level
+        self.level = calculate_level(self.progress)
+        self.save()
+        return self.level != old_level
+
+    def process_level_test_results(self, score):
+        """Updates the level from a level-test score (0–5)."""
+        self.require_login()
+        self._record_attempt('level_test', 0)
+        new_level = level_from_test_score(score)
+        if new_level != self.level:
+            self.level = new_level
+            self.save()
+        return self.level
@@ -1,5 +1,27 @@
 import sys
+import argparse
+
+# --profile-startup has to be handled before the imports below, so that their cost is recorded
+_parser = argparse.ArgumentParser(add_help=False)
+_parser.add_argument("--profile-startup", nargs="?", const="startup_profile.json", default=None,
+                     metavar="JSON_PATH",
+                     help="Record import times and screen/theme/crew init, write a report and exit.")
+_parser.add_argument("--watchdog", nargs="?", const="event_loop_latency.json", default=None,
+                     metavar="JSON_PATH",
+                     help="Measure event-loop lag, log stalls with the main thread stack, "
+                          "write the lag histogram on exit.")
+_parser.add_argument("--watchdog-threshold", type=float, default=200, metavar="MS",
+                     help="Stall threshold for --watchdog (default 200 ms).")
+_args, _qt_argv = _parser.parse_known_args()
+
+from logic.logging_setup import setup_logging
+setup_logging()
+if _args.profile_startup:
+    from logic.startup_profiler import PROFILER
+    PROFILER.enable()
+
 from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QTimer
 
 # Assuming ui.main_window exists and contains the main application window class
 from gui.main_window import MainWindow
@@ -8,9 +30,39 @@ from gui.main_window import MainWindow
 # print("Available styles:", QApplication.setStyle('Fusion')) # Uncomment to see available styles
 QApplication.setStyle('Fusion')
 
+
+def _finish_startup_profile(app, window, json_path):
+    """Runs after the first paint: loads the LLM stack too, then reports and quits."""
+    with PROFILER.section("LanguageProcessor.warm_up (LLM stack)"):
+        window.controller.lang_processor.warm_up()
+    PROFILER.disable()
+    PROFILER.write_json(json_path)
+    print(PROFILER.format_report())
+    print(f"\nJSON profile written to {json_path}")
+    app.quit()
+
+
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    app = QApplication([sys.argv[0]] + _qt_argv)
     # The MainWindow class will now handle creating/connecting the controller and other UI parts
     window = MainWindow()
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    if _args.watchdog:
+        from gui.event_loop_watchdog import EventLoopWatchdog
+        watchdog = EventLoopWatchdog(threshold_ms=_args.watchdog_threshold)
+        watchdog.start()
+
+        def _write_watchdog_report():
+            watchdog.stop()
+            watchdog.write_json(_args.watchdog)
+            lag = watchdog.histogram.as_dict()
+            print(f"Event-loop lag: p50 {lag['p50_ms']} ms, p95 {lag['p95_ms']} ms, "
+                  f"max {lag['max_ms']} ms, {len(watchdog.stalls)} stalls -> {_args.watchdog}")
+        app.aboutToQuit.connect(_write_watchdog_report)
+    if _args.profile_startup:
+        PROFILER.record("startup until window.show()", PROFILER.as_dict()["elapsed_s"])
+        QTimer.singleShot(0, lambda: _finish_startup_profile(app, window, _args.profile_startup))
+    else:
+        # Import/initialize crewai + langchain only after the login window is painted
+        QTimer.singleShot(0, window.controller.warm_up_in_background)
+    sys.exit(app.exec())
@@ -0,0 +1,369 @@
+"""
+Headless HTTP/JSON service mode.
+
+Serves login, tips, quizzes and level tests to many concurrent learners from
+one process, without Qt. Every login gets its own token (returned from /login
+or /register), but all the tokens of a user share one UserSession, so EXP and
+history earned from two clients are never overwritten; a missing or expired
+token is a 401. LLM work goes through a shared
+ProcessorPool and tips come from the shared TipCache (per language, level, day).
+
+Run from the language_learning_mentor directory:
+    poetry run python service.py --port 8080 --workers 4
+
+Endpoints (JSON in/out, session token in the "X-Session-Token" header):
+    POST /register      {"username", "email"}  -> {"token", "state"}
+    POST /login         {"username"}           -> {"token", "state"}
+    POST /logout
+    GET  /state
+    POST /language      {"language"}
+    GET  /tip
+    GET  /quiz
+    POST /quiz/result   {"correct", "wrong"}   (10 EXP per correct answer; queues the result email.
+                                                Counted from the /answer calls since the last /quiz
+                                                if any, never more than the questions served)
+    GET  /level-test
+    POST /level-test/result {"score"}
+    POST /answer        {"kind", "question", "correct"}
+    GET  /health
+    GET  /metrics       Prometheus text format (LLM latency, tokens, retries, caches)
+
+Token usage is charged to the session's user (logic/usage_ledger.py); past the
+daily budget tips/quizzes come from the caches, or the request gets a 429.
+"""
+import argparse
+import json
+import logging
+import secrets
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from logic.config_manager import user_key
+from logic.logging_setup import setup_logging
+from logic.metrics import REGISTRY, SnapshotWriter
+from logic.processor_pool import ProcessorPool, ProcessorPoolExhausted
+from logic.tip_cache import get_tip_cache
+from logic.usage_ledger import BudgetExceeded
+from logic.user_session import UserSession, SessionError, notify_quiz_result, score_quiz
+
+SESSION_IDLE_TIMEOUT = 2 * 3600  # seconds
+
+logger = logging.getLogger("service")
+
+
+class InvalidSession(SessionError):
+    """Missing, unknown or expired session token (HTTP 401)."""
+
+
+class SessionStore:
+    """Token -> UserSession map with idle expiry; one UserSession per user."""
+
+    def __init__(self, idle_timeout=SESSION_IDLE_TIMEOUT):
+        self._sessions = {}   # token -> UserSession
+        self._by_user = {}    # user_key -> the UserSession all its tokens share
+        self._lock = threading.Lock()
+        self._idle_timeout = idle_timeout
+        self._last_sweep = time.monotonic()
+
+    def live(self, username):
+        """The UserSession of a user who is already logged in, or None."""
+        with self._lock:
+            return self._by_user.get(user_key(username or ""))
+
+    def create(self, session):
+        """
+        New token for `session`'s user. If the user is already logged in the
+        token is bound to their live session instead. Returns (token, session).
+        """
+        token = secrets.token_urlsafe(24)
+        with self._lock:
+            session = self._by_user.setdefault(user_key(session.username), session)
+            self._sessions[token] = session
+        return token, session
+
+    def get(self, token):
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_sweep > 60:
+                self._sweep(now)
+            session = self._sessions.get(token)
+        if session is None:
+            raise InvalidSession("Invalid or expired session. Please log in.")
+        session.last_seen = now
+        return session
+
+    def remove(self, token):
+        with self._lock:
+            self._drop(token)
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def _drop(self, token):
+        session = self._sessions.pop(token, None)
+        if session is not None and session not in self._sessions.values():
+            self._by_user.pop(user_key(session.username), None)
+
+    def _sweep(self, now):
+        expired = [t for t, s in self._sessions.items()
+                   if now - s.last_seen > self._idle_timeout]
+        for token in expired:
+            self._drop(token)
+        self._last_sweep = now
+
+
+def count_field(body, field):
+    """body[field] as an int >= 0 (0 if missing); SessionError, i.e. HTTP 400, otherwise."""
+    value = body.get(field, 0)
+    try:
+        if isinstance(value, bool) or not isinstance(value, (int, str)):
+            raise ValueError
+        value = int(value)
+    except ValueError:
+        raise SessionError(f"{field!r} must be a non-negative integer.") from None
+    if value < 0:
+        raise SessionError(f"{field!r} must be a non-negative integer.")
+    return value
+
+
+class MentorService:
+    """Request handlers, independent of the HTTP plumbing."""
+
+    def __init__(self, workers=4):
+        self.sessions = SessionStore()
+        self.pool = ProcessorPool(size=workers)
+        self.tip_cache = get_tip_cache()
+
+    # ------------------------------------------------------------------ ACCOUNT
+    def register(self, body, token=None):
+        session = UserSession()
+        session.register(body.get("username"), body.get("email"))
+        return self._open(session)
+
+    def login(self, body, token=None):
+        session = self.sessions.live(body.get("username"))
+        if session is None:
+            session = UserSession()
+            session.login(body.get("username"))
+        return self._open(session)
+
+    def _open(self, session):
+        token, session = self.sessions.create(session)
+        with session.lock:
+            return {"token": token, "state": session.state()}
+
+    def logout(self, body, token):
+        session = self.sessions.get(token)
+        with session.lock:
+            session.save()
+        self.sessions.remove(token)
+        return {"ok": True}
+
+    def state(self, body, token):
+        session = self.sessions.get(token)
+        with session.lock:
+            return session.state()
+
+    def language(self, body, token):
+        session = self.sessions.get(token)
+        with session.lock:
+            return session.select_language(body.get("language"))
+
+    # ------------------------------------------------------------------ CONTENT
+    def tip(self, body, token):
+        session = self.sessions.get(token)
+        with session.lock:
+            session.require_language()
+            cached = session.cached_tip()
+            if cached:
+                return {"tip": cached, "cached": True}
+            username, language, level = session.username, session.language, session.level
+
+        try:
+            tip, cached = self.tip_cache.get_tip(
+                username, language, level,
+                lambda level, language: self._generate_tip(level, language, username))
+        except BudgetExceeded:
+            # Out of budget: any cached tip of the same language/level, else 429
+            tip, cached = self.tip_cache.any_tip(language, level), True
+            if tip is None:
+                raise
+
+        with session.lock:
+            session.store_tip(tip)
+        return {"tip": tip, "cached": cached}
+
+    def _generate_tip(self, level, language, username):
+        with self.pool.processor() as proc:
+            return proc.generate_daily_tip(level, language, username=username)
+
+    def quiz(self, body, token):
+        session = self.sessions.get(token)
+        with session.lock:
+            session.require_language()
+            username, level, language = session.username, session.level, session.language
+        with self.pool.processor() as proc:
+            questions = proc.prepare_quiz_data(level, language, username=username)
+        with session.lock:
+            session.serve_quiz(questions)
+        return {"questions": questions}
+
+    def level_test(self, body, token):
+        session = self.sessions.get(token)
+        with session.lock:
+            session.require_language()
+            username, level, language = session.username, session.level, session.language
+        with self.pool.processor() as proc:
+            return {"questions": proc.prepare_detect_quiz(level, language, username=username)}
+
+    # ------------------------------------------------------------------ RESULTS
+    def answer(self, body, token):
+        session = self.sessions.get(token)
+        with session.lock:
+            session.record_response(body.get("kind", "quiz"), body.get("question", ""),
+                                    bool(body.get("correct")))
+        return {"ok": True}
+
+    def quiz_result(self, body, token):
+        session = self.sessions.get(token)
+        correct, wrong = count_field(body, "correct"), count_field(body, "wrong")
+        with session.lock:
+            correct, wrong = session.quiz_counts(correct, wrong)
+            levelled_up = session.add_exp(correct * 10)
+            notify_quiz_result(session.email, session.username, session.language, session.level,
+                               correct, wrong)
+            return {"exp_earned": correct * 10, "score": score_quiz(correct, wrong),
+                    "levelled_up": levelled_up, "state": session.state()}
+
+    def level_test_result(self, body, token):
+        session = self.sessions.get(token)
+        with session.lock:
+            session.process_level_test_results(count_field(body, "score"))
+            return session.state()
+
+    def health(self, body, token=None):
+        return {"ok": True, "sessions": len(self.sessions)}
+
+    def metrics(self, body, token=None):
+        return PlainText(REGISTRY.render_prometheus(),
+                         "text/plain; version=0.0.4; charset=utf-8")
+
+
+class PlainText(str):
+    """A handler result sent as-is instead of JSON."""
+
+    def __new__(cls, text, content_type):
+        obj = super().__new__(cls, text)
+        obj.content_type = content_type
+        return obj
+
+
+ROUTES = {
+    ("POST", "/register"): "register",
+    ("POST", "/login"): "login",
+    ("POST", "/logout"): "logout",
+    ("GET", "/state"): "state",
+    ("POST", "/language"): "language",
+    ("GET", "/tip"): "tip",
+    ("GET", "/quiz"): "quiz",
+    ("POST", "/quiz/result"): "quiz_result",
+    ("GET", "/level-test"): "level_test",
+    ("POST", "/level-test/result"): "level_test_result",
+    ("POST", "/answer"): "answer",
+    ("GET", "/health"): "health",
+    ("GET", "/metrics"): "metrics",
+}
+
+
+def make_handler(service):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive between requests of a client
+
+        def _dispatch(self, method):
+            route = ROUTES.get((method, urlsplit(self.path).path))
+            if route is None:
+                return self._reply(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}") if length else {}
+                if not isinstance(body, dict):
+                    raise ValueError("JSON body must be an object")
+            except ValueError as e:
+                return self._reply(HTTPStatus.BAD_REQUEST, {"error": f"Invalid JSON: {e}"})
+
+            token = self.headers.get("X-Session-Token")
+            try:
+                result = getattr(service, route)(body, token)
+            except InvalidSession as e:
+                return self._reply(HTTPStatus.UNAUTHORIZED, {"error": str(e)})
+            except SessionError as e:
+                return self._reply(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            except ProcessorPoolExhausted as e:
+                return self._reply(HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(e)})
+            except BudgetExceeded as e:
+                return self._reply(HTTPStatus.TOO_MANY_REQUESTS, {"error": str(e)})
+            except Exception as e:
+                logger.exception("Service error on %s %s", method, self.path)
+                return self._reply(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)})
+            self._reply(HTTPStatus.OK, result)
+
+        def _reply(self, status, payload):
+            if isinstance(payload, PlainText):
+                data, content_type = payload.encode("utf-8"), payload.content_type
+            else:
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                content_type = "application/json; charset=utf-8"
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            self._dispatch("GET")
+
+        def do_POST(self):
+            self._dispatch("POST")
+
+        def log_message(self, format, *args):
+            pass  # per-request console logging is too noisy with many clients
+
+    return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Language Learning Mentor headless service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Size of the shared LanguageProcessor pool (concurrent LLM calls).")
+    parser.add_argument("--metrics-snapshot", metavar="JSON_PATH",
+                        help="Also write the metrics as JSON to this file periodically.")
+    parser.add_argument("--metrics-interval", type=float, default=60.0,
+                        help="Seconds between metrics snapshots (default 60).")
+    args = parser.parse_args(argv)
+    setup_logging()
+
+    service = MentorService(workers=args.workers)
+    from logic.mail_queue import resume_pending_delivery
+    resume_pending_delivery()  # mail left unsent by a previous run
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(service))
+    server.daemon_threads = True
+    snapshots = (SnapshotWriter(REGISTRY, args.metrics_snapshot, args.metrics_interval).start()
+                 if args.metrics_snapshot else None)
+    logger.info("Serving on http://%s:%s with %s workers", args.host, args.port, args.workers)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if snapshots is not None:
+            snapshots.stop()
+
+
+if __name__ == "__main__":
+    main()
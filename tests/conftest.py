@@ -0,0 +1,31 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# The app imports its modules as top-level packages (logic, gui, crew, ...)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "language_learning_mentor"))
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    """LanguageProcessor with its quiz queue, usage ledger and item bank under tmp_path."""
+    from logic import language_processor
+    from logic.quiz_queue import QuizQueue
+    from logic.usage_ledger import UsageLedger
+
+    queue = QuizQueue(tmp_path / "queue.sqlite3")
+    ledger = UsageLedger(tmp_path / "usage.sqlite3")
+    monkeypatch.setattr(language_processor, "get_quiz_queue", lambda: queue)
+    monkeypatch.setattr(language_processor, "get_usage_ledger", lambda: ledger)
+    monkeypatch.setattr(language_processor, "load_item_bank", lambda: {})
+    return language_processor.LanguageProcessor(output_dir=str(tmp_path))
+
+
+@pytest.fixture
+def crew_env(monkeypatch):
+    """Environment to build the LanguageMentor crew offline (no LLM call is made)."""
+    monkeypatch.setenv("GROQ_API_KEY", os.getenv("GROQ_API_KEY", "test"))
+    monkeypatch.setenv("CREWAI_DISABLE_TELEMETRY", "true")
+    monkeypatch.setenv("OTEL_SDK_DISABLED", "true")
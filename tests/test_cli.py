@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+import cli
+from logic import language_processor
+from logic.quiz_queue import QuizQueue
+from logic.usage_ledger import UsageLedger
+
+
+def _question(text):
+    return {"question": text, "options": ["a", "b", "c", "d"], "answer": "b"}
+
+
+@pytest.fixture
+def shared_queue(tmp_path, monkeypatch):
+    """The app's quiz queue; CLI runs must leave it alone."""
+    queue = QuizQueue(tmp_path / "shared.sqlite3")
+    ledger = UsageLedger(tmp_path / "usage.sqlite3")
+    monkeypatch.setattr(language_processor, "get_quiz_queue", lambda: queue)
+    monkeypatch.setattr(language_processor, "get_usage_ledger", lambda: ledger)
+    monkeypatch.setattr(language_processor, "load_item_bank", lambda: {})
+    monkeypatch.setattr(cli, "setup_logging", lambda: None)
+    monkeypatch.chdir(tmp_path)  # the pool's output directories
+    return queue
+
+
+def _generate_with(monkeypatch, quizzes):
+    calls = []
+
+    def fake_batch(self, level, language, num_quizzes, num_questions, username=None):
+        calls.append((level, language, num_quizzes, num_questions, username))
+        return [list(quiz) for quiz in quizzes]
+
+    monkeypatch.setattr(language_processor.LanguageProcessor, "prepare_quiz_batch", fake_batch)
+    return calls
+
+
+def test_quiz_runs_do_not_feed_the_shared_queue(shared_queue, monkeypatch, tmp_path):
+    calls = _generate_with(monkeypatch, [[_question("q1"), _question("q2")]])
+    output = tmp_path / "report.json"
+
+    code = cli.main(["quiz", "--language", "Italian", "-n", "2", "--repeat", "3",
+                     "--concurrency", "2", "--no-warm-up", "--output", str(output)])
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert code == 0
+    assert report["stats"]["ok"] == 3 and report["stats"]["errors"] == 0
+    assert [q["question"] for q in report["runs"][0]["result"]] == ["q1", "q2"]
+    assert calls == [("Beginner", "Italian", 1, 2, None)] * 3
+    # Nothing a user out of budget could be served
+    assert shared_queue.recent("quiz_task", "Italian", "Beginner") is None
+
+
+def test_empty_results_are_errors(shared_queue, monkeypatch, capsys):
+    _generate_with(monkeypatch, [])
+
+    code = cli.main(["quiz", "--language", "French", "--repeat", "2", "--no-warm-up"])
+    report = json.loads(capsys.readouterr().out)
+    assert code == 1
+    assert report["stats"]["errors"] == 2
+    assert {run["error"] for run in report["runs"]} == {"empty result"}
+
+
+def test_counts_must_be_positive(shared_queue, capsys):
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["quiz", "--language", "Italian", "--repeat", "0"])
+    assert exc.value.code == 2
+    assert ">= 1" in capsys.readouterr().err
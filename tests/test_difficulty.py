@@ -0,0 +1,43 @@
+from logic.difficulty import OOV_RANK, estimate_level, get_difficulty_table
+
+EASY = {"question": "La casa è ____.", "answer": "grande"}
+HARD = {"question": "L'ineluttabilità del destino, tema ricorrente nella letteratura verghiana, "
+                    "si ____ nella rassegnazione dei personaggi.", "answer": "manifesta"}
+
+
+def test_rank_lookup_and_scores():
+    table = get_difficulty_table("Italian")
+    assert list(table.ranks(["il", "Casa", "ineluttabilità"])) == [1, 64, OOV_RANK]
+    easy, hard = table.score(EASY["question"], EASY["answer"]), table.score(HARD["question"], HARD["answer"])
+    assert 0 <= easy < hard <= 1
+    assert estimate_level(easy) == "Beginner" and estimate_level(hard) == "Master"
+    assert get_difficulty_table("Klingon") is None
+
+
+def test_off_level_questions_are_rebucketed(processor):
+    proc, queue = processor, processor.quiz_queue
+
+    quizzes = [[dict(EASY), dict(HARD)], [dict(HARD)]]
+    kept = proc._check_levels(quizzes, "Italian", "Beginner", num_questions=2, username="ann")
+    assert [[q["question"] for q in quiz] for quiz in kept] == [[EASY["question"]]]
+    assert kept[0][0]["estimated_level"] == "Beginner"
+    # Both hard questions fill one quiz of their own level
+    assert [q["question"] for q in queue.pop("ann", "Italian", "Master", 2)] == [HARD["question"]] * 2
+
+    # Without a user there is nowhere to move them: dropped
+    assert proc._check_levels([[dict(HARD)]], "Italian", "Beginner", num_questions=2) == []
+    assert queue.pending("ann", "Italian", "Master", 2) == 0
+
+
+def test_proficient_users_share_the_level_scale(processor):
+    proc, queue = processor, processor.quiz_queue
+    # "Proficient" (1500-3000 EXP) sits between Advanced and Master, not at Beginner
+    kept = proc._check_levels([[dict(EASY), dict(HARD)]], "Italian", "Proficient",
+                              num_questions=1, username="ann")
+    assert [[q["question"] for q in quiz] for quiz in kept] == [[HARD["question"]]]
+    assert queue.pending("ann", "Italian", "Beginner", 1) == 1
+
+    # A label the scale doesn't know skips the check instead of counting as Beginner
+    kept = proc._check_levels([[dict(EASY), dict(HARD)]], "Italian", "Guru",
+                              num_questions=2, username="ann")
+    assert len(kept[0]) == 2
@@ -0,0 +1,62 @@
+import os
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication
+
+from gui.event_loop_watchdog import EventLoopWatchdog, LatencyHistogram
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def run_loop(app, seconds):
+    QTimer.singleShot(int(seconds * 1000), app.quit)
+    app.exec()
+
+
+def blocking_handler():
+    time.sleep(0.4)
+
+
+def test_stall_is_recorded_with_main_thread_stack(app, tmp_path):
+    watchdog = EventLoopWatchdog(threshold_ms=150, interval_ms=20)
+    watchdog.start()
+    QTimer.singleShot(200, blocking_handler)
+    run_loop(app, 1.0)
+    watchdog.stop()
+
+    assert len(watchdog.stalls) == 1
+    stall = watchdog.stalls[0]
+    assert stall["duration_ms"] >= 350
+    assert any("blocking_handler" in line for line in stall["stack"])
+
+    lag = watchdog.histogram.as_dict()
+    assert lag["count"] > 10 and lag["max_ms"] >= 350
+    path = tmp_path / "lag.json"
+    watchdog.write_json(path)
+    assert path.read_text()
+
+
+def test_idle_loop_has_no_stalls(app):
+    watchdog = EventLoopWatchdog(threshold_ms=150, interval_ms=20)
+    watchdog.start()
+    run_loop(app, 0.5)
+    watchdog.stop()
+    assert watchdog.stalls == []
+    assert watchdog.histogram.percentile(50) < 150
+
+
+def test_histogram_buckets():
+    hist = LatencyHistogram(bounds=(1, 10, 100))
+    for value in (0.5, 5, 5, 50, 500):
+        hist.add(value)
+    assert hist.counts == [1, 2, 1, 1]
+    assert hist.percentile(50) == 10
+    assert hist.percentile(100) == 500
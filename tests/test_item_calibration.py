@@ -0,0 +1,40 @@
+import json
+
+import numpy as np
+
+from logic.item_calibration import calibrate, fit_2pl
+
+
+def _simulate(n_users=500, n_items=40, seed=7):
+    rng = np.random.default_rng(seed)
+    theta = rng.standard_normal(n_users)
+    b = rng.uniform(-2.0, 2.0, n_items)
+    a = rng.uniform(0.7, 1.8, n_items)
+    user_idx, item_idx = (g.ravel().astype(np.int32) for g in np.meshgrid(
+        np.arange(n_users), np.arange(n_items), indexing="ij"))
+    p = 1.0 / (1.0 + np.exp(-a[item_idx] * (theta[user_idx] - b[item_idx])))
+    y = (rng.random(p.size) < p).astype(np.float64)
+    return theta, a, b, user_idx, item_idx, y
+
+
+def test_fit_recovers_synthetic_parameters():
+    theta, a, b, user_idx, item_idx, y = _simulate()
+    theta_hat, a_hat, b_hat, n_iter, last_step = fit_2pl(user_idx, item_idx, y, len(theta), len(b))
+    assert last_step < 1e-4 and n_iter < 100
+    assert np.corrcoef(b, b_hat)[0, 1] > 0.98
+    assert np.corrcoef(theta, theta_hat)[0, 1] > 0.9
+    assert np.corrcoef(a, a_hat)[0, 1] > 0.8
+    assert np.abs(b_hat - b).mean() < 0.3
+
+
+def test_non_convergence_is_reported(tmp_path, capsys):
+    _, _, _, user_idx, item_idx, y = _simulate(n_users=100, n_items=10)
+    responses = tmp_path / "responses.jsonl"
+    responses.write_text("".join(json.dumps({"user": f"u{u}", "item": f"i{i}", "correct": bool(c)}) + "\n"
+                                 for u, i, c in zip(user_idx, item_idx, y)))
+
+    summary = calibrate(responses, tmp_path / "bank.json", min_responses=1, max_iter=2)
+    assert summary["iterations"] == 2 and summary["converged"] is False
+    assert "no convergence after 2 iterations" in capsys.readouterr().err
+    assert json.loads((tmp_path / "bank.json").read_text())["converged"] is False
+    assert calibrate(responses, tmp_path / "bank.json", min_responses=1)["converged"] is True
@@ -0,0 +1,31 @@
+from logic.language_id import get_language_identifier
+
+
+def _q(text, answer="gatto"):
+    return {"question": text, "options": ["gatto", "cane", "letto", "vino"], "answer": answer}
+
+
+def test_identifier_flags_other_languages():
+    identifier = get_language_identifier()
+    texts = ["Il gatto dorme sul letto.", "The cat is sleeping on the ____.",
+             "Je suis très fatigué aujourd'hui.", "eat", "mela", ""]
+    assert list(identifier.violations(texts, "Italian")) == [False, True, True, True, False, False]
+    assert identifier.detect("Yo vivo en Madrid con mi familia.") == "Spanish"
+    assert not identifier.violations(["The cat"], "Klingon").any()
+
+
+def test_only_wrong_language_questions_are_regenerated(processor, monkeypatch):
+    proc = processor
+    calls = []
+
+    def regenerate(level, language, num_quizzes, num_questions, username=None):
+        calls.append((num_quizzes, num_questions))
+        return [[_q("Il ____ beve il latte."), _q("My ____ drinks milk.")]]
+
+    monkeypatch.setattr(proc, "_generate_quizzes", regenerate)
+    quizzes = [[_q("Il ____ dorme."), _q("The ____ is sleeping.")],
+               [{**_q("Ho un ____ nero."), "options": ["cat", "dog", "bed", "wine"], "answer": "cat"}]]
+    result = proc._replace_wrong_language(quizzes, "Beginner", "Italian", "ann")
+
+    assert calls == [(1, 2)]  # one call, only for the two violators
+    assert [[q["question"] for q in quiz] for quiz in result] == [["Il ____ dorme.", "Il ____ beve il latte."]]
@@ -0,0 +1,55 @@
+from logic.language_processor import LanguageProcessor
+from logic.lexicon import LEXICON_DIR, Lexicon, frequency_band, get_lexicon
+
+FEATURES = {
+    "NOUN": {"m.s", "f.s", "m.p", "f.p"},
+    "ADJ": {"m.s", "f.s", "m.p", "f.p"},
+    "VERB": {"inf", "1s", "2s", "3s", "1p", "2p", "3p", "part"},
+}
+
+
+def test_lexicon_files_are_well_formed():
+    for path in sorted(LEXICON_DIR.glob("*.txt")):
+        lexicon = Lexicon.load(path.stem, path)
+        assert len(lexicon.forms) > 500, path.name
+        lemmas = {}
+        for f in lexicon.forms:
+            lemmas.setdefault((f.lemma, f.pos), set()).add(f.features)
+        for (lemma, pos), features in lemmas.items():
+            if pos == "VERB":
+                assert features == FEATURES["VERB"], (path.name, lemma)
+            elif pos in FEATURES:
+                assert features <= FEATURES[pos], (path.name, lemma)
+
+
+def test_distractors_agree_with_the_answer():
+    lexicon = get_lexicon("Italian")
+    wrong = lexicon.distractors("mangia", seed=1)
+    assert len(wrong) == 3 and "mangia" not in wrong
+    for word in wrong:
+        assert any(r.pos == "VERB" and r.features == "3s" for r in lexicon.lookup(word))
+    assert lexicon.distractors("mangia", seed=1) == wrong  # same seed, same options
+
+    wrong = get_lexicon("Spanish").distractors("Casas", seed=3)
+    assert all(w[0].isupper() for w in wrong)
+    assert all(r.features == "f.p" for w in wrong for r in get_lexicon("Spanish").lookup(w)[:1])
+
+
+def test_make_options_and_fallbacks():
+    lexicon = get_lexicon("French")
+    options = lexicon.make_options("du", seed=6)
+    assert len(options) == 4 and options[6 % 4] == "du" and len(set(options)) == 4
+    assert lexicon.distractors("deux mots") is None
+    assert len(lexicon.distractors("inconnuement")) == 3   # same-ending fallback
+    assert get_lexicon("Klingon") is None
+    assert frequency_band(1) == 1 and frequency_band(None) == 4
+
+
+def test_quiz_questions_get_local_options():
+    lexicon = get_lexicon("Italian")
+    q, reason = LanguageProcessor._check_quiz_question(
+        {"question": "Lei ____ una mela.", "answer": "mangia"}, lexicon)
+    assert reason is None and len(q["options"]) == 4 and q["answer"] == "mangia"
+    assert LanguageProcessor._check_quiz_question({"question": "x", "answer": "a b"}, lexicon) == (
+        None, "no_distractors")
+    assert LanguageProcessor._check_quiz_question({"question": "x", "answer": "a"})[1] == "missing_fields"
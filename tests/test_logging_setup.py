@@ -0,0 +1,27 @@
+import io
+import json
+import logging
+
+from logic.logging_setup import parse_module_levels, setup_logging, shutdown_logging
+
+
+def test_parse_module_levels():
+    assert parse_module_levels(" gui=warning, logic.tip_cache=DEBUG,broken,=INFO") == {
+        "gui": "WARNING", "logic.tip_cache": "DEBUG"}
+    assert parse_module_levels(None) == {}
+
+
+def test_queued_json_records_and_module_levels():
+    stream = io.StringIO()
+    setup_logging(level="INFO", module_levels={"quiet": "ERROR"}, fmt="json", stream=stream)
+    try:
+        logging.getLogger("loud").info("quiz ready in %d ms", 42)
+        logging.getLogger("quiet").warning("dropped")
+    finally:
+        shutdown_logging()  # stops the listener after draining the queue
+        logging.getLogger().handlers.clear()
+        logging.getLogger("quiet").setLevel(logging.NOTSET)
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [(r["logger"], r["level"], r["message"]) for r in lines] == [
+        ("loud", "INFO", "quiz ready in 42 ms")]
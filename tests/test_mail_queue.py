@@ -0,0 +1,166 @@
+import socket
+
+import pytest
+
+pytest.importorskip("aiosmtpd")
+from aiosmtpd.controller import Controller
+
+from logic import mail_queue
+from logic.mail_queue import Outbox, SMTPConnectionPool, MailDelivery, resume_pending_delivery
+
+
+class RecordingHandler:
+    """Local SMTP stand-in: stores messages, optionally rejecting the first tries."""
+
+    def __init__(self, fail_first=0, code="451 Try again later"):
+        self.messages = []
+        self.fail_first = fail_first
+        self.code = code
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.fail_first:
+            self.fail_first -= 1
+            return self.code
+        self.messages.append(envelope)
+        return "250 OK"
+
+
+@pytest.fixture
+def smtp_server():
+    servers = []
+
+    def start(handler):
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        controller = Controller(handler, hostname="127.0.0.1", port=port)
+        controller.start()
+        servers.append(controller)
+        return port
+
+    yield start
+    for controller in servers:
+        controller.stop()
+
+
+def make_delivery(tmp_path, port, workers=2):
+    pool = SMTPConnectionPool(host="127.0.0.1", port=port, username="", password="",
+                              starttls=False, size=workers)
+    return MailDelivery(outbox=Outbox(tmp_path / "outbox.sqlite3"), pool=pool,
+                        workers=workers, sender="mentor@example.com", backoff_base=0.05)
+
+
+def test_delivers_queued_messages_over_pooled_connections(tmp_path, smtp_server):
+    handler = RecordingHandler()
+    delivery = make_delivery(tmp_path, smtp_server(handler)).start()
+    try:
+        delivery.enqueue_many([(f"user{i}@example.com", "Tip", f"body {i}") for i in range(200)])
+        assert delivery.flush(timeout=30)
+    finally:
+        delivery.stop()
+
+    assert len(handler.messages) == 200
+    assert delivery.outbox.counts() == {"sent": 200}
+    # Connections are reused, not opened per message
+    assert delivery.pool.connections_opened <= delivery.workers
+
+
+def test_temporary_failure_is_retried(tmp_path, smtp_server):
+    handler = RecordingHandler(fail_first=2)
+    delivery = make_delivery(tmp_path, smtp_server(handler), workers=1).start()
+    try:
+        delivery.enqueue("learner@example.com", "Quiz results", "Score: 4/5")
+        assert delivery.flush(timeout=30)
+    finally:
+        delivery.stop()
+
+    assert len(handler.messages) == 1
+    assert delivery.outbox.counts() == {"sent": 1}
+
+
+def test_permanent_failure_is_not_retried(tmp_path, smtp_server):
+    handler = RecordingHandler(fail_first=1, code="550 Mailbox unavailable")
+    delivery = make_delivery(tmp_path, smtp_server(handler), workers=1).start()
+    try:
+        delivery.enqueue("nobody@example.com", "Quiz results", "Score: 4/5")
+        assert delivery.flush(timeout=30)
+    finally:
+        delivery.stop()
+
+    assert handler.messages == []
+    assert delivery.outbox.counts() == {"failed": 1}
+
+
+def test_only_stale_claims_are_taken_over(tmp_path):
+    outbox = Outbox(tmp_path / "outbox.sqlite3")
+    outbox.enqueue_many([("a@example.com", "s", "b")])
+    assert len(outbox.claim(10)) == 1
+
+    # Another process sharing the outbox leaves a live claim alone...
+    assert Outbox(tmp_path / "outbox.sqlite3").claim(10) == []
+    assert outbox.counts() == {"sending": 1}
+    # ...but takes over one older than the claim timeout (its owner crashed)
+    assert len(Outbox(tmp_path / "outbox.sqlite3", claim_timeout=0).claim(10)) == 1
+
+
+def test_temporarily_refused_recipient_is_retried(tmp_path, smtp_server):
+    class BusyMailbox(RecordingHandler):
+        async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+            if self.fail_first:
+                self.fail_first -= 1
+                return "450 Mailbox busy"
+            envelope.rcpt_tos.append(address)
+            return "250 OK"
+
+    handler = BusyMailbox(fail_first=1)
+    delivery = make_delivery(tmp_path, smtp_server(handler), workers=1).start()
+    try:
+        delivery.enqueue("learner@example.com", "Quiz results", "Score: 4/5")
+        assert delivery.flush(timeout=30)
+    finally:
+        delivery.stop()
+
+    assert len(handler.messages) == 1
+    assert delivery.outbox.counts() == {"sent": 1}
+
+
+def test_unsent_mail_is_delivered_at_startup(tmp_path, monkeypatch):
+    path = tmp_path / "outbox.sqlite3"
+    started = []
+    monkeypatch.setattr(mail_queue, "get_mail_delivery", lambda: started.append(True))
+    assert not resume_pending_delivery(path)
+    Outbox(path).enqueue_many([("a@example.com", "s", "b")])
+    assert resume_pending_delivery(path) and started == [True]
+
+
+def test_old_sent_messages_are_purged(tmp_path):
+    outbox = Outbox(tmp_path / "outbox.sqlite3")
+    outbox.enqueue_many([("a@example.com", "s", "b", "k1"), ("b@example.com", "s", "b", "k2"),
+                         ("c@example.com", "s", "b")])
+    (first, *_), (second, *_), _ = outbox.claim(10)
+    outbox.mark_sent(first)
+    outbox.mark_sent(second)
+    outbox._conn.execute("UPDATE messages SET claimed_at = claimed_at - 8 * 86400 WHERE id = ?", (first,))
+
+    assert outbox.purge_sent(max_age=7 * 86400) == 1
+    assert outbox.counts() == {"sent": 1, "sending": 1}
+    # Within the retention window the dedup key still blocks a rerun
+    assert outbox.enqueue_many([("b@example.com", "s", "b", "k2")]) == 0
+
+
+def test_idle_connection_reset_is_replaced(monkeypatch):
+    class ResetConnection:
+        def noop(self):
+            raise ConnectionResetError("reset by peer")
+
+        def quit(self):
+            raise OSError("closed")
+
+        def close(self):
+            pass
+
+    pool = SMTPConnectionPool(host="127.0.0.1", port=25, idle_check=0)
+    fresh = object()
+    monkeypatch.setattr(pool, "_connect", lambda: fresh)
+    pool.release(ResetConnection())
+    assert pool.acquire() is fresh
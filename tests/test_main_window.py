@@ -0,0 +1,48 @@
+import os
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(app, processor, tmp_path, monkeypatch):
+    """MainWindow whose controller stores everything under tmp_path."""
+    from gui.main_window import MainWindow
+    from logic import app_controller
+    from logic.tip_cache import TipCache
+
+    monkeypatch.setattr(app_controller, "get_tip_cache", lambda: TipCache(tips_dir=tmp_path / "tips"))
+    window = MainWindow()
+    yield window
+    window.deleteLater()
+    app.processEvents()
+
+
+def test_screen_is_not_released_while_its_quiz_is_generated(app, window):
+    controller, release = window.controller, threading.Event()
+
+    def generate():
+        release.wait(5)
+        controller.request_finished.emit("quiz")
+
+    window._screen("quiz")
+    controller.run_in_background("quiz", generate)
+    window._release_screen("quiz")  # idle timer fired mid-request
+    assert "quiz" in window._screens and window._release_timers["quiz"].isActive()
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while controller.is_preparing("quiz") and time.monotonic() < deadline:
+        app.processEvents()
+    window._release_screen("quiz")
+    assert "quiz" not in window._screens
@@ -0,0 +1,31 @@
+import json
+
+from logic.metrics import MetricsRegistry
+
+
+def test_prometheus_text_and_snapshot(tmp_path):
+    registry = MetricsRegistry()
+    calls = registry.histogram("llm_call_seconds", "Call latency.", ("agent", "task"),
+                               buckets=(1, 5))
+    tokens = registry.counter("llm_tokens_total", "Tokens.", ("agent",))
+    for seconds in (0.5, 2, 7):
+        calls.observe(seconds, agent="Quiz Master", task="quiz_task")
+    tokens.inc(120, agent='say "hi"')
+
+    text = registry.render_prometheus()
+    assert '# TYPE llm_call_seconds histogram' in text
+    assert 'llm_call_seconds_bucket{agent="Quiz Master",task="quiz_task",le="1"} 1' in text
+    assert 'llm_call_seconds_bucket{agent="Quiz Master",task="quiz_task",le="5"} 2' in text
+    assert 'llm_call_seconds_bucket{agent="Quiz Master",task="quiz_task",le="+Inf"} 3' in text
+    assert 'llm_call_seconds_count{agent="Quiz Master",task="quiz_task"} 3' in text
+    assert 'llm_tokens_total{agent="say \\"hi\\""} 120' in text
+
+    path = tmp_path / "metrics.json"
+    registry.write_snapshot(path)
+    series = json.loads(path.read_text())["metrics"]["llm_call_seconds"]["series"][0]
+    assert series["count"] == 3 and series["sum"] == 9.5
+
+
+def test_registering_twice_returns_the_same_metric():
+    registry = MetricsRegistry()
+    assert registry.counter("hits_total", "Hits.") is registry.counter("hits_total", "Hits.")
@@ -0,0 +1,70 @@
+import json
+import threading
+
+import pytest
+
+from logic import config_manager, migrate_user_data
+from logic.user_session import SessionError, UserSession
+from logic.config_manager import get_config_path, get_history_path, load_attempt_history, load_user_config
+
+
+def test_legacy_name_with_space_is_claimed_at_login(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_manager, "USERS_DIR", tmp_path / "users")
+    monkeypatch.setattr(migrate_user_data, "DATA_DIR", tmp_path)
+    legacy = tmp_path / "config"
+    legacy.mkdir()
+    # Written by the flat layout for "Mario Rossi": no username inside the file
+    (legacy / "mario_rossi.json").write_text(json.dumps({"email": "m@example.com", "level": "Intermediate"}))
+    (legacy / "mario_rossi.history.jsonl").write_text('{"kind":"quiz","correct":3}\n')
+    # The response log recorded the real name
+    (legacy / "responses.jsonl").write_text('{"user":"Mario Rossi","item":"x","correct":1}\n')
+
+    assert migrate_user_data.migrate(config_dir=legacy)["migrated"] == 1
+    assert load_user_config("Mario_Rossi.") is None  # maps to another stem
+    assert load_user_config("mario*rossi") is None  # same stem, not the recorded name
+    with pytest.raises(SessionError, match="already exists"):
+        UserSession().register("Mario Rossi", "new@example.com")
+    assert not config_manager.user_exists("mario*rossi")
+
+    config = load_user_config("Mario Rossi")
+    assert config["level"] == "Intermediate" and config["username"] == "Mario Rossi"
+    assert "legacy_key" not in config
+    assert get_config_path("mario rossi").exists() and not get_config_path("mario_rossi").exists()
+    assert load_attempt_history("Mario Rossi") == [{"kind": "quiz", "correct": 3}]
+    assert not get_history_path("mario_rossi").exists()
+    assert load_user_config("mario rossi")["email"] == "m@example.com"
+
+
+def test_unrecorded_legacy_name_keeps_its_stem(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_manager, "USERS_DIR", tmp_path / "users")
+    monkeypatch.setattr(migrate_user_data, "DATA_DIR", tmp_path)
+    legacy = tmp_path / "config"
+    legacy.mkdir()
+    (legacy / "mario_rossi.json").write_text(json.dumps({"email": "m@example.com"}))
+    (legacy / "responses.jsonl").write_text('{"user":"Mario Rossi"}\n{"user":"mario*rossi"}\n')
+
+    migrate_user_data.migrate(config_dir=legacy)
+    # Two names share the stem: neither can claim it, the stem still logs in
+    assert load_user_config("Mario Rossi") is None and load_user_config("mario*rossi") is None
+    assert load_user_config("mario_rossi")["email"] == "m@example.com"
+
+
+def test_real_user_named_like_a_stem_is_not_claimed(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_manager, "USERS_DIR", tmp_path / "users")
+    config_manager.save_user_config("mario_rossi", {"email": "other@example.com"})
+    assert load_user_config("Mario Rossi") is None
+    assert load_user_config("mario_rossi")["email"] == "other@example.com"
+
+
+def test_concurrent_saves_do_not_share_a_temp_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_manager, "USERS_DIR", tmp_path / "users")
+    results = []
+    threads = [threading.Thread(target=lambda i=i: results.append(
+        config_manager.save_user_config("ann", {"progress": i}))) for i in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert all(results) and len(results) == 20
+    assert load_user_config("ann")["progress"] in range(20)
+    assert list(get_config_path("ann").parent.glob("*.tmp")) == []
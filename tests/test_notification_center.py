@@ -0,0 +1,64 @@
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication, QWidget
+
+from gui.notification_center import NotificationCenter, classify, ERROR, INFO, WARNING
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def run_loop(app, ms):
+    QTimer.singleShot(ms, app.quit)
+    app.exec()
+
+
+def test_classify():
+    assert classify("Quiz ready.") == INFO
+    assert classify("Please select a language first!") == WARNING
+    assert classify("Error preparing quiz: timeout") == ERROR
+
+
+def test_burst_from_workers_is_coalesced_into_one_toast(app):
+    window = QWidget()
+    center = NotificationCenter(window)
+    shown = []
+    center.toast.setText = lambda text, _orig=center.toast.setText: (shown.append(text), _orig(text))
+
+    def worker():
+        for _ in range(5):
+            center.post("Generating tip…")
+        center.post("Tip generated.")
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    run_loop(app, 100)
+
+    assert len(center.history) == 24
+    assert shown == ["Tip generated. (x4)  (+1 more)"]
+    assert center._error_box is None
+
+
+def test_errors_open_one_non_modal_dialog(app):
+    window = QWidget()
+    window.show()
+    center = NotificationCenter(window)
+    center.post("Error generating tip.")
+    center.post("Error preparing quiz: boom")
+    seen = []
+    QTimer.singleShot(50, lambda: seen.append(center._error_box.isVisible()))
+    run_loop(app, 100)
+    box = center._error_box
+    assert seen == [True] and not box.isModal()
+    assert "Error generating tip." in box.text() and "boom" in box.text()
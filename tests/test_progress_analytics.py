@@ -0,0 +1,69 @@
+import time
+from datetime import date
+
+import numpy as np
+import pytest
+
+from logic.progress_analytics import DAY, ProgressAnalytics, _day_index
+
+EPOCH = date(1970, 1, 1).toordinal()
+
+
+@pytest.fixture
+def rome(monkeypatch):
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is not available on this platform")
+    monkeypatch.setenv("TZ", "Europe/Rome")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def _local(*args):
+    """UNIX timestamp of a local (Rome) wall-clock time."""
+    return time.mktime((*args, 0, 0, 0, -1))
+
+
+def test_day_index_follows_dst(rome):
+    # 00:30 local is the previous day in UTC, by one hour in winter and two in summer
+    winter, summer = _local(2026, 1, 10, 0, 30), _local(2026, 7, 10, 0, 30)
+    assert int(_day_index(winter)) == date(2026, 1, 10).toordinal() - EPOCH
+    assert int(_day_index(summer)) == date(2026, 7, 10).toordinal() - EPOCH
+    assert list(_day_index([winter, summer])) == [int(_day_index(winter)), int(_day_index(summer))]
+    # Late-evening attempts either side of the spring-forward night are consecutive days
+    days = _day_index([_local(2026, 3, 28, 23, 30), _local(2026, 3, 29, 23, 30)])
+    assert days[1] - days[0] == 1
+    # Same days as a per-timestamp offset lookup, minute by minute around both DST changes
+    ts = np.arange(_local(2026, 3, 28, 12, 0), _local(2026, 3, 30, 12, 0), 7 * 60.0)
+    ts = np.concatenate((ts, np.arange(_local(2026, 10, 24, 12, 0), _local(2026, 10, 26, 12, 0), 7 * 60.0)))
+    exact = [(t + time.localtime(t).tm_gmtoff) // DAY for t in ts]
+    assert _day_index(ts).tolist() == exact
+
+
+def test_from_records_matches_incremental_updates(rome):
+    start = _local(2026, 3, 27, 23, 30)
+    records = [
+        {"ts": start + 2 * DAY - 3600, "topic": "quiz", "level": "Beginner", "exp": 30, "correct": 3, "total": 5},
+        {"ts": start, "topic": "quiz", "level": "Beginner", "exp": 40, "correct": 4, "total": 5},
+        {"ts": start + DAY - 3600, "topic": "level_test", "level": "Intermediate", "exp": 0,
+         "correct": 2, "total": 4},
+        {"ts": start + 5 * DAY, "topic": "bogus", "level": None, "exp": 10, "correct": 1, "total": 1},
+    ]
+    analytics = ProgressAnalytics.from_records(records)
+    incremental = ProgressAnalytics()
+    for record in sorted(records, key=lambda r: r["ts"]):
+        incremental.add_attempt(record)
+
+    now = start + 5 * DAY + 60
+    assert len(analytics) == 4
+    # Three consecutive local days across the DST change (23:30, 23:30, 23:30), then a gap
+    assert analytics.streaks(now) == incremental.streaks(now) == (1, 3)
+    # The attempt with an unknown topic/level is not counted as a Beginner quiz
+    assert analytics.accuracy() == incremental.accuracy() == {
+        "quiz": {"Beginner": 0.7}, "level_test": {"Intermediate": 0.5}}
+    assert analytics.overall_accuracy() == incremental.overall_accuracy() == round(10 / 15, 3)
+    assert analytics.summary(100, now)["unlabelled_attempts"] == 1
+    assert analytics.learning_curve(points=2) == [(start, 40), (start + 5 * DAY, 80)]
+    assert analytics.summary(100, now)["exp_per_day"] == round(80 / (5 + 60 / DAY), 1)
+    assert ProgressAnalytics.from_records([]).streaks() == (0, 0)
@@ -0,0 +1,48 @@
+import json
+
+from logic import language_processor
+
+
+def _question(text, answer="b"):
+    return {"question": text, "options": ["a", "b", "c", "d"], "answer": answer}
+
+
+def test_load_quizzes_groups_and_validates(processor, tmp_path):
+    proc = processor
+    output = [
+        [_question("q1"), _question("q2", answer=2), {"question": "no options", "answer": "x"}],
+        [_question("q3", answer="zzz"), _question("q4", answer=" B ")],
+        [_question("q5", answer="zzz")],          # nothing valid left: dropped
+        _question("q6"), _question("q7"), _question("q8"),  # loose: split by num_questions
+    ]
+    (tmp_path / "quizzes.json").write_text(json.dumps(output), encoding="utf-8")
+
+    quizzes = proc._load_quizzes("quizzes.json", num_questions=2)
+    assert [[q["question"] for q in quiz] for quiz in quizzes] == [
+        ["q1", "q2"], ["q4"], ["q6", "q7"], ["q8"]]
+    assert quizzes[0][1]["answer"] == "c"   # index -> option text
+    assert quizzes[1][0]["answer"] == "b"   # matched ignoring case and spaces
+
+
+def test_batch_is_queued_and_served_per_user(processor, monkeypatch):
+    proc = processor
+    calls = []
+
+    def fake_batch(level, language, num_quizzes, num_questions, username=None):
+        calls.append(num_quizzes)
+        return [[_question(f"{username}-{i}")] for i in range(num_quizzes)]
+
+    monkeypatch.setattr(proc, "prepare_quiz_batch", fake_batch)
+    monkeypatch.setattr(language_processor, "QUIZ_BATCH_SIZE", 3)
+
+    served = [proc.prepare_quiz_data("Beginner", "Italian", 1, username="anna")[0]["question"]
+              for _ in range(4)]
+    assert served == ["anna-0", "anna-1", "anna-2", "anna-0"]
+    assert calls == [3, 3]
+    # Queues are per user and per language/level
+    assert proc.prepare_quiz_data("Beginner", "Italian", 1, username="ben")[0]["question"] == "ben-0"
+    assert proc.quiz_queue.pending("anna", "Spanish", "Beginner", 1) == 0
+    assert proc.quiz_queue.pending("anna", "Italian", "Beginner", 1) == 2
+    # Without a user nothing is queued
+    proc.prepare_quiz_data("Beginner", "Italian", 1)
+    assert calls[-1] == 1
@@ -0,0 +1,38 @@
+from logic import mail_queue, user_session
+from logic.user_session import format_quiz_result, notify_quiz_result, score_quiz
+
+
+def test_score_and_email(monkeypatch):
+    assert score_quiz(4, 1) == 3 and score_quiz(1, 3) == -2
+    subject, body = format_quiz_result("ann", "Italian", "Beginner", 4, 1)
+    assert "3" in subject and "4 correct, 1 wrong" in body
+
+    sent = []
+    monkeypatch.setattr(mail_queue, "enqueue_email", lambda *message: sent.append(message))
+    assert notify_quiz_result("ann@example.com", "ann", "Italian", "Beginner", 4, 1)
+    assert sent == [("ann@example.com", subject, body)]
+    assert not notify_quiz_result(None, "ann", "Italian", "Beginner", 4, 1)
+    monkeypatch.setattr(user_session, "QUIZ_RESULT_EMAILS", False)
+    assert not notify_quiz_result("ann@example.com", "ann", "Italian", "Beginner", 4, 1)
+    assert len(sent) == 1
+
+
+def test_quiz_agent_is_single_shot(crew_env):
+    from crew import LanguageMentor
+
+    agent = LanguageMentor().quiz_agent()
+    assert agent.tools == [] and agent.max_iter == 1
+
+
+def test_quiz_prompt_is_rendered_with_language_and_level(crew_env, processor, monkeypatch):
+    from crewai import Crew
+
+    prompts = []
+    monkeypatch.setattr(Crew, "kickoff", lambda self, inputs=None: prompts.append(self.tasks[0].prompt()))
+    task = processor.language_crew.quiz_task()
+    processor._run_single_task(task, {"user_level": "Intermediate", "language": "Italian",
+                                      "num_quizzes": 3, "num_questions": 5})
+    prompt = prompts[0]
+    assert "3 multiple-choice quizzes entirely in Italian" in prompt
+    assert "appropriate for the Intermediate" in prompt and "Final Answer:" in prompt
+    assert "{{" not in prompt
@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+pytest.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+from gui.quiz_screen import QuizScreen
+
+QUIZ = [{"question": f"Domanda {i} ____.", "options": ["sì", "no"], "answer": "sì"} for i in range(3)]
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def test_answers_get_inline_feedback_without_dialogs(app, monkeypatch):
+    def modal(*args, **kwargs):
+        raise AssertionError("modal dialog opened")
+
+    for name in ("information", "warning", "critical"):
+        monkeypatch.setattr(QMessageBox, name, modal)
+    screen = QuizScreen()
+    completed, answered = [], []
+    screen.quiz_completed.connect(completed.append)
+    screen.question_answered.connect(lambda kind, text, ok: answered.append(ok))
+    screen.start_quiz([dict(q) for q in QUIZ])
+    view = screen.question_view
+
+    view.next_clicked.emit()  # nothing selected
+    assert view.feedback_label.text() == "Scegli una risposta!" and screen.current == 0
+
+    for choice in (0, 1, 0):
+        view.option_buttons[choice].setChecked(True)
+        view.next_clicked.emit()
+        if screen.questions:
+            assert view.number_label.text() == f"Domanda {screen.current + 1} di 3"
+    assert answered == [True, False, True] and completed == [20]
+    assert "Punteggio: 2/3" in view.message_label.text() and not view.action_button.isHidden()
+
+    screen.reset_screen()
+    assert view.feedback_label.isHidden() and not view.message_label.isHidden()
@@ -0,0 +1,142 @@
+import json
+import threading
+from http.client import HTTPConnection
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+import service
+from logic import config_manager, user_session
+from logic.tip_cache import TipCache
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_manager, "USERS_DIR", tmp_path / "users")
+    tips = TipCache(variants=1, tips_dir=tmp_path / "tips")
+    monkeypatch.setattr(service, "get_tip_cache", lambda: tips)
+    monkeypatch.setattr(user_session, "QUIZ_RESULT_EMAILS", False)
+    mentor = service.MentorService(workers=1)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), service.make_handler(mentor))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    conn = HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+
+    def call(method, path, body=None, token=None):
+        headers = {"Content-Type": "application/json"}
+        if token:
+            headers["X-Session-Token"] = token
+        conn.request(method, path, json.dumps(body) if body is not None else None, headers)
+        response = conn.getresponse()
+        return response.status, json.loads(response.read())
+
+    call.service = mentor
+    yield call
+    conn.close()
+    server.shutdown()
+    server.server_close()
+
+
+QUIZ = [{"question": f"Domanda {i} ____.", "answer": "sì", "options": ["sì", "no"]} for i in range(5)]
+
+
+@pytest.fixture
+def quiz_stub(monkeypatch):
+    from logic.language_processor import LanguageProcessor
+
+    monkeypatch.setattr(LanguageProcessor, "prepare_quiz_data",
+                        lambda self, level, language, num_questions=5, username=None: QUIZ)
+
+
+def start_quiz(client):
+    token = client("POST", "/register", {"username": "ann", "email": "ann@example.com"})[1]["token"]
+    client("POST", "/language", {"language": "Italian"}, token)
+    status, reply = client("GET", "/quiz", token=token)
+    assert status == 200 and reply["questions"] == QUIZ
+    return token
+
+
+def test_counts_are_validated(client, quiz_stub):
+    token = start_quiz(client)
+
+    for bad in ({"correct": "three"}, {"correct": None}, {"wrong": -1}, {"correct": 2.5},
+                {"correct": True}, {"wrong": [1]}):
+        status, reply = client("POST", "/quiz/result", bad, token)
+        assert status == 400 and "non-negative integer" in reply["error"], bad
+    for bad in ({"score": None}, {"score": "x"}, {"score": -2}):
+        assert client("POST", "/level-test/result", bad, token)[0] == 400
+
+    status, reply = client("POST", "/quiz/result", {"correct": 4, "wrong": "1"}, token)
+    assert status == 200 and reply["exp_earned"] == 40 and reply["score"] == 3
+    assert client("POST", "/level-test/result", {"score": 5}, token)[0] == 200
+
+
+def test_quiz_result_counts_the_served_quiz(client, quiz_stub):
+    token = start_quiz(client)
+    # More answers than questions served
+    status, reply = client("POST", "/quiz/result", {"correct": 5, "wrong": 1}, token)
+    assert status == 400 and "quiz of 5 questions" in reply["error"]
+
+    # Answers recorded with /answer win over the client's counts
+    for correct in (True, True, False):
+        client("POST", "/answer", {"question": "q", "correct": correct}, token)
+    status, reply = client("POST", "/quiz/result", {"correct": 5}, token)
+    assert status == 200 and reply["exp_earned"] == 20 and reply["score"] == 1
+
+    # One result per quiz served
+    assert client("POST", "/quiz/result", {"correct": 1}, token)[0] == 400
+
+
+def test_out_of_budget_without_cache_is_429(processor, crew_env, client):
+    processor.ledger.user_hard_tokens = 1000
+    token = client("POST", "/register", {"username": "ann", "email": "ann@example.com"})[1]["token"]
+    client("POST", "/language", {"language": "Italian"}, token)
+    processor.ledger.record("ann", "level_detector", "groq/llama-3.3-70b-versatile", 900, 300)
+
+    status, reply = client("GET", "/level-test", token=token)
+    assert status == 429 and "budget" in reply["error"]
+
+
+def test_logins_of_a_user_share_one_session(client, quiz_stub):
+    first = start_quiz(client)
+    second = client("POST", "/login", {"username": "Ann"})[1]["token"]
+    client("POST", "/quiz/result", {"correct": 3}, first)
+    client("GET", "/quiz", token=second)
+    status, reply = client("POST", "/quiz/result", {"correct": 2}, second)
+    assert status == 200 and reply["state"]["progress"] == 50
+
+    client("POST", "/logout", token=first)
+    assert client("GET", "/state", token=second)[1]["progress"] == 50
+    client("POST", "/logout", token=second)
+    assert config_manager.load_user_config("ann")["progress"] == 50
+    assert client("POST", "/login", {"username": "ann"})[1]["state"]["progress"] == 50
+
+
+def test_missing_or_expired_token_is_401(client):
+    assert client("GET", "/state")[0] == 401
+    assert client("GET", "/quiz", token="nope")[0] == 401
+    token = client("POST", "/register", {"username": "ann", "email": "ann@example.com"})[1]["token"]
+    client("POST", "/logout", token=token)
+    assert client("GET", "/tip", token=token)[0] == 401
+    assert client("POST", "/login", {"username": "bob"})[0] == 400
+
+
+def test_tips_are_shared_through_the_cache(client, monkeypatch):
+    from logic.language_processor import LanguageProcessor
+
+    calls = []
+    monkeypatch.setattr(LanguageProcessor, "generate_daily_tip",
+                        lambda self, level, language, username=None: calls.append(username) or "Ciao!")
+    tokens = []
+    for name in ("ann", "bob"):
+        tokens.append(client("POST", "/register", {"username": name, "email": f"{name}@example.com"})[1]["token"])
+        client("POST", "/language", {"language": "Italian"}, tokens[-1])
+    assert client("GET", "/tip", token=tokens[0]) == (200, {"tip": "Ciao!", "cached": False})
+    assert client("GET", "/tip", token=tokens[0]) == (200, {"tip": "Ciao!", "cached": True})
+    assert client("GET", "/tip", token=tokens[1]) == (200, {"tip": "Ciao!", "cached": True})
+    assert calls == ["ann"]
+
+
+def test_quiz_needs_a_language(client, quiz_stub):
+    token = client("POST", "/register", {"username": "ann", "email": "ann@example.com"})[1]["token"]
+    status, reply = client("GET", "/quiz", token=token)
+    assert status == 400 and "language" in reply["error"]
@@ -0,0 +1,56 @@
+import threading
+import time
+from datetime import date, timedelta
+
+from logic.tip_cache import TipCache, variant_slot
+
+
+def test_slot_rotation_is_deterministic_per_day():
+    days = [(date(2026, 1, 5) + timedelta(days=i)).isoformat() for i in range(6)]
+    slots = [variant_slot("Ann", day, 3) for day in days]
+    assert slots == [variant_slot(" ann ", day, 3) for day in days]  # same user, same slot
+    # Consecutive days move the user to the next slot
+    assert all((b - a) % 3 == 1 for a, b in zip(slots, slots[1:]))
+    assert {variant_slot(f"user{i}", days[0], 3) for i in range(30)} == {0, 1, 2}
+
+
+def test_hit_does_not_call_the_llm(tmp_path):
+    calls = []
+
+    def generate(level, language):
+        calls.append((level, language))
+        return f"{language} tip #{len(calls)}"
+
+    cache = TipCache(variants=2, tips_dir=tmp_path)
+    assert cache.get_tip("ann", "Italian", "Beginner", generate, day="2026-01-05") == ("Italian tip #1", False)
+    assert cache.get_tip("ann", "Italian", "Beginner", generate, day="2026-01-05") == ("Italian tip #1", True)
+    assert cache.lookup("ann", "Italian", "Beginner", day="2026-01-05") == "Italian tip #1"
+    # Another process sees the stored tip too
+    other = TipCache(variants=2, tips_dir=tmp_path)
+    assert other.get_tip("ann", "Italian", "Beginner", generate, day="2026-01-05") == ("Italian tip #1", True)
+    assert calls == [("Beginner", "Italian")]
+
+
+def test_concurrent_misses_generate_once(tmp_path):
+    cache = TipCache(variants=1, tips_dir=tmp_path)
+    started, release, calls = threading.Event(), threading.Event(), []
+
+    def generate(level, language):
+        calls.append(level)
+        started.set()
+        release.wait(5)
+        return "Ciao!"
+
+    results = []
+    threads = [threading.Thread(target=lambda name=name: results.append(
+        cache.get_tip(name, "Italian", "Beginner", generate, day="2026-01-05")))
+        for name in ("ann", "bob", "cleo", "dan")]
+    for thread in threads:
+        thread.start()
+    assert started.wait(5)
+    time.sleep(0.1)  # let the other misses reach the in-flight slot
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert calls == ["Beginner"]
+    assert sorted(results) == [("Ciao!", False)] + [("Ciao!", True)] * 3
@@ -0,0 +1,44 @@
+import pytest
+
+from logic import config_manager, tip_digest
+from logic.mail_queue import Outbox
+
+
+class FakeTipCache:
+    def get_slot(self, slot, language, level, generate):
+        return f"{language} {level} tip", False
+
+
+def test_rerun_after_crash_does_not_mail_twice(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_manager, "USERS_DIR", tmp_path / "users")
+    monkeypatch.setattr(tip_digest, "DIGEST_DIR", tmp_path / "digests")
+    monkeypatch.setattr(tip_digest, "get_tip_cache", FakeTipCache)
+    monkeypatch.setattr(tip_digest, "FANOUT_BATCH", 2)
+    for i in range(5):
+        config_manager.save_user_config(f"user{i}", {"email": f"u{i}@example.com",
+                                                      "language": "Italian", "level": "Beginner"})
+    config_manager.save_user_config("nomail", {"language": "Italian"})
+    groups = tip_digest.group_recipients()
+    assert list(groups) == [("Italian", "Beginner")] and len(groups[("Italian", "Beginner")]) == 5
+
+    outbox = Outbox(tmp_path / "outbox.sqlite3")
+    log = tip_digest.DigestLog("2026-01-05")
+    recipients = groups[("Italian", "Beginner")]
+
+    def killed(*args):
+        raise RuntimeError("killed")
+
+    # Crash after queueing, before the group is recorded as done
+    monkeypatch.setattr(log, "record", killed)
+    with pytest.raises(RuntimeError):
+        tip_digest._send_group(None, outbox, log, "Italian", "Beginner", recipients, dry_run=False)
+    monkeypatch.delattr(log, "record")
+    assert not log.done("Italian", "Beginner")
+
+    # The rerun queues nothing new but records the group
+    assert tip_digest._send_group(None, outbox, log, "Italian", "Beginner", recipients, dry_run=False) == 0
+    assert outbox.counts() == {"pending": 5} and log.done("Italian", "Beginner")
+    # Another day is another digest
+    other_day = tip_digest.DigestLog("2026-01-06")
+    assert tip_digest._send_group(None, outbox, other_day, "Italian", "Beginner", recipients,
+                                  dry_run=False) == 5
@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+
+from logic.tracing import Tracer, NOOP_SPAN
+
+
+class ListExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, payload):
+        for resource in payload["resourceSpans"]:
+            for scope in resource["scopeSpans"]:
+                self.spans.extend(scope["spans"])
+
+
+def test_spans_follow_threads_and_handoffs_into_one_trace():
+    exporter = ListExporter()
+    tracer = Tracer([exporter])
+
+    root = tracer.start_flow("quiz", "ui.quiz_requested")
+    with tracer.use_span(root):
+        with tracer.span("AppController.start_quiz"):
+            def worker():
+                with tracer.span("LanguageProcessor.prepare_quiz_data"):
+                    with pytest.raises(ValueError):
+                        with tracer.span("output.parse"):
+                            raise ValueError("bad json")
+                tracer.handoff("ready", "qt.signal ready")
+            thread = threading.Thread(target=tracer.wrap(worker))
+            thread.start()
+            thread.join()
+    tracer.take_handoff("ready")
+    with tracer.span("QuizScreen.start_quiz", parent=tracer.flow("quiz")):
+        pass
+    tracer.end_flow("quiz")
+    tracer.flush()
+
+    spans = {s["name"]: s for s in exporter.spans}
+    assert len(spans) == 6
+    assert len({s["traceId"] for s in spans.values()}) == 1
+    root_id = spans["ui.quiz_requested"]["spanId"]
+    assert "parentSpanId" not in spans["ui.quiz_requested"]
+    assert spans["LanguageProcessor.prepare_quiz_data"]["parentSpanId"] == \
+        spans["AppController.start_quiz"]["spanId"]
+    assert spans["QuizScreen.start_quiz"]["parentSpanId"] == root_id
+    assert spans["output.parse"]["status"]["code"] == 2
+    assert int(spans["ui.quiz_requested"]["endTimeUnixNano"]) >= \
+        int(spans["QuizScreen.start_quiz"]["endTimeUnixNano"])
+
+
+def test_disabled_tracer_is_a_noop():
+    tracer = Tracer()
+    with tracer.span("anything") as span:
+        assert span is NOOP_SPAN
+    assert tracer.start_flow("quiz", "root") is NOOP_SPAN
+    assert tracer.take_handoff("missing") is None
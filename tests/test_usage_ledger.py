@@ -0,0 +1,73 @@
+import pytest
+
+from logic.language_processor import LanguageProcessor
+from logic.quiz_queue import QuizQueue
+from logic.usage_ledger import CACHED_ONLY, FALLBACK, FULL, BudgetExceeded, UsageLedger, cost_usd
+
+
+def test_record_and_report(tmp_path):
+    ledger = UsageLedger(tmp_path / "usage.sqlite3", user_daily_tokens=0, daily_tokens=0)
+    day = "2026-01-05"
+    ledger.record("anna", "quiz_agent", "groq/llama-3.3-70b-versatile", 1000, 500, 2, day=day)
+    ledger.record("anna", "quiz_agent", "groq/llama-3.3-70b-versatile", 1000, 500, 1, day=day)
+    ledger.record("ben", "tip_agent", "groq/some-new-model", 200, 50, 1, day=day)
+
+    report = ledger.report(day, day, by="user")
+    anna = report["groups"][0]
+    assert anna["user"] == "anna" and anna["calls"] == 2 and anna["requests"] == 3
+    assert anna["cost_usd"] == round(2 * cost_usd("llama-3.3-70b-versatile", 1000, 500), 6)
+    assert report["total"]["prompt_tokens"] == 2200
+    assert report["unpriced_models"] == ["some-new-model"]
+    assert [g["agent"] for g in ledger.report(day, day, by="agent")["groups"]] == [
+        "quiz_agent", "tip_agent"]
+
+
+def test_budget_tiers(tmp_path):
+    ledger = UsageLedger(tmp_path / "usage.sqlite3", user_daily_tokens=100,
+                         user_hard_tokens=200, daily_tokens=1000)
+    day = "2026-01-05"
+    assert ledger.budget_tier("anna", day) == FULL
+    ledger.record("anna", "quiz_agent", "m", 100, 0, day=day)
+    assert ledger.budget_tier("anna", day) == FALLBACK
+    ledger.record("anna", "quiz_agent", "m", 100, 0, day=day)
+    assert ledger.budget_tier("anna", day) == CACHED_ONLY
+    assert ledger.budget_tier(None, day) == FULL  # batch jobs are never throttled
+
+    # Last 20% of the global budget: heavy users get cache only, light users the small model
+    ledger.record("ben", "quiz_agent", "m", 90, 0, day=day)
+    ledger.record("", "tip_agent", "m", 500, 0, day=day)
+    ledger.record("carl", "quiz_agent", "m", 150, 0, day=day)
+    assert ledger.budget_tier("ben", day) == FALLBACK
+    assert ledger.budget_tier("carl", day) == CACHED_ONLY
+
+
+def test_processor_degrades_with_the_budget(processor, crew_env, tmp_path):
+    ledger = processor.ledger
+    ledger.user_daily_tokens, ledger.user_hard_tokens, ledger.daily_tokens = 1000, 2000, 0
+    crew = processor.language_crew
+    fallback_model = "groq/" + crew.agents_config["quiz_agent"]["fallback_model_name"]
+
+    assert processor._select_agent(crew.quiz_task(), "ann")[1].llm.model != fallback_model
+    ledger.record("ann", "quiz_agent", "groq/llama-3.3-70b-versatile", 900, 300)
+    name, agent = processor._select_agent(crew.quiz_task(), "ann")
+    assert name == "quiz_agent" and agent.llm.model == fallback_model
+    ledger.record("ann", "quiz_agent", fallback_model, 900, 300)
+    with pytest.raises(BudgetExceeded):
+        processor._select_agent(crew.quiz_task(), "ann")
+
+    # Past the hard budget: the last quiz generated for the group, no LLM call...
+    quiz = [{"question": "Il ____ dorme.", "options": ["gatto", "cane"], "answer": "gatto"}]
+    processor.prepare_quiz_batch = lambda *args, **kwargs: [quiz]
+    assert processor.prepare_quiz_data("Beginner", "Italian", 1, username="ben") == quiz
+    del processor.prepare_quiz_batch
+    served = processor.prepare_quiz_data("Beginner", "Italian", 1, username="ann")
+    assert served == quiz
+    served[0]["answer"] = "cane"  # a copy: the stored quiz is unchanged
+    # ...also from another process, after a restart
+    processor.quiz_queue = QuizQueue(tmp_path / "queue.sqlite3")
+    assert processor.prepare_quiz_data("Beginner", "Italian", 1, username="ann") == quiz
+    # Nothing generated yet for the group: BudgetExceeded (the service answers 429)
+    with pytest.raises(BudgetExceeded):
+        processor.prepare_detect_quiz("Beginner", "Italian", username="ann")
+    with pytest.raises(BudgetExceeded):
+        processor.generate_daily_tip("Beginner", "Italian", username="ann")
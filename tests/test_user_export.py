@@ -0,0 +1,52 @@
+import json
+import os
+
+from logic import config_manager, user_export
+from logic.config_manager import append_attempt_history, load_attempt_history, load_user_config
+
+
+def _users(tmp_path, monkeypatch, name):
+    monkeypatch.setattr(config_manager, "USERS_DIR", tmp_path / name)
+
+
+def test_export_import_round_trip(tmp_path, monkeypatch, capsys):
+    _users(tmp_path, monkeypatch, "source")
+    profiles = {"Anna Bianchi": {"email": "a@example.com", "language": "Italian", "progress": 120,
+                                 "level": "Intermediate", "theme": "dark"},
+                "ben": {"email": "b@example.com", "language": "Spanish", "progress": 0}}
+    for name, profile in profiles.items():
+        config_manager.save_user_config(name, profile)
+    append_attempt_history("Anna Bianchi", {"ts": 1.5, "kind": "quiz", "correct": 4, "total": 5})
+    with open(config_manager.get_history_path("Anna Bianchi"), "a") as f:
+        f.write('{"ts": 2.0, "kind"\n')  # one unreadable line must not drop the user
+
+    dump = str(tmp_path / "users.jsonl.gz")
+    assert user_export.export_users(dump, workers=2) == 2
+    assert "skipped 1 unreadable history line" in capsys.readouterr().err
+
+    _users(tmp_path, monkeypatch, "target")
+    assert user_export.import_users(dump, workers=2) == (2, 0)
+    for name, profile in profiles.items():
+        assert load_user_config(name) == {"username": name, **profile}
+    assert load_attempt_history("Anna Bianchi") == [{"ts": 1.5, "kind": "quiz", "correct": 4, "total": 5}]
+    assert load_attempt_history("ben") == []
+    # Importing again without --overwrite keeps the existing users
+    assert user_export.import_users(dump, workers=2) == (0, 2)
+
+
+def test_duplicate_names_and_write_errors_are_reported(tmp_path, monkeypatch):
+    _users(tmp_path, monkeypatch, "users")
+    record = {"username": "ann", "profile": {"email": "a@example.com"}, "history": []}
+    source = tmp_path / "dupes.jsonl"
+    source.write_text("\n".join(json.dumps({**record, "profile": {"progress": i}}) for i in range(8)))
+    assert user_export.import_users(str(source), workers=8) == (1, 7)
+
+    def broken_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(user_export.os, "replace", broken_replace)
+    line_no, errors = user_export._write_user((3, json.dumps({**record, "username": "bob"})),
+                                              overwrite=False, dry_run=False)
+    assert line_no == 3 and errors == ["could not write history: disk full"]
+    assert not config_manager.get_config_path("bob").exists()
+    assert not [p for p in (tmp_path / "users").rglob("*.tmp")]